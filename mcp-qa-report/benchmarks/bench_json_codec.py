@@ -0,0 +1,89 @@
+"""
+Micro-benchmark of the JSON codecs on realistic MCP payloads.
+
+Usage (from mcp-qa-report/):
+    uv run python benchmarks/bench_json_codec.py
+    uv run --extra fast python benchmarks/bench_json_codec.py   # with orjson
+
+Prints encode/decode throughput per payload for every installed backend, and the
+speed-up over the stdlib `json` module.
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from infrastructure.json_codec import available_codecs  # noqa: E402
+
+
+def _tool(i: int) -> dict:
+    return {
+        "name": f"search_repository_{i}",
+        "description": "Searches the repository for files matching a query and returns ranked snippets. " * 3,
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Free-text query"},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 20},
+                "paths": {"type": "array", "items": {"type": "string"}},
+                "case_sensitive": {"type": "boolean", "default": False},
+            },
+            "required": ["query"],
+        },
+    }
+
+
+PAYLOADS = {
+    "tools/call request": {
+        "jsonrpc": "2.0", "id": 42, "method": "tools/call",
+        "params": {"name": "ping", "arguments": {}},
+    },
+    "initialize response": {
+        "jsonrpc": "2.0", "id": 1,
+        "result": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {"listChanged": False}, "logging": {}, "prompts": {"listChanged": False}},
+            "serverInfo": {"name": "example-server", "version": "1.4.2"},
+        },
+    },
+    "tools/list, 50 tools": {"jsonrpc": "2.0", "id": 2, "result": {"tools": [_tool(i) for i in range(50)]}},
+    "tools/list, 2000 tools": {"jsonrpc": "2.0", "id": 3, "result": {"tools": [_tool(i) for i in range(2000)]}},
+    "tools/call result, 64 KiB text": {
+        "jsonrpc": "2.0", "id": 4,
+        "result": {"content": [{"type": "text", "text": "line of tool output ✓\n" * 2900}], "isError": False},
+    },
+}
+
+
+def _rate(fn, min_time: float = 0.2) -> float:
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    while elapsed < min_time:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return number / elapsed
+
+
+def main() -> None:
+    # stdlib first: it is the baseline for the speed-up column
+    codecs = sorted(available_codecs(), key=lambda c: c.name != "json")
+    print(f"codecs: {', '.join(c.name for c in codecs)}\n")
+    header = f"{'payload':<32} {'size':>10} {'codec':<8} {'encode/s':>12} {'decode/s':>12} {'vs json':>14}"
+    print(header)
+    print("-" * len(header))
+    for label, payload in PAYLOADS.items():
+        baseline = None
+        for codec in codecs:
+            raw = codec.dumps(payload)
+            enc = _rate(lambda: codec.dumps(payload))
+            dec = _rate(lambda: codec.loads(raw))
+            if codec.name == "json":
+                baseline = (enc, dec)
+            speedup = "" if codec.name == "json" else f"{enc / baseline[0]:.1f}x / {dec / baseline[1]:.1f}x"
+            print(f"{label:<32} {len(raw):>10,} {codec.name:<8} {enc:>12,.0f} {dec:>12,.0f} {speedup:>14}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
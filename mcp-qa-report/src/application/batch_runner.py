@@ -0,0 +1,130 @@
+"""
+Runs QA checks over many projects with bounded concurrency.
+
+Projects come from an explicit list and/or a glob under a root directory and are
+consumed lazily by a fixed set of workers. All projects share one BoundedRunnerFactory,
+so the number of live target servers never exceeds max_processes. Per-project reports
+are yielded as soon as they finish, and only running totals are kept, so memory stays
+flat as the project count grows.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+from application.execution_context import ExecutionContext
+from application.qa_runner import QARunner
+from domain.models import CheckResult, CheckStatus
+from infrastructure.detect_mcp import detect_mcp_command_async
+from infrastructure.runner_factory import BoundedRunnerFactory, RunnerFactory, SharedSessionFactory
+
+# A project holds its shared session plus at most one isolated process at a time
+PROCESSES_PER_PROJECT = 2
+
+
+@dataclass
+class ProjectReport:
+    project_path: str
+    results: list[CheckResult]
+    error: str | None = None
+
+    @property
+    def status(self) -> CheckStatus:
+        if self.error is not None or any(r.status == CheckStatus.FAIL for r in self.results):
+            return CheckStatus.FAIL
+        if any(r.status == CheckStatus.WARN for r in self.results):
+            return CheckStatus.WARN
+        return CheckStatus.PASS
+
+
+@dataclass
+class BatchSummary:
+    projects: int = 0
+    passed: int = 0
+    warned: int = 0
+    failed: int = 0
+    failed_projects: list[str] = field(default_factory=list)
+
+    def add(self, report: ProjectReport) -> None:
+        self.projects += 1
+        status = report.status
+        if status == CheckStatus.PASS:
+            self.passed += 1
+        elif status == CheckStatus.WARN:
+            self.warned += 1
+        else:
+            self.failed += 1
+            self.failed_projects.append(report.project_path)
+
+
+def iter_projects(
+    project_paths: Iterable[str] | None = None,
+    root: str | None = None,
+    pattern: str = "*",
+    exclude: Iterable[str] = (),
+) -> Iterator[str]:
+    """
+    Yields explicit project paths, then directories under root matching pattern (lazily).
+    Hidden directories (.git, .qa-report, ...) and the excluded paths are skipped.
+    """
+    for p in project_paths or ():
+        yield p
+    if root is not None:
+        skip = {Path(e).resolve() for e in exclude}
+        for p in Path(root).glob(pattern):
+            if p.name.startswith(".") or not p.is_dir() or p.resolve() in skip:
+                continue
+            yield str(p)
+
+
+class BatchRunner:
+    """Runs one QARunner per project under a global cap on live target servers."""
+    def __init__(
+        self,
+        build_runner: Callable[[], QARunner],
+        base_factory: RunnerFactory,
+        max_processes: int = 8,
+        command: list[str] | None = None,
+    ):
+        if max_processes < PROCESSES_PER_PROJECT:
+            raise ValueError(f"max_processes must be >= {PROCESSES_PER_PROJECT}")
+        self._build_runner = build_runner
+        self._factory = BoundedRunnerFactory(base_factory, max_live=max_processes)
+        self._workers = max(1, max_processes // PROCESSES_PER_PROJECT)
+        self._command = command
+
+    async def run(self, projects: Iterable[str]) -> AsyncIterator[ProjectReport]:
+        source = iter(projects)
+        queue: asyncio.Queue[ProjectReport | None] = asyncio.Queue(maxsize=self._workers)
+
+        async def worker() -> None:
+            # _run_project never raises; workers are only cancelled once the consumer is gone
+            for project in source:
+                await queue.put(await self._run_project(project))
+            await queue.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self._workers)]
+        remaining = len(workers)
+        try:
+            while remaining:
+                report = await queue.get()
+                if report is None:
+                    remaining -= 1
+                    continue
+                yield report
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_project(self, project_path: str) -> ProjectReport:
+        try:
+            command = self._command or await detect_mcp_command_async(project_path)
+            async with SharedSessionFactory(base=self._factory) as factory:
+                ctx = ExecutionContext(project_path=project_path, command=command, runner_factory=factory)
+                results = await self._build_runner().run(ctx)
+            return ProjectReport(project_path=project_path, results=results)
+        except Exception as e:
+            return ProjectReport(project_path=project_path, results=[], error=f"{type(e).__name__}: {e}")
@@ -2,36 +2,271 @@
 Dependency wiring (composition root).
 
 Builds the list of checks, stop policy (fail-fast vs run-all),
-and the reporter implementation used by the qa_report tool.
+the runner factory (one shared server session per run, optionally served
+from a process-wide warm pool), and the reporter implementation used by the qa_report tool.
 """
-from application.qa_runner import QARunner
+import json
+import logging
+import os
+
+from application.qa_runner import QARunner, SubprocessBudget
+from application.batch_runner import BatchRunner
+from application.execution_context import ExecutionContext
+from application.watch import ProjectWatcher
 from application.policies import FailFastPolicy, RunAllPolicy
 
-from infrastructure.checks.process_checks import MCPServerStartupCheck
+from infrastructure.checks.process_checks import MCPServerStartupCheck, StartupLatencyBenchmarkCheck
 from infrastructure.checks.stdio_checks import STDIOIntegrityCheck
 from infrastructure.checks.tool_checks import ToolsRegistrationCheck
 from infrastructure.checks.tool_quality_checks import ToolDescriptionQualityCheck
 from infrastructure.reporters.text_reporter import TextReporter
 from infrastructure.checks.invocation_checks import ToolInvocationCheck
+from infrastructure.checks.load_checks import ConcurrencySweepCheck, OpenLoopLoadCheck
+from infrastructure.checks.soak_checks import SoakCheck
+from infrastructure.runner_factory import RunnerFactory, SharedSessionFactory
+from infrastructure.forked_runner import ForkedRunnerFactory
+from infrastructure.interpreter_resolver import InterpreterResolver
+from infrastructure.warm_pool import WarmPoolRunnerFactory
+from infrastructure.result_cache import ResultCache
+from infrastructure.rlimits import ResourceLimits, limits_supported
+from infrastructure.transcript import TranscriptRecorder
 from domain.ports import Reporter
 
+log = logging.getLogger(__name__)
+
+
 def build_checks():
-    return [
+    checks = [
         MCPServerStartupCheck(),
         STDIOIntegrityCheck(),
         ToolsRegistrationCheck(),
         ToolDescriptionQualityCheck(),
         ToolInvocationCheck(),
     ]
+    optional = (build_startup_benchmark(), build_concurrency_sweep(), build_open_loop_load(), build_soak())
+    checks.extend(c for c in optional if c is not None)
+    return checks
+
+
+def build_startup_benchmark() -> StartupLatencyBenchmarkCheck | None:
+    """Opt-in startup latency benchmark, enabled by QA_STARTUP_BENCH_RUNS > 0."""
+    runs = int(os.getenv("QA_STARTUP_BENCH_RUNS", "0") or 0)
+    if runs <= 0:
+        return None
+    return StartupLatencyBenchmarkCheck(
+        runs=runs,
+        parallelism=int(os.getenv("QA_STARTUP_BENCH_PARALLEL", "4") or 4),
+        warn_ms=float(os.getenv("QA_STARTUP_BENCH_WARN_MS", "2000") or 2000),
+        fail_ms=float(os.getenv("QA_STARTUP_BENCH_FAIL_MS", "10000") or 10000),
+    )
+
+
+def _load_tool() -> tuple[str, dict]:
+    """Safe tool the load checks call (QA_LOAD_TOOL, arguments as JSON in QA_LOAD_TOOL_ARGS)."""
+    tool = os.getenv("QA_LOAD_TOOL", "ping") or "ping"
+    args = os.getenv("QA_LOAD_TOOL_ARGS", "")
+    try:
+        arguments = json.loads(args) if args else {}
+    except ValueError:
+        arguments = None
+    if not isinstance(arguments, dict):
+        # A typo in one env var must not take the whole qa_report call down
+        log.warning("QA_LOAD_TOOL_ARGS is not a JSON object (%r); calling %s without arguments", args, tool)
+        arguments = {}
+    return tool, arguments
+
+
+def build_concurrency_sweep() -> ConcurrencySweepCheck | None:
+    """Opt-in tools/call concurrency sweep, enabled by QA_LOAD_MAX_CONCURRENCY > 0."""
+    max_concurrency = int(os.getenv("QA_LOAD_MAX_CONCURRENCY", "0") or 0)
+    if max_concurrency <= 0:
+        return None
+    tool, arguments = _load_tool()
+    return ConcurrencySweepCheck(
+        max_concurrency=max_concurrency,
+        requests_per_level=int(os.getenv("QA_LOAD_REQUESTS_PER_LEVEL", "200") or 200),
+        tool=tool,
+        arguments=arguments,
+    )
+
+
+def build_open_loop_load() -> OpenLoopLoadCheck | None:
+    """Opt-in constant-rate tools/call load test, enabled by QA_LOAD_RATE_RPS > 0."""
+    rate = float(os.getenv("QA_LOAD_RATE_RPS", "0") or 0)
+    if rate <= 0:
+        return None
+    tool, arguments = _load_tool()
+    return OpenLoopLoadCheck(
+        rate_rps=rate,
+        duration_sec=float(os.getenv("QA_LOAD_DURATION_SEC", "10") or 10),
+        p99_warn_ms=float(os.getenv("QA_LOAD_P99_WARN_MS", "100") or 100),
+        p99_fail_ms=float(os.getenv("QA_LOAD_P99_FAIL_MS", "1000") or 1000),
+        tool=tool,
+        arguments=arguments,
+    )
+
+
+def build_soak() -> SoakCheck | None:
+    """Opt-in soak/leak test, enabled by QA_SOAK_DURATION_SEC > 0."""
+    duration = float(os.getenv("QA_SOAK_DURATION_SEC", "0") or 0)
+    if duration <= 0:
+        return None
+    tool, arguments = _load_tool()
+    return SoakCheck(
+        duration_sec=duration,
+        rate_rps=float(os.getenv("QA_SOAK_RATE_RPS", "20") or 20),
+        rss_warn_mb_per_min=float(os.getenv("QA_SOAK_RSS_WARN_MB_PER_MIN", "1") or 1),
+        rss_fail_mb_per_min=float(os.getenv("QA_SOAK_RSS_FAIL_MB_PER_MIN", "10") or 10),
+        fd_warn_per_min=float(os.getenv("QA_SOAK_FD_WARN_PER_MIN", "1") or 1),
+        fd_fail_per_min=float(os.getenv("QA_SOAK_FD_FAIL_PER_MIN", "10") or 10),
+        tool=tool,
+        arguments=arguments,
+    )
 
 
 def build_policy(fail_fast: bool) :
     return FailFastPolicy() if fail_fast else RunAllPolicy()
 
 
+_warm_pool: WarmPoolRunnerFactory | None = None
+_resolver: InterpreterResolver | None = None
+_transcripts: TranscriptRecorder | None = None
+
+
+def get_interpreter_resolver() -> InterpreterResolver | None:
+    """Process-wide `uv run python` resolver, enabled by QA_RESOLVE_INTERPRETER=1."""
+    global _resolver
+    if os.getenv("QA_RESOLVE_INTERPRETER", "0") != "1":
+        return None
+    if _resolver is None:
+        _resolver = InterpreterResolver()
+    return _resolver
+
+
+def get_transcript_recorder() -> TranscriptRecorder | None:
+    """Process-wide wire transcript writer (<project>/.qa-report/transcripts), enabled by QA_TRANSCRIPTS=1."""
+    global _transcripts
+    if os.getenv("QA_TRANSCRIPTS", "0") != "1":
+        return None
+    if _transcripts is None:
+        _transcripts = TranscriptRecorder()
+    return _transcripts
+
+
+def build_base_factory() -> RunnerFactory:
+    # QA_MAX_MESSAGE_MB bounds a single JSON-RPC message read from a target server
+    max_mb = float(os.getenv("QA_MAX_MESSAGE_MB", "64") or 64)
+    # QA_FORK_SERVERS=1 forks Python targets run by our own interpreter instead of spawning them
+    factory = ForkedRunnerFactory if os.getenv("QA_FORK_SERVERS", "0") == "1" else RunnerFactory
+    return factory(
+        resolver=get_interpreter_resolver(),
+        max_message_bytes=int(max_mb * 1024 * 1024),
+        term_grace_sec=float(os.getenv("QA_TERM_GRACE_SEC", "1") or 1),
+        kill_grace_sec=float(os.getenv("QA_KILL_GRACE_SEC", "1") or 1),
+        limits=build_limits(),
+        transcripts=get_transcript_recorder(),
+    )
+
+
+def build_limits() -> ResourceLimits | None:
+    """Per-server rlimits from QA_LIMIT_AS_MB / _CPU_SEC / _OPEN_FILES / _PROCESSES (0 or unset: no cap)."""
+    def limit(name: str) -> int | None:
+        value = int(os.getenv(name, "0") or 0)
+        return value if value > 0 else None
+
+    address_space_mb = limit("QA_LIMIT_AS_MB")
+    limits = ResourceLimits(
+        address_space_bytes=address_space_mb * 2**20 if address_space_mb else None,
+        cpu_sec=limit("QA_LIMIT_CPU_SEC"),
+        open_files=limit("QA_LIMIT_OPEN_FILES"),
+        processes=limit("QA_LIMIT_PROCESSES"),
+    )
+    return limits if limits and limits_supported() else None
+
+
+def get_warm_pool() -> WarmPoolRunnerFactory | None:
+    """Process-wide warm pool, enabled by QA_WARM_POOL_SIZE > 0 (kept alive across qa_report calls)."""
+    global _warm_pool
+    size = int(os.getenv("QA_WARM_POOL_SIZE", "0") or 0)
+    if size <= 0:
+        return None
+    if _warm_pool is None:
+        ttl = float(os.getenv("QA_WARM_POOL_TTL_SEC", "300") or 300)
+        _warm_pool = WarmPoolRunnerFactory(size=size, idle_ttl_sec=ttl, base=build_base_factory())
+    return _warm_pool
+
+
+def build_runner_factory() -> SharedSessionFactory:
+    return SharedSessionFactory(base=get_warm_pool() or build_base_factory())
+
+
+def build_result_cache(project_path: str) -> ResultCache | None:
+    """On-disk result cache under <project>/.qa-report/cache; disable with QA_RESULT_CACHE=0."""
+    if os.getenv("QA_RESULT_CACHE", "1") == "0":
+        return None
+    return ResultCache(project_path)
+
+
+def build_cache_settings() -> dict:
+    """Env-driven run settings that can change a verdict without touching the project or the checks."""
+    limits = build_limits()
+    return {
+        "timeout_sec": ExecutionContext.timeout_sec,
+        "max_message_mb": os.getenv("QA_MAX_MESSAGE_MB", "64"),
+        "fork_servers": os.getenv("QA_FORK_SERVERS", "0"),
+        "resolve_interpreter": os.getenv("QA_RESOLVE_INTERPRETER", "0"),
+        "limits": limits.describe() if limits else None,
+    }
+
+
 def build_reporter() -> Reporter:
     return TextReporter()
 
 
+_budget: SubprocessBudget | None = None
+
+
+def get_subprocess_budget() -> SubprocessBudget:
+    """Process-wide cap on subprocess-starting checks (QA_MAX_SUBPROCESSES, default 2x CPUs)."""
+    global _budget
+    if _budget is None:
+        limit = int(os.getenv("QA_MAX_SUBPROCESSES", "0") or 0) or 2 * (os.cpu_count() or 2)
+        _budget = SubprocessBudget(limit)
+    return _budget
+
+
 def build_runner(fail_fast: bool) -> QARunner:
-    return QARunner(build_checks(), build_policy(fail_fast))
+    return QARunner(build_checks(), build_policy(fail_fast), budget=get_subprocess_budget())
+
+
+def build_batch_runner(fail_fast: bool, max_processes: int, command: list[str] | None = None) -> BatchRunner:
+    # Batches visit many projects once each, so they bypass the warm pool
+    return BatchRunner(
+        build_runner=lambda: build_runner(fail_fast),
+        base_factory=build_base_factory(),
+        max_processes=max_processes,
+        command=command,
+    )
+
+
+def build_watch_pool() -> WarmPoolRunnerFactory:
+    # Watch mode always keeps one server pre-started for the next re-run
+    return WarmPoolRunnerFactory(size=1, base=build_base_factory())
+
+
+def build_watcher(
+    project_path: str,
+    factory: WarmPoolRunnerFactory,
+    command: list[str] | None = None,
+    fail_fast: bool = False,
+    poll_interval_sec: float = 0.5,
+) -> ProjectWatcher:
+    return ProjectWatcher(
+        project_path=project_path,
+        checks=build_checks(),
+        policy=build_policy(fail_fast),
+        factory=factory,
+        command=command,
+        budget=get_subprocess_budget(),
+        poll_interval_sec=poll_interval_sec,
+    )
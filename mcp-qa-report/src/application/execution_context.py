@@ -1,11 +1,13 @@
 """
 Execution context passed through all checks.
 
-Holds target project_path, optional explicit start command,
-timeout, and optional RunnerFactory override (useful for tests).
+Holds target project_path, the start command (explicit, or detected once per run
+by the caller), timeout, optional RunnerFactory override (useful for tests),
+and the per-run ArtifactStore through which checks hand results downstream.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from domain.models import ArtifactStore
 from infrastructure.runner_factory import RunnerFactory
 
 @dataclass(frozen=True)
@@ -14,4 +16,5 @@ class ExecutionContext:
     command: list[str] | None = None
     timeout_sec: int = 5
     runner_factory: RunnerFactory | None = None
+    artifacts: ArtifactStore = field(default_factory=ArtifactStore)
 
@@ -1,41 +1,238 @@
 """
 Orchestrates executing QA checks asynchronously.
 
-Runs checks concurrently using asyncio.gather,
-collects CheckResult items, and respects a StopPolicy (fail-fast or run-all).
+Checks form a dependency graph: a check that `requires` an artifact waits for the
+checks that `produce` it (they hand it over through ctx.artifacts), and is SKIPPED
+right away if one of them did not succeed. Gating checks additionally run before
+all non-gating ones. Ready checks start in order of declared CheckCost (fewest
+subprocesses, then lowest latency) and run concurrently, each first reserving its
+subprocesses from an optional SubprocessBudget shared across runners (e.g. batch
+projects). Results are collected as they finish and a StopPolicy (fail-fast or
+run-all) decides whether to cancel the remainder; checks not yet started never start.
+Every executed check's result carries a CheckTiming (wall, spawn, per-RPC latency).
+An optional on_result callback sees each result the moment it is known (streaming).
 """
 import asyncio
-from typing import Iterable
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Iterable
 from domain.ports import QACheck, StopPolicy
-from domain.models import CheckResult
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, CheckTiming, DEFAULT_CHECK_COST
+from infrastructure.timing import bind_timing, bind_usage, total_usage
+
+log = logging.getLogger(__name__)
+
+ResultCallback = Callable[[CheckResult], Awaitable[None] | None]
+
+
+def check_cost(check: QACheck) -> CheckCost:
+    return getattr(check, "cost", None) or DEFAULT_CHECK_COST
+
+
+def _requires(check: QACheck) -> tuple[Artifact, ...]:
+    return tuple(getattr(check, "requires", ()) or ())
+
+
+def _produces(check: QACheck) -> tuple[Artifact, ...]:
+    return tuple(getattr(check, "produces", ()) or ())
+
+
+def _priority(check: QACheck) -> tuple:
+    cost = check_cost(check)
+    return (not cost.gating, cost.subprocesses, cost.latency_ms)
+
+
+class SubprocessBudget:
+    """FIFO weighted semaphore over the number of live target subprocesses."""
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        self._limit = limit
+        self._used = 0
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+
+    @property
+    def in_use(self) -> int:
+        return self._used
+
+    @asynccontextmanager
+    async def reserve(self, amount: int) -> AsyncIterator[None]:
+        # A single check may never need more than the whole budget
+        amount = min(max(amount, 0), self._limit)
+        if amount == 0:
+            yield
+            return
+
+        await self._acquire(amount)
+        try:
+            yield
+        finally:
+            self._used -= amount
+            self._wake()
+
+    async def _acquire(self, amount: int) -> None:
+        if not self._waiters and self._used + amount <= self._limit:
+            self._used += amount
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (amount, future)
+        self._waiters.append(entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+            elif future.done() and not future.cancelled():
+                # Granted just as we were cancelled: give the reservation back
+                self._used -= amount
+            self._wake()
+            raise
+
+    def _wake(self) -> None:
+        while self._waiters:
+            amount, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if self._used + amount > self._limit:
+                break
+            self._waiters.popleft()
+            self._used += amount
+            future.set_result(None)
+
 
 class QARunner:
-    """Executes a sequence of QACheck instances concurrently under a StopPolicy.""" 
-    def __init__(self, checks: Iterable[QACheck], policy: StopPolicy):
-        self._checks = list(checks)
+    """Executes a dependency graph of QACheck instances under a StopPolicy and a SubprocessBudget."""
+    def __init__(self, checks: Iterable[QACheck], policy: StopPolicy, budget: SubprocessBudget | None = None):
+        self._checks = sorted(checks, key=_priority)
         self._policy = policy
+        self._budget = budget
+        self._deps, self._after = self._build_graph(self._checks)
+
+    @property
+    def check_count(self) -> int:
+        return len(self._checks)
+
+    @staticmethod
+    def _build_graph(checks: list[QACheck]) -> tuple[dict[int, dict[int, Artifact]], dict[int, set[int]]]:
+        """
+        deps[i]: checks whose failure skips check i (producer index -> artifact).
+        after[i]: checks that merely have to finish first (gating ordering).
+        Requirements nobody in this run produces are left to the check itself.
+        """
+        producers: dict[Artifact, list[int]] = {}
+        for i, check in enumerate(checks):
+            for artifact in _produces(check):
+                producers.setdefault(artifact, []).append(i)
 
-    async def run(self, ctx) -> list[CheckResult]:
-        # 1. Create tasks for all checks
-        tasks = {asyncio.create_task(check.run(ctx)): check for check in self._checks}
+        gating = {i for i, c in enumerate(checks) if check_cost(c).gating}
+        deps: dict[int, dict[int, Artifact]] = {}
+        after: dict[int, set[int]] = {}
+        for i, check in enumerate(checks):
+            deps[i] = {p: a for a in _requires(check) for p in producers.get(a, ()) if p != i}
+            after[i] = set() if i in gating else set(gating)
+        return deps, after
+
+    async def run(self, ctx, on_result: ResultCallback | None = None) -> list[CheckResult]:
         final_results: list[CheckResult] = []
-        
+
+        async def emit(result: CheckResult) -> None:
+            final_results.append(result)
+            if on_result is None:
+                return
+            try:
+                outcome = on_result(result)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+            except Exception:
+                # A broken listener (e.g. a closed client connection) must not abort the run
+                log.debug("on_result callback failed for %s", result.name, exc_info=True)
+
+        status: dict[int, CheckStatus] = {}
+        pending = list(range(len(self._checks)))
+        running: dict[asyncio.Task, int] = {}
+
         try:
-            # 2. Process results as they finish (Parallel execution)
-            for coro in asyncio.as_completed(tasks.keys()):
-                result = await coro
-                final_results.append(result)
-                
-                # 3. Fail-Fast check: If policy says stop, cancel remaining tasks
-                if self._policy.should_stop(result.status):
-                    for t in tasks.keys():
-                        if not t.done():
-                            t.cancel()
+            while pending or running:
+                # 1. Start every ready check (priority order); skip those whose producers failed
+                for i in list(pending):
+                    state = self._readiness(i, status)
+                    if state is None:
+                        continue
+                    pending.remove(i)
+                    if state is True:
+                        running[asyncio.create_task(self._run_check(self._checks[i], ctx))] = i
+                    else:
+                        status[i] = CheckStatus.SKIP
+                        await emit(CheckResult(self._checks[i].name, CheckStatus.SKIP, state))
+
+                if not running:
+                    # Whatever is left waits on itself (a dependency cycle)
+                    for i in pending:
+                        await emit(CheckResult(self._checks[i].name, CheckStatus.SKIP, "Skipped: dependency cycle"))
                     break
-        except Exception as e:
-            # Handle unexpected errors during execution
-            for t in tasks.keys():
-                t.cancel()
-            raise e
-            
-        return final_results
\ No newline at end of file
+
+                # 2. Process results as they finish (Parallel execution)
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=running.get):
+                    i = running.pop(task)
+                    result = task.result()
+                    status[i] = result.status
+                    await emit(result)
+
+                    # 3. Fail-Fast check: If policy says stop, cancel remaining tasks
+                    if self._policy.should_stop(result.status):
+                        await self._cancel_all(running)
+                        return final_results
+        except BaseException:
+            # Handle unexpected errors (or our own cancellation) during execution
+            await self._cancel_all(running)
+            raise
+
+        return final_results
+
+    @staticmethod
+    async def _cancel_all(running: dict[asyncio.Task, int]) -> None:
+        # Wait for the cancelled checks to leave their sessions, so every server they
+        # started is gone when run() returns; their teardowns overlap instead of queueing
+        tasks = list(running)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _readiness(self, i: int, status: dict[int, CheckStatus]) -> bool | str | None:
+        """True when runnable, a skip message when a producer did not succeed, None to keep waiting."""
+        for p, artifact in self._deps[i].items():
+            if p not in status:
+                return None
+            if status[p] in (CheckStatus.FAIL, CheckStatus.SKIP):
+                return f"Skipped: requires {artifact.value} from '{self._checks[p].name}', which did not succeed"
+        if any(p not in status for p in self._after[i]):
+            return None
+        return True
+
+    async def _run_check(self, check: QACheck, ctx) -> CheckResult:
+        if self._budget is None:
+            return await self._timed(check, ctx)
+        async with self._budget.reserve(check_cost(check).subprocesses):
+            return await self._timed(check, ctx)
+
+    @staticmethod
+    async def _timed(check: QACheck, ctx) -> CheckResult:
+        # Runs in the check's own task, so the bound timing never leaks into siblings
+        with bind_timing(CheckTiming()) as timing, bind_usage() as usages:
+            result = await check.run(ctx)
+        result.timing = timing
+        result.resources = total_usage(usages)
+        if result.resources is not None and result.resources.limits_hit:
+            # Whatever the check concluded, its server was cut off by a configured limit
+            result.status = CheckStatus.FAIL
+            result.message = f"Resource limit hit: {'; '.join(result.resources.limits_hit)}\n{result.message}"
+        elif result.resources is not None and result.resources.limit_notes:
+            # stderr alone does not prove the limit was hit; flag it without failing the check
+            if result.status == CheckStatus.PASS:
+                result.status = CheckStatus.WARN
+            result.message = f"Possible resource limit: {'; '.join(result.resources.limit_notes)}\n{result.message}"
+        return result
@@ -0,0 +1,188 @@
+"""
+Watch mode: re-checks a project incrementally while it is being edited.
+
+The watcher polls a cheap (mtime, size) snapshot of the project tree, waits until
+edits have been quiet for a debounce window, classifies the changed files into
+WatchInput categories and re-runs only the checks whose declared `inputs` intersect
+them; results of the other checks are carried over. A changed start command re-runs
+everything. With a warm pool, stale pre-started servers are discarded as soon as a
+change is seen and a replacement starts during the debounce window, so the re-run
+usually finds a server that is already up.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable
+
+from application.execution_context import ExecutionContext
+from application.qa_runner import QARunner, SubprocessBudget
+from domain.models import CheckResult, WatchInput
+from domain.ports import QACheck, StopPolicy
+from infrastructure.detect_mcp import CONFIG_FILES, detect_mcp_command_async
+from infrastructure.result_cache import CONTENT_HASHED, snapshot_tree
+from infrastructure.runner_factory import RunnerFactory, SharedSessionFactory
+from infrastructure.warm_pool import WarmPoolRunnerFactory
+
+log = logging.getLogger(__name__)
+
+Snapshot = dict[str, tuple[int, int]]
+
+ALL_INPUTS = frozenset(WatchInput)
+_CONFIG_PATHS = frozenset(os.path.normpath(p) for p in CONFIG_FILES)
+
+
+def classify_changes(paths: Iterable[str]) -> frozenset[WatchInput]:
+    """Maps changed relative paths to the input categories they belong to."""
+    kinds = set()
+    for rel in paths:
+        rel = os.path.normpath(rel)
+        if rel in _CONFIG_PATHS or os.path.basename(rel) in CONTENT_HASHED:
+            kinds.add(WatchInput.CONFIG)
+        else:
+            kinds.add(WatchInput.SOURCE)
+    return frozenset(kinds)
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> set[str]:
+    """Relative paths added, removed or modified between two snapshots."""
+    changed = {p for p in before.keys() ^ after.keys()}
+    changed.update(p for p in before.keys() & after.keys() if before[p] != after[p])
+    return changed
+
+
+def check_inputs(check: QACheck) -> frozenset[WatchInput]:
+    return frozenset(getattr(check, "inputs", None) or ALL_INPUTS)
+
+
+@dataclass
+class WatchRun:
+    results: list[CheckResult]
+    changed: set[str]
+    rerun: list[str]
+    duration_sec: float
+
+
+class ProjectWatcher:
+    """Polls a project for changes and re-runs the affected checks, reusing warm servers."""
+    def __init__(
+        self,
+        project_path: str,
+        checks: list[QACheck],
+        policy: StopPolicy,
+        factory: RunnerFactory,
+        command: list[str] | None = None,
+        budget: SubprocessBudget | None = None,
+        timeout_sec: int = 5,
+        poll_interval_sec: float = 0.5,
+        debounce_sec: float = 0.3,
+    ):
+        self._project_path = project_path
+        self._checks = checks
+        self._policy = policy
+        self._factory = factory
+        self._explicit_command = command
+        self._budget = budget
+        self._timeout = timeout_sec
+        self._poll = poll_interval_sec
+        self._debounce = debounce_sec
+
+        self._command: list[str] | None = None
+        self._results: dict[str, CheckResult] = {}
+        self._snapshot: Snapshot | None = None
+
+    def plan(self, kinds: Iterable[WatchInput] | None) -> list[QACheck]:
+        """Checks to re-run for the changed input kinds (None: all of them)."""
+        if kinds is None or not self._results:
+            return list(self._checks)
+        kinds = frozenset(kinds)
+        return [c for c in self._checks if check_inputs(c) & kinds]
+
+    async def run_once(self, changed: set[str] | None = None) -> WatchRun:
+        """Runs the checks affected by `changed` (all of them on the first run) and merges results."""
+        started = time.perf_counter()
+        if self._snapshot is None:
+            self._snapshot = await asyncio.to_thread(snapshot_tree, self._project_path)
+
+        command = self._explicit_command or await detect_mcp_command_async(self._project_path)
+        kinds = None if changed is None or command != self._command else classify_changes(changed)
+        self._command = command
+        checks = self.plan(kinds)
+
+        if checks:
+            async with SharedSessionFactory(base=self._factory) as factory:
+                ctx = ExecutionContext(
+                    project_path=self._project_path,
+                    command=command,
+                    timeout_sec=self._timeout,
+                    runner_factory=factory,
+                )
+                results = await QARunner(checks, self._policy, budget=self._budget).run(ctx)
+            if kinds is None:
+                self._results.clear()
+            # A fail-fast stop leaves some planned checks without a result: drop their stale ones
+            for check in checks:
+                self._results.pop(check.name, None)
+            self._results.update((r.name, r) for r in results)
+
+        ordered = [self._results[c.name] for c in self._checks if c.name in self._results]
+        return WatchRun(
+            results=ordered,
+            changed=changed or set(),
+            rerun=[c.name for c in checks],
+            duration_sec=time.perf_counter() - started,
+        )
+
+    async def wait_for_change(self) -> set[str]:
+        """Blocks until the tree changed and then stayed quiet for the debounce window."""
+        if self._snapshot is None:
+            self._snapshot = await asyncio.to_thread(snapshot_tree, self._project_path)
+        baseline = self._snapshot
+
+        current = baseline
+        while current == baseline:
+            await asyncio.sleep(self._poll)
+            current = await asyncio.to_thread(snapshot_tree, self._project_path)
+        await self._invalidate_warm()
+
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < self._debounce:
+            await asyncio.sleep(min(self._poll, self._debounce))
+            latest = await asyncio.to_thread(snapshot_tree, self._project_path)
+            if latest != current:
+                current = latest
+                quiet_since = time.monotonic()
+                await self._invalidate_warm()
+
+        self._snapshot = current
+        return diff_snapshots(baseline, current)
+
+    async def _invalidate_warm(self) -> None:
+        # Pre-started servers were launched from the old files; replace them while debouncing
+        if not isinstance(self._factory, WarmPoolRunnerFactory):
+            return
+        await self._factory.drain()
+        if self._command is not None:
+            self._factory.prewarm(self._command, self._project_path, self._timeout)
+
+    async def watch(
+        self,
+        on_run: Callable[[WatchRun], Awaitable[None] | None],
+        max_runs: int | None = None,
+    ) -> None:
+        """Runs all checks, then re-runs affected ones after every change until cancelled."""
+        run = await self.run_once()
+        runs = 1
+        while True:
+            outcome = on_run(run)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+            if max_runs is not None and runs >= max_runs:
+                return
+            changed = await self.wait_for_change()
+            log.info("Detected %d changed file(s); re-checking", len(changed))
+            run = await self.run_once(changed)
+            runs += 1
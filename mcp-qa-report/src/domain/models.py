@@ -1,13 +1,127 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 class CheckStatus(str, Enum):
     PASS = "PASS"
     WARN = "WARN"
     FAIL = "FAIL"
+    SKIP = "SKIP"   # not run because a check it depends on failed
+
+@dataclass
+class CheckTiming:
+    """Where a check spent its time (milliseconds). Phases a check did not pay for stay None/empty."""
+    wall_ms: float = 0.0
+    spawn_ms: float | None = None                                 # starting the server process
+    rpc_ms: dict[str, list[float]] = field(default_factory=dict)  # per-method request latencies
+
+    @property
+    def initialize_ms(self) -> float | None:
+        samples = self.rpc_ms.get("initialize")
+        return sum(samples) if samples else None
+
+    def record_rpc(self, method: str, ms: float) -> None:
+        self.rpc_ms.setdefault(method, []).append(ms)
+
+    def phases(self) -> list[tuple[str, float]]:
+        """(phase, ms) pairs: spawn, then total time per RPC method."""
+        out = []
+        if self.spawn_ms is not None:
+            out.append(("spawn", self.spawn_ms))
+        out.extend((method, sum(samples)) for method, samples in self.rpc_ms.items())
+        return out
+
+@dataclass
+class ResourceUsage:
+    """
+    What target server processes used: CPU seconds, context switches and bytes moved
+    through read/write calls summed over each server's process tree, and the peak
+    RSS of the largest server. `shared` marks usage of a server other checks used too;
+    `limits_hit` names resource limits a server ran into, `limit_notes` those only its
+    stderr hints at.
+    """
+    cpu_user_sec: float = 0.0
+    cpu_system_sec: float = 0.0
+    peak_rss_bytes: int = 0
+    voluntary_switches: int = 0
+    involuntary_switches: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+    shared: bool = False
+    limits_hit: tuple[str, ...] = ()
+    limit_notes: tuple[str, ...] = ()
+
+    @property
+    def cpu_sec(self) -> float:
+        return self.cpu_user_sec + self.cpu_system_sec
+
+    def plus(self, other: "ResourceUsage") -> "ResourceUsage":
+        """Usage of two servers together (counters add up, the peak is the larger one)."""
+        return ResourceUsage(
+            cpu_user_sec=self.cpu_user_sec + other.cpu_user_sec,
+            cpu_system_sec=self.cpu_system_sec + other.cpu_system_sec,
+            peak_rss_bytes=max(self.peak_rss_bytes, other.peak_rss_bytes),
+            voluntary_switches=self.voluntary_switches + other.voluntary_switches,
+            involuntary_switches=self.involuntary_switches + other.involuntary_switches,
+            read_bytes=self.read_bytes + other.read_bytes,
+            write_bytes=self.write_bytes + other.write_bytes,
+            shared=self.shared or other.shared,
+            limits_hit=self.limits_hit + tuple(h for h in other.limits_hit if h not in self.limits_hit),
+            limit_notes=self.limit_notes + tuple(n for n in other.limit_notes if n not in self.limit_notes),
+        )
+
+    def since(self, earlier: "ResourceUsage") -> "ResourceUsage":
+        """What the same server used after `earlier` was taken (its peak RSS so far)."""
+        return ResourceUsage(
+            cpu_user_sec=max(0.0, self.cpu_user_sec - earlier.cpu_user_sec),
+            cpu_system_sec=max(0.0, self.cpu_system_sec - earlier.cpu_system_sec),
+            peak_rss_bytes=self.peak_rss_bytes,
+            voluntary_switches=max(0, self.voluntary_switches - earlier.voluntary_switches),
+            involuntary_switches=max(0, self.involuntary_switches - earlier.involuntary_switches),
+            read_bytes=max(0, self.read_bytes - earlier.read_bytes),
+            write_bytes=max(0, self.write_bytes - earlier.write_bytes),
+            shared=self.shared,
+            limits_hit=self.limits_hit,
+            limit_notes=self.limit_notes,
+        )
 
 @dataclass
 class CheckResult:
     name: str
     status: CheckStatus
     message: str
+    timing: CheckTiming | None = None
+    resources: ResourceUsage | None = None
+
+@dataclass(frozen=True)
+class CheckCost:
+    """Scheduling metadata a check may declare (class attribute `cost`)."""
+    subprocesses: int = 1     # server processes the check starts beyond the shared session
+    latency_ms: int = 1000    # typical wall time
+    gating: bool = False      # cheap prerequisite; run first so fail-fast can stop early
+
+DEFAULT_CHECK_COST = CheckCost()
+
+class WatchInput(str, Enum):
+    """Kinds of project files a check depends on (declared via `inputs`; default: all)."""
+    CONFIG = "config"   # MCP config, packaging metadata, lockfiles
+    SOURCE = "source"   # everything else in the project tree
+
+class Artifact(str, Enum):
+    """Values a check can produce for downstream checks (declared via `produces` / `requires`)."""
+    INITIALIZE = "initialize"       # successful initialize response
+    TOOL_CATALOG = "tool_catalog"   # list of tool dicts from tools/list
+
+@dataclass
+class ArtifactStore:
+    """Per-run store of produced artifacts, shared by all checks through the ExecutionContext."""
+    _values: dict[Artifact, Any] = field(default_factory=dict)
+
+    def put(self, artifact: Artifact, value: Any) -> None:
+        self._values[artifact] = value
+
+    def get(self, artifact: Artifact) -> Any:
+        return self._values.get(artifact)
+
+    def __contains__(self, artifact: Artifact) -> bool:
+        return artifact in self._values
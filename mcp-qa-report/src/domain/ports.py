@@ -2,6 +2,12 @@ from typing import Protocol
 from .models import CheckResult, CheckStatus
 
 class QACheck(Protocol):
+    """
+    A single QA check. Checks may also declare (as class attributes) `cost: CheckCost`,
+    `requires` and `produces` (tuples of Artifact) to take part in scheduling,
+    `inputs` (tuple of WatchInput) for incremental re-runs, and `version` (bumped
+    when the check's logic changes, so cached results are invalidated).
+    """
     name: str
     async def run(self, ctx) -> CheckResult: ...
 
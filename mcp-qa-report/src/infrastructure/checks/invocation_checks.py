@@ -1,4 +1,4 @@
-from domain.models import CheckResult, CheckStatus
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, WatchInput
 from infrastructure.detect_mcp import detect_mcp_command
 from infrastructure.runner_factory import RunnerFactory
 import logging
@@ -14,6 +14,9 @@ class ToolInvocationCheck:
     the check degrades gracefully to WARN.
     """    
     name = "MCP tool invocation works (tools/call)"
+    cost = CheckCost(subprocesses=0, latency_ms=200)
+    requires = (Artifact.TOOL_CATALOG,)
+    inputs = (WatchInput.SOURCE,)
 
     async def run(self, ctx) -> CheckResult:
         command = ctx.command or detect_mcp_command(ctx.project_path)
@@ -24,19 +27,21 @@ class ToolInvocationCheck:
 
         try:
             async with factory.create(command, ctx.project_path, ctx.timeout_sec) as s:
-                init = await s.client.initialize()
-                if not init or "result" not in init:
-                    tail = s.runner.stderr_tail
-                    extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
-                    return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
+                tools = ctx.artifacts.get(Artifact.TOOL_CATALOG)
+                if tools is None:
+                    init = await s.client.initialize()
+                    if not init or "result" not in init:
+                        tail = s.runner.stderr_tail
+                        extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+                        return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
 
-                list_resp = await s.client.call("tools/list", request_id=20)
-                if not list_resp or "result" not in list_resp:
-                    tail = s.runner.stderr_tail
-                    extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
-                    return CheckResult(self.name, CheckStatus.FAIL, f"tools/list returned no result{extra}")
+                    list_resp = await s.client.request("tools/list")
+                    if not list_resp or "result" not in list_resp:
+                        tail = s.runner.stderr_tail
+                        extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+                        return CheckResult(self.name, CheckStatus.FAIL, f"tools/list returned no result{extra}")
 
-                tools = list_resp["result"].get("tools", [])
+                    tools = list_resp["result"].get("tools", [])
                 if not tools:
                     return CheckResult(self.name, CheckStatus.FAIL, "No tools registered")
 
@@ -44,11 +49,7 @@ class ToolInvocationCheck:
                 if not has_ping:
                     return CheckResult(self.name, CheckStatus.WARN, "No ping tool; skipping invocation test")
 
-                resp = await s.client.call(
-                    "tools/call",
-                    request_id=30,
-                    params={"name": "ping", "arguments": {}},
-                )
+                resp = await s.client.request("tools/call", {"name": "ping", "arguments": {}})
 
                 if not resp:
                     tail = s.runner.stderr_tail
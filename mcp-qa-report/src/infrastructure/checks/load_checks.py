@@ -0,0 +1,255 @@
+from dataclasses import dataclass
+import asyncio
+import time
+
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, WatchInput
+from infrastructure.detect_mcp import detect_mcp_command
+from infrastructure.errors import JsonRpcTimeoutError
+from infrastructure.load_generator import run_open_loop
+from infrastructure.runner_factory import RunnerFactory
+from infrastructure.stats import LatencySummary
+import logging
+
+log = logging.getLogger(__name__)
+
+# A level "scales" when it adds at least this much throughput over the previous one
+KNEE_MIN_GAIN = 0.10
+# Throughput at the highest level below this share of the peak means the server degrades under load
+COLLAPSE_RATIO = 0.5
+
+
+def concurrency_levels(max_concurrency: int) -> list[int]:
+    """1, 2, 4, ... up to and including max_concurrency."""
+    levels, c = [], 1
+    while c < max_concurrency:
+        levels.append(c)
+        c *= 2
+    levels.append(max(1, max_concurrency))
+    return levels
+
+
+@dataclass(frozen=True)
+class LevelResult:
+    concurrency: int
+    requests: int
+    errors: int
+    rps: float
+    latency: LatencySummary | None
+
+
+def find_knee(levels: list[LevelResult]) -> LevelResult | None:
+    """First level after which adding concurrency stops adding throughput (None: still scaling)."""
+    for current, nxt in zip(levels, levels[1:]):
+        if nxt.rps < current.rps * (1 + KNEE_MIN_GAIN):
+            return current
+    return None
+
+
+class ConcurrencySweepCheck:
+    """
+    Opt-in load test of tools/call over a single session.
+
+    Calls a safe tool (ping by default) closed-loop at concurrency 1, 2, 4, ... up to
+    max_concurrency, recording requests/sec and latency percentiles per level, and
+    reports the knee where throughput stops scaling. Requests are pipelined over one
+    stdio pipe; the client matches responses to requests by id. Errors FAIL the check,
+    throughput collapsing at the highest level WARNs.
+    """
+    name = "tools/call concurrency sweep"
+    requires = (Artifact.TOOL_CATALOG,)
+    inputs = (WatchInput.CONFIG, WatchInput.SOURCE)
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        requests_per_level: int = 200,
+        tool: str = "ping",
+        arguments: dict | None = None,
+    ):
+        self.levels = concurrency_levels(max_concurrency)
+        self.requests_per_level = max(1, requests_per_level)
+        self.tool = tool
+        self.arguments = arguments or {}
+        self.cost = CheckCost(subprocesses=1, latency_ms=1000 * len(self.levels))
+
+    async def run(self, ctx) -> CheckResult:
+        command = ctx.command or detect_mcp_command(ctx.project_path)
+        if not command:
+            return CheckResult(self.name, CheckStatus.FAIL, "Cannot determine MCP start command")
+
+        tools = ctx.artifacts.get(Artifact.TOOL_CATALOG)
+        if tools is not None and not any(t.get("name") == self.tool for t in tools):
+            return CheckResult(self.name, CheckStatus.WARN, f"No '{self.tool}' tool; skipping load test")
+
+        factory = ctx.runner_factory or RunnerFactory()
+
+        try:
+            # Own process: load must not slow down (or crash) the session other checks share
+            async with factory.create(command, ctx.project_path, ctx.timeout_sec, isolated=True) as s:
+                init = await s.client.initialize()
+                if not init or "result" not in init:
+                    tail = s.runner.stderr_tail
+                    extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+                    return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
+
+                results = []
+                for level in self.levels:
+                    result = await self._run_level(s.client, level)
+                    results.append(result)
+                    if result.errors:
+                        tail = s.runner.stderr_tail
+                        extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+                        return CheckResult(
+                            self.name,
+                            CheckStatus.FAIL,
+                            f"{result.errors}/{result.requests} tools/call requests failed at concurrency "
+                            f"{level}; " + self._describe(results) + extra,
+                        )
+
+        except Exception:
+            log.exception("ConcurrencySweepCheck crashed (project=%s, command=%s)", ctx.project_path, command)
+            tail = ""
+            if 's' in locals() and s is not None:
+                tail = s.runner.stderr_tail
+            extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during load test{extra}")
+
+        peak = max(results, key=lambda r: r.rps)
+        knee = find_knee(results)
+        verdict = (
+            f"throughput stops scaling at concurrency {knee.concurrency} (peak {peak.rps:.0f} req/s)"
+            if knee is not None
+            else f"throughput still scaling at concurrency {results[-1].concurrency} ({peak.rps:.0f} req/s)"
+        )
+        status = CheckStatus.PASS
+        if results[-1].rps < peak.rps * COLLAPSE_RATIO:
+            status = CheckStatus.WARN
+            verdict += f"; collapses to {results[-1].rps:.0f} req/s at concurrency {results[-1].concurrency}"
+        return CheckResult(self.name, status, f"{verdict}; " + self._describe(results))
+
+    async def _run_level(self, client, concurrency: int) -> LevelResult:
+        latencies: list[float] = []
+        errors = 0
+        remaining = self.requests_per_level
+        params = {"name": self.tool, "arguments": self.arguments}
+
+        async def worker() -> None:
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    resp = await client.request("tools/call", params)
+                except JsonRpcTimeoutError:
+                    errors += 1
+                    continue
+                if not resp or "result" not in resp or resp["result"].get("isError"):
+                    errors += 1
+                else:
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        return LevelResult(
+            concurrency=concurrency,
+            requests=self.requests_per_level,
+            errors=errors,
+            rps=len(latencies) / elapsed if elapsed > 0 else 0.0,
+            latency=LatencySummary.of(latencies) if latencies else None,
+        )
+
+    @staticmethod
+    def _describe(results: list[LevelResult]) -> str:
+        parts = []
+        for r in results:
+            lat = f", p50 {r.latency.p50:.1f} / p99 {r.latency.p99:.1f} ms" if r.latency else ""
+            parts.append(f"c={r.concurrency}: {r.rps:.0f} req/s{lat}")
+        return "; ".join(parts)
+
+
+class OpenLoopLoadCheck:
+    """
+    Opt-in constant-rate (open-loop) load test of tools/call.
+
+    Sends the load tool at a fixed target rate for a fixed duration on a dedicated
+    session, measuring latency from each request's intended send time (corrected for
+    coordinated omission), and grades p99 against warn/fail thresholds. Any failed or
+    timed-out request FAILs the check.
+    """
+    name = "tools/call open-loop latency"
+    requires = (Artifact.TOOL_CATALOG,)
+    inputs = (WatchInput.CONFIG, WatchInput.SOURCE)
+
+    def __init__(
+        self,
+        rate_rps: float = 50.0,
+        duration_sec: float = 10.0,
+        p99_warn_ms: float = 100.0,
+        p99_fail_ms: float = 1000.0,
+        tool: str = "ping",
+        arguments: dict | None = None,
+    ):
+        self.rate_rps = rate_rps
+        self.duration_sec = duration_sec
+        self.p99_warn_ms = p99_warn_ms
+        self.p99_fail_ms = p99_fail_ms
+        self.tool = tool
+        self.arguments = arguments or {}
+        self.cost = CheckCost(subprocesses=1, latency_ms=int(1000 * duration_sec) + 1000)
+
+    async def run(self, ctx) -> CheckResult:
+        command = ctx.command or detect_mcp_command(ctx.project_path)
+        if not command:
+            return CheckResult(self.name, CheckStatus.FAIL, "Cannot determine MCP start command")
+
+        tools = ctx.artifacts.get(Artifact.TOOL_CATALOG)
+        if tools is not None and not any(t.get("name") == self.tool for t in tools):
+            return CheckResult(self.name, CheckStatus.WARN, f"No '{self.tool}' tool; skipping load test")
+
+        factory = ctx.runner_factory or RunnerFactory()
+
+        try:
+            async with factory.create(command, ctx.project_path, ctx.timeout_sec, isolated=True) as s:
+                init = await s.client.initialize()
+                if not init or "result" not in init:
+                    tail = s.runner.stderr_tail
+                    extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+                    return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
+
+                result = await run_open_loop(
+                    s.client,
+                    "tools/call",
+                    {"name": self.tool, "arguments": self.arguments},
+                    rate_rps=self.rate_rps,
+                    duration_sec=self.duration_sec,
+                )
+                tail = s.runner.stderr_tail
+
+        except Exception:
+            log.exception("OpenLoopLoadCheck crashed (project=%s, command=%s)", ctx.project_path, command)
+            tail = ""
+            if 's' in locals() and s is not None:
+                tail = s.runner.stderr_tail
+            extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during load test{extra}")
+
+        summary = (
+            f"{result.sent} requests at {self.rate_rps:g} req/s target ({result.achieved_rps:.0f} req/s answered, "
+            f"max send lag {result.max_send_lag_ms:.1f} ms); latency {result.histogram.describe()}"
+        )
+        failed = result.errors + result.timeouts
+        if failed:
+            extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+            return CheckResult(
+                self.name,
+                CheckStatus.FAIL,
+                f"{failed}/{result.sent} requests failed ({result.timeouts} timed out); {summary}{extra}",
+            )
+
+        p99 = result.histogram.value_at_percentile(99)
+        if p99 >= self.p99_fail_ms:
+            return CheckResult(self.name, CheckStatus.FAIL, f"p99 {p99:.1f} ms ≥ fail threshold {self.p99_fail_ms:g} ms; {summary}")
+        if p99 >= self.p99_warn_ms:
+            return CheckResult(self.name, CheckStatus.WARN, f"p99 {p99:.1f} ms ≥ warn threshold {self.p99_warn_ms:g} ms; {summary}")
+        return CheckResult(self.name, CheckStatus.PASS, summary)
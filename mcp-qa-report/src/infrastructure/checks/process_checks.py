@@ -1,6 +1,15 @@
-from domain.models import CheckResult, CheckStatus
+from dataclasses import dataclass
+import asyncio
+import time
+
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, WatchInput
 from infrastructure.detect_mcp import detect_mcp_command
+from infrastructure.errors import JsonRpcMessageTooLargeError
+from infrastructure.framing import NdjsonFramer
+from infrastructure.json_codec import get_codec
+from infrastructure.jsonrpc_client import build_initialize_request
 from infrastructure.runner_factory import RunnerFactory
+from infrastructure.stats import LatencySummary
 import logging
 
 log = logging.getLogger(__name__)
@@ -13,6 +22,11 @@ class MCPServerStartupCheck:
     This ensures the server is runnable and speaks valid MCP over STDIO.
     """
     name = "MCP server starts and responds over stdio"
+    # Starts (and initializes) the session the other checks share
+    cost = CheckCost(subprocesses=1, latency_ms=1000, gating=True)
+    produces = (Artifact.INITIALIZE,)
+    # A source edit can stop the server from importing, so it re-gates every other check
+    inputs = (WatchInput.CONFIG, WatchInput.SOURCE)
 
     async def run(self, ctx) -> CheckResult:
         command = ctx.command or detect_mcp_command(ctx.project_path)
@@ -34,6 +48,7 @@ class MCPServerStartupCheck:
                     extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
                     return CheckResult(self.name, CheckStatus.FAIL, f"No valid initialize response received from server{extra}")
 
+                ctx.artifacts.put(Artifact.INITIALIZE, data)
                 return CheckResult(self.name, CheckStatus.PASS, "Server responded to initialize")
 
         except Exception:
@@ -46,4 +61,140 @@ class MCPServerStartupCheck:
                 except Exception:
                     pass 
             extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
-            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during startup{extra}")
\ No newline at end of file
+            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during startup{extra}")
+
+class _StartupFailed(Exception):
+    pass
+
+
+class _FirstByteClock:
+    """Stdout wrapper for NdjsonFramer that notes when the first chunk arrived."""
+    def __init__(self, reader: asyncio.StreamReader):
+        self._reader = reader
+        self.first_byte: float | None = None
+
+    async def read(self, n: int = -1) -> bytes:
+        chunk = await self._reader.read(n)
+        if chunk and self.first_byte is None:
+            self.first_byte = time.perf_counter()
+        return chunk
+
+
+@dataclass(frozen=True)
+class StartupSample:
+    spawn_ms: float          # launching the process
+    first_byte_ms: float     # launch -> first stdout byte (after initialize was sent)
+    initialize_ms: float     # launch -> initialize response
+
+
+class StartupLatencyBenchmarkCheck:
+    """
+    Opt-in benchmark of server startup latency.
+
+    Spawns fresh servers `runs` times sequentially, then `runs` times again with at most
+    `parallelism` starting at once, and measures spawn, first stdout byte and initialize
+    response for each. Reports min/p50/p95/p99/max per pass and grades the worst
+    initialize p95 against the warn/fail thresholds.
+    """
+    name = "Startup latency benchmark"
+    inputs = (WatchInput.CONFIG, WatchInput.SOURCE)
+
+    def __init__(self, runs: int = 10, parallelism: int = 4, warn_ms: float = 2000.0, fail_ms: float = 10000.0):
+        self.runs = max(1, runs)
+        self.parallelism = max(1, parallelism)
+        self.warn_ms = warn_ms
+        self.fail_ms = fail_ms
+        self.cost = CheckCost(subprocesses=self.parallelism, latency_ms=2000 * self.runs)
+
+    async def run(self, ctx) -> CheckResult:
+        command = ctx.command or detect_mcp_command(ctx.project_path)
+        if not command:
+            return CheckResult(self.name, CheckStatus.FAIL, "Cannot determine MCP start command")
+
+        factory = ctx.runner_factory or RunnerFactory()
+        try:
+            sequential = [await self._sample(factory, command, ctx) for _ in range(self.runs)]
+
+            gate = asyncio.Semaphore(self.parallelism)
+
+            async def bounded() -> StartupSample:
+                async with gate:
+                    return await self._sample(factory, command, ctx)
+
+            parallel = await asyncio.gather(*(bounded() for _ in range(self.runs)))
+        except _StartupFailed as e:
+            return CheckResult(self.name, CheckStatus.FAIL, str(e))
+        except Exception:
+            log.exception("StartupLatencyBenchmarkCheck crashed (project=%s, command=%s)", ctx.project_path, command)
+            return CheckResult(self.name, CheckStatus.FAIL, "Exception during startup benchmark")
+
+        passes = [("sequential", sequential), (f"parallel×{self.parallelism}", parallel)]
+        lines = []
+        worst_p95 = 0.0
+        for label, samples in passes:
+            init = LatencySummary.of(s.initialize_ms for s in samples)
+            worst_p95 = max(worst_p95, init.p95)
+            lines.append(
+                f"{label}, {len(samples)} runs — initialize {init.describe()}; "
+                f"spawn p50 {LatencySummary.of(s.spawn_ms for s in samples).p50:.0f} ms; "
+                f"first byte p50 {LatencySummary.of(s.first_byte_ms for s in samples).p50:.0f} ms"
+            )
+
+        if worst_p95 >= self.fail_ms:
+            status, verdict = CheckStatus.FAIL, f"initialize p95 {worst_p95:.0f} ms ≥ fail threshold {self.fail_ms:.0f} ms"
+        elif worst_p95 >= self.warn_ms:
+            status, verdict = CheckStatus.WARN, f"initialize p95 {worst_p95:.0f} ms ≥ warn threshold {self.warn_ms:.0f} ms"
+        else:
+            status, verdict = CheckStatus.PASS, f"initialize p95 {worst_p95:.0f} ms"
+        return CheckResult(self.name, status, "; ".join([verdict, *lines]))
+
+    async def _sample(self, factory, command: list[str], ctx) -> StartupSample:
+        started = time.perf_counter()
+        # Talks raw JSON-RPC on the isolated process so the first stdout byte can be observed
+        async with factory.create(command, ctx.project_path, ctx.timeout_sec, isolated=True) as s:
+            spawned = time.perf_counter()
+            codec = get_codec()
+            stdout = _FirstByteClock(s.runner.stdout)
+            framer = NdjsonFramer(stdout, max_message_bytes=s.max_message_bytes)
+            transcript = s.runner.transcript
+            try:
+                async with asyncio.timeout(ctx.timeout_sec):
+                    payload = codec.dumps(build_initialize_request(1))
+                    if transcript is not None:
+                        transcript.sent(payload)
+                    s.runner.stdin.write(payload + b"\n")
+                    await s.runner.stdin.drain()
+
+                    while True:
+                        frame = await framer.next_frame()
+                        if frame is None:
+                            raise _StartupFailed(self._failure("server closed stdout before initialize", s))
+                        try:
+                            msg = codec.loads(frame)
+                        except ValueError:
+                            msg = None
+                        if transcript is not None:
+                            transcript.received(frame, is_json=msg is not None)
+                        if isinstance(msg, dict) and msg.get("id") == 1:
+                            break
+            except TimeoutError:
+                raise _StartupFailed(self._failure(f"no initialize response within {ctx.timeout_sec}s", s)) from None
+            except JsonRpcMessageTooLargeError as e:
+                raise _StartupFailed(self._failure(str(e), s)) from None
+
+            if "result" not in msg:
+                raise _StartupFailed(self._failure("initialize returned an error", s))
+            done = time.perf_counter()
+            first_byte = stdout.first_byte
+
+        return StartupSample(
+            spawn_ms=(spawned - started) * 1000,
+            first_byte_ms=(first_byte - started) * 1000,
+            initialize_ms=(done - started) * 1000,
+        )
+
+    @staticmethod
+    def _failure(reason: str, s) -> str:
+        tail = s.runner.stderr_tail
+        extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+        return f"Startup failed during benchmark: {reason}{extra}"
@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+import asyncio
+import time
+
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, WatchInput
+from infrastructure.detect_mcp import detect_mcp_command
+from infrastructure.load_generator import run_open_loop
+from infrastructure.proc_stats import ProcSample, proc_available, sample_tree
+from infrastructure.runner_factory import RunnerFactory
+from infrastructure.stats import linear_trend
+import logging
+
+log = logging.getLogger(__name__)
+
+# Samples from the first part of the soak are ignored: caches and lazy imports fill up there
+WARMUP_FRACTION = 0.2
+# Growth counts as sustained only when a straight line explains most of it
+SUSTAINED_R2 = 0.6
+
+
+@dataclass(frozen=True)
+class ResourceTrend:
+    label: str
+    unit: str
+    start: float
+    end: float
+    slope_per_min: float
+    r2: float
+
+    def describe(self) -> str:
+        return (
+            f"{self.label} {self.start:.1f}→{self.end:.1f}{self.unit} "
+            f"({self.slope_per_min:+.2f}{self.unit}/min, r² {self.r2:.2f})"
+        )
+
+
+def resource_trend(label: str, unit: str, times: list[float], values: list[float]) -> ResourceTrend:
+    slope, r2 = linear_trend(times, values)
+    return ResourceTrend(label, unit, values[0], values[-1], slope * 60, r2)
+
+
+class SoakCheck:
+    """
+    Opt-in soak test for resource leaks in a long-lived server.
+
+    Keeps one dedicated session alive for duration_sec under steady tools/call
+    traffic, samples RSS, open FDs and threads of the server's process tree from
+    /proc, and fits a trend line after a warm-up. Sustained growth above the
+    per-minute thresholds WARNs or FAILs. WARNs without running where /proc is unavailable.
+    """
+    name = "Soak test (memory / FD / thread leaks)"
+    requires = (Artifact.TOOL_CATALOG,)
+    inputs = (WatchInput.CONFIG, WatchInput.SOURCE)
+
+    def __init__(
+        self,
+        duration_sec: float = 60.0,
+        rate_rps: float = 20.0,
+        sample_interval_sec: float = 1.0,
+        rss_warn_mb_per_min: float = 1.0,
+        rss_fail_mb_per_min: float = 10.0,
+        fd_warn_per_min: float = 1.0,
+        fd_fail_per_min: float = 10.0,
+        thread_warn_per_min: float = 1.0,
+        tool: str = "ping",
+        arguments: dict | None = None,
+    ):
+        self.duration_sec = duration_sec
+        self.rate_rps = rate_rps
+        self.sample_interval_sec = sample_interval_sec
+        # metric -> (warn, fail, minimum net growth to count as a leak)
+        self.thresholds = {
+            "rss": (rss_warn_mb_per_min, rss_fail_mb_per_min, 2.0),
+            "fds": (fd_warn_per_min, fd_fail_per_min, 3.0),
+            "threads": (thread_warn_per_min, None, 2.0),
+        }
+        self.tool = tool
+        self.arguments = arguments or {}
+        self.cost = CheckCost(subprocesses=1, latency_ms=int(1000 * duration_sec) + 1000)
+
+    async def run(self, ctx) -> CheckResult:
+        if not proc_available():
+            return CheckResult(self.name, CheckStatus.WARN, "Soak test needs /proc (Linux); not run")
+
+        command = ctx.command or detect_mcp_command(ctx.project_path)
+        if not command:
+            return CheckResult(self.name, CheckStatus.FAIL, "Cannot determine MCP start command")
+
+        tools = ctx.artifacts.get(Artifact.TOOL_CATALOG)
+        if tools is not None and not any(t.get("name") == self.tool for t in tools):
+            return CheckResult(self.name, CheckStatus.WARN, f"No '{self.tool}' tool; skipping soak test")
+
+        factory = ctx.runner_factory or RunnerFactory()
+
+        try:
+            async with factory.create(command, ctx.project_path, ctx.timeout_sec, isolated=True) as s:
+                init = await s.client.initialize()
+                if not init or "result" not in init:
+                    tail = s.runner.stderr_tail
+                    extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+                    return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
+
+                samples: list[tuple[float, ProcSample]] = []
+                sampler = asyncio.create_task(self._sample_loop(s.runner.pid, samples))
+                try:
+                    traffic = await run_open_loop(
+                        s.client,
+                        "tools/call",
+                        {"name": self.tool, "arguments": self.arguments},
+                        rate_rps=self.rate_rps,
+                        duration_sec=self.duration_sec,
+                    )
+                finally:
+                    sampler.cancel()
+                    await asyncio.gather(sampler, return_exceptions=True)
+                final = await asyncio.to_thread(sample_tree, s.runner.pid)
+                tail = s.runner.stderr_tail
+
+        except Exception:
+            log.exception("SoakCheck crashed (project=%s, command=%s)", ctx.project_path, command)
+            tail = ""
+            if 's' in locals() and s is not None:
+                tail = s.runner.stderr_tail
+            extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during soak test{extra}")
+
+        extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
+        failed = traffic.errors + traffic.timeouts
+        if final is None or failed:
+            reason = "server exited during the soak" if final is None else f"{failed}/{traffic.sent} requests failed"
+            return CheckResult(self.name, CheckStatus.FAIL, f"Soak test failed: {reason}{extra}")
+
+        steady = [(t, smp) for t, smp in samples if t >= self.duration_sec * WARMUP_FRACTION]
+        if len(steady) < 3:
+            return CheckResult(self.name, CheckStatus.WARN, "Soak too short to fit a trend; increase the duration")
+
+        times = [t for t, _ in steady]
+        trends = {
+            "rss": resource_trend("RSS", " MB", times, [smp.rss_bytes / 2**20 for _, smp in steady]),
+            "fds": resource_trend("FDs", "", times, [float(smp.fds) for _, smp in steady]),
+            "threads": resource_trend("threads", "", times, [float(smp.threads) for _, smp in steady]),
+        }
+
+        status, leaks = CheckStatus.PASS, []
+        for metric, trend in trends.items():
+            warn, fail, min_growth = self.thresholds[metric]
+            sustained = trend.r2 >= SUSTAINED_R2 and trend.end - trend.start >= min_growth
+            if not sustained:
+                continue
+            if fail is not None and trend.slope_per_min >= fail:
+                status = CheckStatus.FAIL
+                leaks.append(f"{trend.label} growing {trend.slope_per_min:.2f}{trend.unit}/min (fail ≥ {fail:g})")
+            elif trend.slope_per_min >= warn:
+                status = CheckStatus.WARN if status == CheckStatus.PASS else status
+                leaks.append(f"{trend.label} growing {trend.slope_per_min:.2f}{trend.unit}/min (warn ≥ {warn:g})")
+
+        details = "; ".join(t.describe() for t in trends.values())
+        summary = f"{traffic.sent} requests over {self.duration_sec:g}s, {len(steady)} samples after warm-up; {details}"
+        if leaks:
+            return CheckResult(self.name, status, "Sustained growth: " + ", ".join(leaks) + f"; {summary}")
+        return CheckResult(self.name, status, f"No sustained resource growth; {summary}")
+
+    async def _sample_loop(self, pid: int, samples: list[tuple[float, ProcSample]]) -> None:
+        started = time.monotonic()
+        while True:
+            sample = await asyncio.to_thread(sample_tree, pid)
+            if sample is not None:
+                samples.append((time.monotonic() - started, sample))
+            await asyncio.sleep(self.sample_interval_sec)
@@ -1,4 +1,4 @@
-from domain.models import CheckResult, CheckStatus
+from domain.models import CheckCost, CheckResult, CheckStatus, WatchInput
 from infrastructure.detect_mcp import detect_mcp_command
 from infrastructure.runner_factory import RunnerFactory
 import logging
@@ -13,6 +13,8 @@ class STDIOIntegrityCheck:
     Any noise before initialization may break JSON-RPC communication.
     """
     name = "STDIO integrity (no noise before initialize)"
+    cost = CheckCost(subprocesses=1, latency_ms=1000)
+    inputs = (WatchInput.CONFIG, WatchInput.SOURCE)
 
     async def run(self, ctx) -> CheckResult:
         command = ctx.command or detect_mcp_command(ctx.project_path)
@@ -22,7 +24,8 @@ class STDIOIntegrityCheck:
         factory = ctx.runner_factory or RunnerFactory()
 
         try:
-            async with factory.create(command, ctx.project_path, ctx.timeout_sec) as s:
+            # Needs its own process: a shared session has already consumed pre-initialize output
+            async with factory.create(command, ctx.project_path, ctx.timeout_sec, isolated=True) as s:
                 init_response, noise = await s.client.initialize_collect_noise()
 
                 if not init_response or "result" not in init_response:
@@ -1,4 +1,4 @@
-from domain.models import CheckResult, CheckStatus
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, WatchInput
 from infrastructure.detect_mcp import detect_mcp_command
 from infrastructure.runner_factory import RunnerFactory
 import logging
@@ -14,6 +14,10 @@ class ToolsRegistrationCheck:
     This confirms tools are discoverable via tools/list.
     """
     name = "MCP tools are registered and discoverable"
+    cost = CheckCost(subprocesses=0, latency_ms=100)
+    requires = (Artifact.INITIALIZE,)
+    produces = (Artifact.TOOL_CATALOG,)
+    inputs = (WatchInput.SOURCE,)
 
     async def run(self, ctx) -> CheckResult:
         command = ctx.command or detect_mcp_command(ctx.project_path)
@@ -24,13 +28,13 @@ class ToolsRegistrationCheck:
 
         try:
             async with factory.create(command, ctx.project_path, ctx.timeout_sec) as s:
-                init = await s.client.initialize()
+                init = ctx.artifacts.get(Artifact.INITIALIZE) or await s.client.initialize()
                 if not init or "result" not in init:
                     tail = s.runner.stderr_tail
                     extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
                     return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
 
-                response = await s.client.call("tools/list", request_id=2)
+                response = await s.client.request("tools/list")
                 if not response or "result" not in response:
                     tail = s.runner.stderr_tail
                     extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
@@ -44,6 +48,7 @@ class ToolsRegistrationCheck:
                     if "name" not in tool or "inputSchema" not in tool:
                         return CheckResult(self.name, CheckStatus.FAIL, f"Invalid tool schema: {tool}")
 
+                ctx.artifacts.put(Artifact.TOOL_CATALOG, tools)
                 return CheckResult(self.name, CheckStatus.PASS, f"{len(tools)} tools registered correctly")
 
         except Exception:
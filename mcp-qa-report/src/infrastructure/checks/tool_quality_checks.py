@@ -1,4 +1,4 @@
-from domain.models import CheckResult, CheckStatus
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus, WatchInput
 from infrastructure.detect_mcp import detect_mcp_command
 from infrastructure.runner_factory import RunnerFactory
 import logging
@@ -13,8 +13,16 @@ class ToolDescriptionQualityCheck:
     as poor metadata reduces usability for LLM-based agents.
     """
     name = "Tool description quality"
+    cost = CheckCost(subprocesses=0, latency_ms=100)
+    requires = (Artifact.TOOL_CATALOG,)
+    inputs = (WatchInput.SOURCE,)
 
     async def run(self, ctx) -> CheckResult:
+        # Catalog handed down by the registration check: no RPC needed
+        tools = ctx.artifacts.get(Artifact.TOOL_CATALOG)
+        if tools is not None:
+            return self._evaluate(tools)
+
         command = ctx.command or detect_mcp_command(ctx.project_path)
         if not command:
             return CheckResult(self.name, CheckStatus.FAIL, "Cannot determine MCP start command")
@@ -29,30 +37,13 @@ class ToolDescriptionQualityCheck:
                     extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
                     return CheckResult(self.name, CheckStatus.FAIL, f"Server did not respond to initialize{extra}")
 
-                response = await s.client.call("tools/list", request_id=10)
+                response = await s.client.request("tools/list")
                 if not response or "result" not in response:
                     tail = s.runner.stderr_tail
                     extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
                     return CheckResult(self.name, CheckStatus.FAIL, f"tools/list returned no result{extra}")
 
-                tools = response["result"].get("tools", [])
-                if not tools:
-                    return CheckResult(self.name, CheckStatus.FAIL, "No tools registered")
-
-                tools_without_desc = [
-                    t.get("name", "<unknown>")
-                    for t in tools
-                    if not t.get("description") or len(t["description"].strip()) < 10
-                ]
-
-                if tools_without_desc:
-                    return CheckResult(
-                        self.name,
-                        CheckStatus.WARN,
-                        f"Tools missing description: {', '.join(tools_without_desc)}",
-                    )
-
-                return CheckResult(self.name, CheckStatus.PASS, "All tools have descriptions")
+                return self._evaluate(response["result"].get("tools", []))
 
         except Exception:
             log.exception("ToolDescriptionQualityCheck crashed (project=%s, command=%s)", ctx.project_path, command)
@@ -64,4 +55,23 @@ class ToolDescriptionQualityCheck:
                     pass
             
             extra = f"\n--- stderr tail ---\n{tail}" if tail else ""
-            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during tool description check{extra}")
\ No newline at end of file
+            return CheckResult(self.name, CheckStatus.FAIL, f"Exception during tool description check{extra}")
+
+    def _evaluate(self, tools: list[dict]) -> CheckResult:
+        if not tools:
+            return CheckResult(self.name, CheckStatus.FAIL, "No tools registered")
+
+        tools_without_desc = [
+            t.get("name", "<unknown>")
+            for t in tools
+            if not t.get("description") or len(t["description"].strip()) < 10
+        ]
+
+        if tools_without_desc:
+            return CheckResult(
+                self.name,
+                CheckStatus.WARN,
+                f"Tools missing description: {', '.join(tools_without_desc)}",
+            )
+
+        return CheckResult(self.name, CheckStatus.PASS, "All tools have descriptions")
@@ -4,12 +4,18 @@ Detects how to start a target MCP server project.
 Prefers explicit MCP config (mcp.json / .vscode/mcp.json),
 then falls back to Python entrypoints (pyproject scripts) or Node scripts (package.json).
 Returns a command list suitable for subprocess execution, or None if unknown.
+Results are memoized per project, keyed by the (mtime, size) of the config files
+consulted, so repeated detection costs a few stat() calls until a config changes.
+The memo is shared by the worker threads batch runs detect in, so it is lock-guarded.
 """
 from __future__ import annotations
 
 from pathlib import Path
+import asyncio
 import json
+import os
 import sys
+import threading
 import tomllib
 from typing import Any
 
@@ -61,8 +67,54 @@ def _command_from_entrypoint(entrypoint: Any) -> list[str] | None:
     return [*base_cmd, "-m", ep]
 
 
+CONFIG_FILES = (
+    os.path.join(".vscode", "mcp.json"),
+    "mcp.json",
+    "pyproject.toml",
+    "package.json",
+)
+_CACHE_MAX_ENTRIES = 256
+_cache: dict[str, tuple[tuple, list[str] | None]] = {}
+_cache_lock = threading.Lock()
+
+
+def _config_stamp(root: Path) -> tuple:
+    stamp = []
+    for name in CONFIG_FILES:
+        try:
+            st = os.stat(root / name)
+            stamp.append((name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append((name, None, None))
+    return tuple(stamp)
+
+
 def detect_mcp_command(project_path: str) -> list[str] | None:
     root = Path(project_path)
+    key = str(root.resolve())
+    stamp = _config_stamp(root)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is None or cached[0] != stamp:
+        # Parsed outside the lock: threads detecting other projects do not wait on it
+        cached = (stamp, _detect_uncached(root))
+        with _cache_lock:
+            _cache.pop(key, None)
+            while len(_cache) >= _CACHE_MAX_ENTRIES:
+                _cache.pop(next(iter(_cache)))
+            _cache[key] = cached
+
+    # Hand out copies so callers cannot mutate the cached command
+    return list(cached[1]) if cached[1] is not None else None
+
+
+async def detect_mcp_command_async(project_path: str) -> list[str] | None:
+    """detect_mcp_command off the event loop (file reads and parsing run in a worker thread)."""
+    return await asyncio.to_thread(detect_mcp_command, project_path)
+
+
+def _detect_uncached(root: Path) -> list[str] | None:
 
     # 0) Prefer explicit MCP config (source of truth)
     for cfg in (root / ".vscode" / "mcp.json", root / "mcp.json"):
@@ -19,3 +19,7 @@ class JsonRpcProtocolError(MCPQAError):
 
 class MCPProcessError(MCPQAError):
     pass
+
+
+class JsonRpcMessageTooLargeError(JsonRpcProtocolError):
+    pass
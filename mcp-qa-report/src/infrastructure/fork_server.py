@@ -0,0 +1,425 @@
+"""
+Fork server behind ForkedServerRunner.
+
+Forking the QA process itself is unsafe once it runs threads (asyncio.to_thread
+workers, the transcript writer, the MCP stdio transport): a lock one of them holds at
+fork time stays locked forever in the child. ForkServer therefore spawns one helper
+interpreter that never starts a thread, imports the preload modules once, and forks
+every target from there. The QA process hands it the target's stdio pipe ends over a
+Unix socket (SCM_RIGHTS); the helper answers with the child's pid and later reports
+its exit status and wait4 rusage on a second socket, read by a daemon thread here.
+Targets lead their own session, so teardown signals their process group as usual.
+The helper exits once the QA process closes its end (or dies). POSIX only.
+"""
+from __future__ import annotations
+
+import atexit
+import gc
+import itertools
+import json
+import logging
+import os
+import runpy
+import select
+import signal
+import site
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import traceback
+import warnings
+from dataclasses import asdict, dataclass
+
+from infrastructure.errors import MCPProcessError
+from infrastructure.rlimits import ResourceLimits
+
+log = logging.getLogger(__name__)
+
+SPAWN_TIMEOUT_SEC = 30.0
+_HEADER = struct.Struct("!I")
+# fds of one target: its stdin read end, stdout and stderr write ends
+_TARGET_FDS = 3
+
+
+@dataclass(frozen=True)
+class ForkTarget:
+    module: str | None
+    script: str | None
+    args: tuple[str, ...]
+
+
+def _runtime_roots() -> tuple[str, ...]:
+    roots = {sys.prefix, sys.base_prefix, sys.exec_prefix, sys.base_exec_prefix, *site.getsitepackages()}
+    if site.ENABLE_USER_SITE:
+        roots.add(site.getusersitepackages())
+    return tuple(os.path.join(os.path.abspath(r), "") for r in roots)
+
+
+def _is_runtime_path(path: str, roots: tuple[str, ...]) -> bool:
+    path = os.path.abspath(path)
+    return path.startswith(roots) or os.path.join(path, "") in roots
+
+
+def _child_main(
+    target: ForkTarget,
+    project_path: str,
+    env: dict[str, str],
+    fds: tuple[int, int, int],
+    limits: ResourceLimits | None = None,
+) -> int:
+    # Objects inherited from the helper must never be collected here: their finalizers
+    # would close file descriptors the child has since reused
+    gc.freeze()
+    # Own session, like a spawned server, so teardown can signal everything the target starts
+    os.setsid()
+    if limits:
+        limits.apply()
+    for fd, std in zip(fds, (0, 1, 2)):
+        os.dup2(fd, std)
+        os.close(fd)
+    # Nothing else of the helper (its sockets, its wakeup pipe) may leak into the target
+    os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+
+    signal.set_wakeup_fd(-1)
+    for sig in (signal.SIGTERM, signal.SIGCHLD, signal.SIGHUP):
+        signal.signal(sig, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False, buffering=1)
+    sys.stderr = open(2, "w", encoding="utf-8", closefd=False, buffering=1)
+    logging.root.handlers.clear()
+    warnings.resetwarnings()
+    warnings.simplefilter("ignore", DeprecationWarning)
+    warnings.simplefilter("ignore", ResourceWarning)
+    warnings.filterwarnings("default", category=DeprecationWarning, module="__main__")
+
+    os.chdir(project_path)
+    os.environ.clear()
+    os.environ.update(env)
+
+    # Keep the interpreter's stdlib and site-packages (already imported: the point of
+    # forking) but none of our own modules, which could shadow the target's
+    roots = _runtime_roots()
+    for name, module in list(sys.modules.items()):
+        origin = getattr(module, "__file__", None)
+        if origin and not _is_runtime_path(origin, roots):
+            del sys.modules[name]
+    entry = os.path.dirname(os.path.abspath(target.script)) if target.script else os.getcwd()
+    pythonpath = [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    sys.path[:] = [entry, *pythonpath, *(p for p in sys.path if p and _is_runtime_path(p, roots))]
+
+    try:
+        if target.module is not None:
+            sys.argv = [target.module, *target.args]
+            runpy.run_module(target.module, run_name="__main__", alter_sys=True)
+        else:
+            sys.argv = [target.script, *target.args]
+            runpy.run_path(target.script, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        if e.code is not None and not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    return code
+
+
+def _send(sock: socket.socket, msg: dict, fds: tuple[int, ...] = ()) -> None:
+    payload = json.dumps(msg).encode("utf-8")
+    data = _HEADER.pack(len(payload)) + payload
+    sent = socket.send_fds(sock, [data], list(fds)) if fds else sock.send(data)
+    if sent < len(data):
+        sock.sendall(data[sent:])
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    chunks, left = [], size
+    while left:
+        chunk = sock.recv(left)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        left -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv(sock: socket.socket, max_fds: int = 0) -> tuple[dict, list[int]] | None:
+    """Next message (and the fds sent with it); None at EOF."""
+    if max_fds:
+        # Ancillary data arrives with the first byte of its message
+        header, fds, _, _ = socket.recv_fds(sock, _HEADER.size, max_fds)
+        if len(header) < _HEADER.size:
+            rest = _recv_exact(sock, _HEADER.size - len(header)) if header else None
+            if rest is None:
+                for fd in fds:
+                    os.close(fd)
+                return None
+            header += rest
+    else:
+        fds = []
+        header = _recv_exact(sock, _HEADER.size)
+        if header is None:
+            return None
+    payload = _recv_exact(sock, _HEADER.unpack(header)[0])
+    if payload is None:
+        return None
+    return json.loads(payload), fds
+
+
+class ForkServer:
+    """QA-side handle of the helper: spawn() forks a target there, exit_status() reports its end."""
+    def __init__(self, preload: tuple[str, ...] = ()):
+        self._preload = preload
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._proc: subprocess.Popen | None = None
+        self._requests: socket.socket | None = None
+        self._reader: threading.Thread | None = None
+        self._alive = False
+        self._waiters: dict[int, tuple[threading.Event, dict]] = {}
+        self._exits: dict[int, tuple[int, tuple | None]] = {}
+        self._atexit = False
+
+    def spawn(
+        self,
+        target: ForkTarget,
+        project_path: str,
+        env: dict[str, str],
+        fds: tuple[int, int, int],
+        limits: ResourceLimits | None = None,
+    ) -> int:
+        """Forks the target in the helper (blocking: call it from a worker thread); returns its pid."""
+        done, reply = threading.Event(), {}
+        with self._lock:
+            self._ensure_started()
+            rid = next(self._ids)
+            self._waiters[rid] = (done, reply)
+            msg = {
+                "id": rid,
+                "module": target.module,
+                "script": target.script,
+                "args": list(target.args),
+                "project_path": project_path,
+                "env": env,
+                "limits": asdict(limits) if limits else None,
+            }
+            try:
+                _send(self._requests, msg, fds)
+            except OSError as e:
+                self._waiters.pop(rid, None)
+                raise MCPProcessError(f"Fork server unavailable: {e}") from e
+
+        if not done.wait(SPAWN_TIMEOUT_SEC):
+            self._waiters.pop(rid, None)
+            raise MCPProcessError("Fork server did not answer")
+        if "pid" not in reply:
+            raise MCPProcessError(f"Fork server could not start the target: {reply.get('error', 'helper exited')}")
+        return reply["pid"]
+
+    def exit_status(self, pid: int) -> tuple[int, tuple | None] | None:
+        """(returncode, wait4 rusage fields) once the target exited, else None."""
+        status = self._exits.pop(pid, None)
+        if status is None and not self._alive and not _group_alive(pid):
+            # The helper is gone, so nobody reaps for us: judge by the process group
+            return -1, None
+        return status
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stops the helper (targets it forked keep running); the next spawn starts a new one."""
+        with self._lock:
+            self._stop(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._alive:
+            return
+        self._stop(timeout=1.0)
+        requests, helper_requests = socket.socketpair()
+        events, helper_events = socket.socketpair()
+        src_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = os.environ.copy()
+        env["PYTHONPATH"] = src_root + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+        fds = (helper_requests.fileno(), helper_events.fileno())
+        try:
+            # stdout stays clear of the helper: ours may be an MCP stdio channel
+            self._proc = subprocess.Popen(
+                [sys.executable, "-m", "infrastructure.fork_server", *map(str, fds), *self._preload],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                env=env,
+                pass_fds=fds,
+                start_new_session=True,
+            )
+        except OSError:
+            requests.close()
+            events.close()
+            raise
+        finally:
+            helper_requests.close()
+            helper_events.close()
+        self._requests = requests
+        self._alive = True
+        self._reader = threading.Thread(target=self._read_events, args=(events,), name="qa-fork-server", daemon=True)
+        self._reader.start()
+        if not self._atexit:
+            self._atexit = True
+            atexit.register(self.close)
+        log.debug("Fork server started pid=%s preload=%s", self._proc.pid, self._preload)
+
+    def _stop(self, timeout: float) -> None:
+        if self._requests is not None:
+            # EOF on its request socket ends the helper; its targets keep running until torn down
+            self._requests.close()
+            self._requests = None
+        if self._proc is not None:
+            try:
+                self._proc.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+            self._proc = None
+        if self._reader is not None:
+            self._reader.join(timeout)
+            self._reader = None
+
+    def _read_events(self, events: socket.socket) -> None:
+        try:
+            while True:
+                received = _recv(events)
+                if received is None:
+                    break
+                msg, _ = received
+                if msg["op"] == "started":
+                    done, reply = self._waiters.pop(msg["id"], (None, None))
+                    if done is not None:
+                        reply.update(msg)
+                        done.set()
+                elif msg["op"] == "exit":
+                    self._exits[msg["pid"]] = (msg["returncode"], msg["rusage"])
+        except OSError:
+            log.debug("Fork server event stream failed", exc_info=True)
+        finally:
+            self._alive = False
+            events.close()
+            for done, _ in list(self._waiters.values()):
+                done.set()
+            self._waiters.clear()
+
+
+def _group_alive(pgid: int) -> bool:
+    try:
+        os.killpg(pgid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+_servers: dict[tuple[str, ...], ForkServer] = {}
+_servers_lock = threading.Lock()
+
+
+def get_fork_server(preload: tuple[str, ...] = ()) -> ForkServer:
+    """Process-wide fork server per preload list (the helper is started on first spawn)."""
+    with _servers_lock:
+        server = _servers.get(preload)
+        if server is None:
+            server = _servers[preload] = ForkServer(preload)
+        return server
+
+
+def _reap(events: socket.socket) -> None:
+    while True:
+        try:
+            pid, status, rusage = os.wait4(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if not pid:
+            return
+        _send(events, {"op": "exit", "pid": pid, "returncode": os.waitstatus_to_exitcode(status), "rusage": list(rusage)})
+
+
+def _fork(msg: dict, fds: list[int], events: socket.socket) -> None:
+    if len(fds) != _TARGET_FDS:
+        for fd in fds:
+            os.close(fd)
+        _send(events, {"op": "started", "id": msg["id"], "error": "expected 3 stdio fds"})
+        return
+    target = ForkTarget(msg["module"], msg["script"], tuple(msg["args"]))
+    limits = ResourceLimits(**msg["limits"]) if msg.get("limits") else None
+    try:
+        pid = os.fork()
+    except OSError as e:
+        for fd in fds:
+            os.close(fd)
+        _send(events, {"op": "started", "id": msg["id"], "error": str(e)})
+        return
+
+    if pid == 0:
+        code = 70
+        try:
+            code = _child_main(target, msg["project_path"], msg["env"], tuple(fds), limits)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+
+    for fd in fds:
+        os.close(fd)
+    _send(events, {"op": "started", "id": msg["id"], "pid": pid})
+
+
+def main(argv: list[str]) -> None:
+    """Helper entry point: `python -m infrastructure.fork_server <requests fd> <events fd> [preload...]`."""
+    requests = socket.socket(fileno=int(argv[0]))
+    events = socket.socket(fileno=int(argv[1]))
+    # Ctrl-C belongs to the QA process; it tears the targets down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name in argv[2:]:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+    signal.set_wakeup_fd(wake_w)
+
+    try:
+        _serve(requests, events, wake_r)
+    except OSError:
+        pass  # the QA process went away
+
+
+def _serve(requests: socket.socket, events: socket.socket, wake_r: int) -> None:
+    while True:
+        ready, _, _ = select.select([requests, wake_r], [], [])
+        if wake_r in ready:
+            try:
+                while os.read(wake_r, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        _reap(events)
+        if requests in ready:
+            received = _recv(requests, max_fds=_TARGET_FDS)
+            if received is None:
+                return
+            msg, fds = received
+            _fork(msg, fds, events)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
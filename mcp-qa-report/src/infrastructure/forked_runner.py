@@ -0,0 +1,237 @@
+"""
+Forked-worker runner for Python stdio MCP servers (e.g. FastMCP targets).
+
+When a target is launched with the interpreter we are running on (`python -m pkg.server`
+or `python server.py`), spawning it pays for a fresh interpreter and for importing
+mcp/pydantic/anyio again on every check. ForkedServerRunner instead has the fork
+server (see fork_server.py) fork an already-warm, single-threaded helper: the child
+swaps in the stdio pipes we created, the target's cwd, environment and sys.path, drops
+our own project modules from sys.modules, and runs the target with runpy exactly as
+`python -m` would. We drive it over the pipes with the usual JsonRpcClient.
+
+Each check still gets its own process, so isolation is the same as with a subprocess.
+Other commands (different interpreters, `uv run` that cannot be resolved, extra
+interpreter flags) fall back to MCPProcessRunner. POSIX only.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from infrastructure.fork_server import ForkServer, ForkTarget, get_fork_server
+from infrastructure.proc_stats import rusage_usage
+from infrastructure.process_runner import STDERR_DRAIN_SEC, MCPProcessRunner, build_process_env, stop_process_group
+from infrastructure.runner_factory import RunnerFactory
+
+log = logging.getLogger(__name__)
+
+# Interpreter flags that do not change how the target runs once forked
+_HARMLESS_FLAGS = frozenset({"-u", "-B"})
+_REAP_INTERVAL_SEC = 0.005
+# Imported into the fork server before the first fork, so every child starts with them loaded
+DEFAULT_PRELOAD = ("mcp.server.fastmcp",)
+
+
+def fork_available() -> bool:
+    return hasattr(os, "fork") and sys.platform != "win32"
+
+
+def _same_interpreter(executable: str, env: dict[str, str]) -> bool:
+    found = shutil.which(executable, path=env.get("PATH"))
+    if found is None:
+        return False
+    # Venv interpreters are symlinks to the base one: compare the launcher, not its target
+    ours = os.path.abspath(sys.executable)
+    found = os.path.abspath(found)
+    return found == ours or (
+        os.path.dirname(found) == os.path.dirname(ours) and os.path.basename(found).startswith("python")
+    )
+
+
+def fork_target(command: list[str], env: dict[str, str]) -> ForkTarget | None:
+    """Parses `<our python> [-u|-B] (-m module | script.py) args...`; None when it cannot be forked."""
+    if not command or not fork_available() or not _same_interpreter(command[0], env):
+        return None
+    rest = list(command[1:])
+    while rest and rest[0] in _HARMLESS_FLAGS:
+        rest.pop(0)
+    if len(rest) >= 2 and rest[0] == "-m":
+        return ForkTarget(module=rest[1], script=None, args=tuple(rest[2:]))
+    if rest and rest[0].endswith(".py"):
+        return ForkTarget(module=None, script=rest[0], args=tuple(rest[1:]))
+    return None
+
+
+class ForkedServerRunner(MCPProcessRunner):
+    """MCPProcessRunner look-alike whose server is a child of the fork server running the target."""
+    def __init__(
+        self,
+        target: ForkTarget,
+        command: list[str],
+        project_path: str,
+        env: dict[str, str] | None = None,
+        server: ForkServer | None = None,
+        **kwargs,
+    ):
+        super().__init__(command=command, project_path=project_path, env=env, **kwargs)
+        self._target = target
+        self._server = server or get_fork_server()
+        self._pid: int | None = None
+        self._returncode: int | None = None
+        self._stdin: asyncio.StreamWriter | None = None
+        self._stdout: asyncio.StreamReader | None = None
+        self._transports: list[asyncio.BaseTransport] = []
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        env = build_process_env(self._project_path, self._env)
+        in_r, in_w = os.pipe()
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        try:
+            pid = await asyncio.to_thread(
+                self._server.spawn, self._target, self._project_path, env, (in_r, out_w, err_w), self._limits
+            )
+        except BaseException:
+            for fd in (in_w, out_r, err_r):
+                os.close(fd)
+            raise
+        finally:
+            # The helper holds (and the child inherits) its own copies now
+            for fd in (in_r, out_w, err_w):
+                os.close(fd)
+
+        self._pid, self._returncode, self._killed_by_us = pid, None, False
+        log.debug("ForkedServerRunner started pid=%s cwd=%s target=%s", pid, self._project_path, self._target)
+
+        loop = asyncio.get_running_loop()
+        self._stdout = await self._read_pipe(loop, out_r)
+        stderr = await self._read_pipe(loop, err_r)
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+            os.fdopen(in_w, "wb", buffering=0),
+        )
+        self._transports.append(transport)
+        self._stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+        self._stderr_task = asyncio.create_task(self._drain_stderr(stderr))
+        self._open_transcript(pid)
+        self._start_accounting(pid)
+
+    async def _read_pipe(self, loop: asyncio.AbstractEventLoop, fd: int) -> asyncio.StreamReader:
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(fd, "rb", buffering=0),
+        )
+        self._transports.append(transport)
+        return reader
+
+    def _poll(self) -> int | None:
+        if self._pid is not None and self._returncode is None:
+            status = self._server.exit_status(self._pid)
+            if status is not None:
+                self._returncode, rusage = status
+                if rusage is not None and resource is not None and self._usage is not None:
+                    # Reaped by the helper with wait4: exact totals, shutdown included
+                    self._usage.record_exit(self._pid, rusage_usage(resource.struct_rusage(rusage)))
+        return self._returncode
+
+    async def _wait_proc(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while self._poll() is None:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(_REAP_INTERVAL_SEC)
+        return True
+
+    def _returncode_now(self) -> int | None:
+        return self._poll()
+
+    @property
+    def pid(self) -> int | None:
+        return self._pid
+
+    @property
+    def is_running(self) -> bool:
+        return self._pid is not None and self._poll() is None
+
+    @property
+    def stdin(self) -> asyncio.StreamWriter:
+        assert self._stdin is not None
+        return self._stdin
+
+    @property
+    def stdout(self) -> asyncio.StreamReader:
+        assert self._stdout is not None
+        return self._stdout
+
+    async def terminate(self) -> None:
+        pid = self._pid
+        if pid is None:
+            return
+
+        log.debug("ForkedServerRunner terminating pid=%s", pid)
+
+        self.sample_usage()
+        self._killed_by_us = self._poll() is None
+        try:
+            if self._stdin is not None:
+                try:
+                    self._stdin.close()
+                    await self._stdin.wait_closed()
+                except Exception:
+                    pass
+
+            await stop_process_group(pid, self._wait_proc, self._term_grace, self._kill_grace)
+
+        finally:
+            await self._stop_accounting()
+            if self._stderr_task is not None:
+                await asyncio.wait({self._stderr_task}, timeout=STDERR_DRAIN_SEC)
+                self._stderr_task.cancel()
+                try:
+                    await self._stderr_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+                self._stderr_task = None
+            self._close_transcript(self._returncode)
+            for transport in self._transports:
+                transport.close()
+            self._transports.clear()
+            self._pid = None
+            self._stdin = self._stdout = None
+
+
+class ForkedRunnerFactory(RunnerFactory):
+    """
+    RunnerFactory that forks Python targets run by our own interpreter (through the
+    process-wide fork server) instead of spawning them, and falls back to a subprocess
+    for every other command.
+    """
+    def __init__(self, *args, preload: tuple[str, ...] = DEFAULT_PRELOAD, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._preload = tuple(preload)
+
+    def _make_runner(self, command: list[str], project_path: str, env: dict[str, str] | None) -> MCPProcessRunner:
+        target = fork_target(command, build_process_env(project_path, env))
+        if target is None:
+            return super()._make_runner(command, project_path, env)
+        return ForkedServerRunner(
+            target,
+            command=command,
+            project_path=project_path,
+            env=env,
+            server=get_fork_server(self._preload),
+            **self._runner_options,
+        )
@@ -0,0 +1,94 @@
+"""
+Newline-delimited message framing for JSON-RPC over stdio.
+
+Reads the stream in large chunks into one growing buffer and splits it on b"\\n"
+with bytearray.find, resuming each search where the previous one stopped, so a
+multi-megabyte message costs a single scan and no per-line str conversion.
+Frames are handed out as memoryviews into the buffer (valid until the next call),
+so decoders that accept buffers parse them without copying. Unlike
+StreamReader.readline() there is no 64 KiB line limit; instead a configurable
+max_message_bytes bounds memory.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from infrastructure.errors import JsonRpcMessageTooLargeError
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+_WHITESPACE = b" \t\r\n"
+
+
+class NdjsonFramer:
+    """Splits a StreamReader into newline-delimited frames (blank lines are skipped)."""
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+    ):
+        self._reader = reader
+        self._chunk_size = chunk_size
+        self._max = max_message_bytes
+        self._buf = bytearray()
+        self._start = 0        # first byte of the next frame
+        self._scan = 0         # where the next newline search resumes
+        self._eof = False
+        self._view: memoryview | None = None
+
+    async def next_frame(self) -> memoryview | None:
+        """The next non-blank frame without its newline, or None at EOF."""
+        self._release()
+        while True:
+            nl = self._buf.find(b"\n", self._scan)
+            if nl >= 0:
+                begin, self._start = self._start, nl + 1
+                self._scan = self._start
+                self._check_size(nl - begin)
+                frame = self._frame(begin, nl)
+                if frame is not None:
+                    return frame
+                continue
+
+            self._scan = len(self._buf)
+            self._check_size(len(self._buf) - self._start)
+            if self._eof:
+                # A final message without a trailing newline still counts
+                begin, self._start = self._start, len(self._buf)
+                return self._frame(begin, len(self._buf))
+
+            self._compact()
+            chunk = await self._reader.read(self._chunk_size)
+            if chunk:
+                self._buf += chunk
+            else:
+                self._eof = True
+
+    def _frame(self, begin: int, end: int) -> memoryview | None:
+        buf = self._buf
+        while begin < end and buf[begin] in _WHITESPACE:
+            begin += 1
+        while end > begin and buf[end - 1] in _WHITESPACE:
+            end -= 1
+        if begin == end:
+            return None
+        self._view = memoryview(buf)[begin:end]
+        return self._view
+
+    def _check_size(self, size: int) -> None:
+        if size > self._max:
+            raise JsonRpcMessageTooLargeError(f"JSON-RPC message exceeds {self._max} bytes")
+
+    def _release(self) -> None:
+        # The buffer cannot be resized while a view of it is alive
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+    def _compact(self) -> None:
+        if self._start and (self._start == len(self._buf) or self._start >= len(self._buf) // 2):
+            del self._buf[:self._start]
+            self._scan -= self._start
+            self._start = 0
@@ -0,0 +1,137 @@
+"""
+Resolves the Python interpreter `uv run` would use for a target project, once.
+
+Commands of the form ["uv", "run", "python", ...] pay uv's environment resolution
+and lock check on every spawn. The resolver runs uv a single time per project,
+records the venv interpreter and the environment variables it relies on, and
+rewrites later commands to launch that interpreter directly.
+Results are cached per project and invalidated when uv.lock, pyproject.toml or
+.python-version change (by mtime/size first, then content hash).
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+UV_PYTHON_PREFIX = ["uv", "run", "python"]
+FINGERPRINT_FILES = ("uv.lock", "pyproject.toml", ".python-version")
+
+_PROBE_CODE = (
+    "import json,os,sys;"
+    "print(json.dumps({'executable': sys.executable, 'prefix': sys.prefix, "
+    "'base_prefix': sys.base_prefix}))"
+)
+
+
+@dataclass(frozen=True)
+class ResolvedInterpreter:
+    python: str
+    env: dict[str, str]
+
+
+class InterpreterResolver:
+    """Caches `uv run python` resolution per project, keyed on project file fingerprints."""
+    def __init__(self, uv: str = "uv", timeout_sec: float = 120.0):
+        self._uv = uv
+        self._timeout = timeout_sec
+        self._cache: dict[str, tuple[tuple, ResolvedInterpreter | None]] = {}
+        self._digests: dict[str, tuple[int, int, str]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def rewrite(self, command: list[str], project_path: str) -> tuple[list[str], dict[str, str] | None]:
+        """Returns (command, env overrides); unchanged when the command is not `uv run python`."""
+        if command[:3] != UV_PYTHON_PREFIX:
+            return command, None
+
+        resolved = await self.resolve(project_path)
+        if resolved is None:
+            return command, None
+        return [resolved.python, *command[3:]], dict(resolved.env)
+
+    async def resolve(self, project_path: str) -> ResolvedInterpreter | None:
+        root = str(Path(project_path).resolve())
+        lock = self._locks.setdefault(root, asyncio.Lock())
+        async with lock:
+            fingerprint = await asyncio.to_thread(self._fingerprint, root)
+            cached = self._cache.get(root)
+            if cached is not None and cached[0] == fingerprint:
+                resolved = cached[1]
+                if resolved is None or os.path.exists(resolved.python):
+                    return resolved
+
+            resolved = await self._probe(root)
+            self._cache[root] = (fingerprint, resolved)
+            return resolved
+
+    def _fingerprint(self, root: str) -> tuple:
+        parts = []
+        for name in FINGERPRINT_FILES:
+            p = os.path.join(root, name)
+            try:
+                st = os.stat(p)
+            except OSError:
+                parts.append((name, None))
+                continue
+
+            known = self._digests.get(p)
+            if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+                digest = known[2]
+            else:
+                with open(p, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                self._digests[p] = (st.st_mtime_ns, st.st_size, digest)
+            parts.append((name, digest))
+        return tuple(parts)
+
+    async def _probe(self, root: str) -> ResolvedInterpreter | None:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self._uv, "run", "python", "-c", _PROBE_CODE,
+                cwd=root,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            log.debug("Interpreter probe could not start uv (cwd=%s): %s", root, e)
+            return None
+
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            log.warning("Interpreter probe timed out (cwd=%s)", root)
+            return None
+
+        if proc.returncode != 0:
+            log.debug("Interpreter probe failed (cwd=%s): %s", root, err.decode("utf-8", errors="replace")[-500:])
+            return None
+
+        return self._parse_probe(out.decode("utf-8", errors="replace"))
+
+    @staticmethod
+    def _parse_probe(output: str) -> ResolvedInterpreter | None:
+        for line in reversed(output.splitlines()):
+            try:
+                info = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(info, dict) or not info.get("executable"):
+                continue
+
+            python = info["executable"]
+            env: dict[str, str] = {}
+            if info.get("prefix") and info.get("prefix") != info.get("base_prefix"):
+                # What `uv run` exports for a project venv
+                env["VIRTUAL_ENV"] = info["prefix"]
+                env["PATH"] = str(Path(python).parent) + os.pathsep + os.environ.get("PATH", "")
+            return ResolvedInterpreter(python=python, env=env)
+        return None
@@ -0,0 +1,133 @@
+"""
+JSON codec used on the JSON-RPC hot path and by the reporters.
+
+Picks the fastest installed backend — orjson, then msgspec, then the stdlib `json`
+module — unless QA_JSON_CODEC (orjson / msgspec / json) pins one. All codecs encode to
+UTF-8 bytes and decode bytes, bytearray or memoryview (the native backends without
+copying). Values a native backend cannot encode (e.g. integers beyond 64 bits) fall
+back to the stdlib encoder. Decode errors are ValueError for every backend.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, Protocol
+
+log = logging.getLogger(__name__)
+
+
+class JsonCodec(Protocol):
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        ...
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        ...
+
+    def dumps_pretty(self, obj: Any) -> str:
+        ...
+
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps_pretty(self, obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            return _STDLIB.dumps(obj)
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps_pretty(self, obj: Any) -> str:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            return _STDLIB.dumps_pretty(obj)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return _STDLIB.dumps(obj)
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps_pretty(self, obj: Any) -> str:
+        return self._msgspec.json.format(self.dumps(obj), indent=2).decode("utf-8")
+
+
+_STDLIB = StdlibCodec()
+_BACKENDS = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": StdlibCodec}
+_codec: JsonCodec | None = None
+
+
+def load_codec(name: str) -> JsonCodec:
+    """Instantiates a named backend; raises ImportError when it is not installed."""
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec {name!r} (expected one of {', '.join(_BACKENDS)})") from None
+
+
+def available_codecs() -> list[JsonCodec]:
+    out = []
+    for name in _BACKENDS:
+        try:
+            out.append(load_codec(name))
+        except ImportError:
+            continue
+    return out
+
+
+def get_codec() -> JsonCodec:
+    """Process-wide codec: QA_JSON_CODEC if set (falling back to stdlib if missing), else the fastest installed."""
+    global _codec
+    if _codec is None:
+        wanted = os.getenv("QA_JSON_CODEC", "").strip().lower()
+        if wanted and wanted != "auto":
+            try:
+                _codec = load_codec(wanted)
+            except (ImportError, ValueError):
+                log.warning("QA_JSON_CODEC=%s is not available; using stdlib json", wanted)
+                _codec = _STDLIB
+        else:
+            _codec = available_codecs()[0]
+        log.debug("Using JSON codec: %s", _codec.name)
+    return _codec
@@ -1,24 +1,78 @@
 """
 Minimal JSON-RPC 2.0 client for MCP over stdio.
 
-Writes requests to stdin, reads stdout asynchronously to avoid blocking,
-filters responses by expected id, and raises JsonRpcTimeoutError on timeout.
+Writes requests to stdin while a single background reader task owns stdout,
+split into messages by an NdjsonFramer (no line-length limit up to max_message_bytes):
+each response is routed to the future of its request id, and notifications
+(or server-initiated requests) are fanned out to subscribers. Any number of
+requests can therefore be in flight (pipelined) over one stdio pipe.
+Request ids are allocated by the client (monotonic, never reused while in flight),
+so callers use request(method, params) and read the id back from the response.
+Raises JsonRpcTimeoutError on timeout or EOF.
 Supports collecting pre-initialize noise for STDIO integrity checks.
+Messages are encoded/decoded with the process-wide JsonCodec (orjson when installed).
+The initialize handshake is memoized, so one client can be shared by several checks.
+Each answered request records its latency into the running check's timing.
+With a SessionTranscript, every message written and every frame read is recorded.
 """
-import json
 import asyncio
-from typing import Optional
+import itertools
+import logging
+import time
+from typing import Callable, Optional
 
 from infrastructure.errors import JsonRpcTimeoutError, JsonRpcProtocolError
+from infrastructure.framing import DEFAULT_MAX_MESSAGE_BYTES, NdjsonFramer
+from infrastructure.json_codec import JsonCodec, get_codec
+from infrastructure.timing import record_rpc
+from infrastructure.transcript import SessionTranscript
+
+log = logging.getLogger(__name__)
+
+NotificationHandler = Callable[[dict], None]
+
+
+def build_initialize_request(request_id: int) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "qa-check", "version": "0.1.0"},
+        },
+    }
+
 
 class JsonRpcClient:
-    """Async JSON-RPC client over stdio with request-id matching and timeouts."""
-    def __init__(self, stdin: asyncio.StreamWriter, stdout: asyncio.StreamReader, timeout_sec: int):
+    """Async JSON-RPC client over stdio with a response dispatcher, request-id matching and timeouts."""
+    def __init__(
+        self,
+        stdin: asyncio.StreamWriter,
+        stdout: asyncio.StreamReader,
+        timeout_sec: int,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+        codec: JsonCodec | None = None,
+        transcript: SessionTranscript | None = None,
+    ):
         self._stdin = stdin
-        self._stdout = stdout
+        self._transcript = transcript
+        self._codec = codec or get_codec()
+        self._framer = NdjsonFramer(stdout, max_message_bytes=max_message_bytes)
         self._timeout = timeout_sec
         self._closed = False
 
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._subscribers: list[NotificationHandler] = []
+        self._noise_collectors: list[list[str]] = []
+        self._reader_task: Optional[asyncio.Task] = None
+        self._reader_error: Optional[Exception] = None
+
+        self._init_lock = asyncio.Lock()
+        self._init_result: tuple[dict, list[str]] | None = None
+
     async def close(self) -> None:
         if self._closed:
             return
@@ -30,33 +84,76 @@ class JsonRpcClient:
         except Exception:
             pass
 
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass
+            self._reader_task = None
+
+        self._fail_pending(lambda rid: JsonRpcProtocolError(f"Client closed before response id={rid}"))
+
+    def subscribe(self, handler: NotificationHandler) -> Callable[[], None]:
+        """
+        Registers a handler for messages that carry a 'method' (notifications and
+        server-initiated requests). Returns a callable that unsubscribes it.
+        """
+        self._subscribers.append(handler)
+
+        def unsubscribe() -> None:
+            if handler in self._subscribers:
+                self._subscribers.remove(handler)
+
+        return unsubscribe
+
     async def initialize(self) -> dict | None:
-        data, _ = await self._request_with_optional_noise(self._init_msg(), expected_id=1, collect_noise=False)
+        data, _ = await self._initialize_once()
         return data
 
     async def initialize_collect_noise(self) -> tuple[dict | None, list[str]]:
-        return await self._request_with_optional_noise(self._init_msg(), expected_id=1, collect_noise=True)
+        return await self._initialize_once()
 
-    async def call(self, method: str, request_id: int, params: dict | None = None) -> dict | None:
+    async def _initialize_once(self) -> tuple[dict | None, list[str]]:
+        # The handshake runs once per process; later callers get the recorded response
+        # (and the noise seen before it), so a shared session is never re-initialized.
+        async with self._init_lock:
+            if self._init_result is not None:
+                data, noise = self._init_result
+                return data, list(noise)
+
+            msg = build_initialize_request(self._next_id())
+            data, noise = await self._request_with_optional_noise(msg, expected_id=msg["id"], collect_noise=True)
+            if data and "result" in data:
+                self._init_result = (data, noise)
+            return data, noise
+
+    async def request(self, method: str, params: dict | None = None) -> dict | None:
+        """Sends a request under a client-allocated id; the response carries that id."""
+        return await self.call(method, params=params)
+
+    async def call(self, method: str, request_id: int | None = None, params: dict | None = None) -> dict | None:
+        if request_id is None:
+            request_id = self._next_id()
         msg = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
         data, _ = await self._request_with_optional_noise(msg, expected_id=request_id, collect_noise=False)
         return data
 
-    def _init_msg(self) -> dict:
-        return {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "qa-check", "version": "0.1.0"},
-            },
-        }
+    def _next_id(self) -> int:
+        # Skip ids a caller pinned explicitly and that are still awaiting a response
+        while True:
+            request_id = next(self._ids)
+            if request_id not in self._pending:
+                return request_id
 
     async def _write_json(self, msg: dict) -> None:
         try:
-            self._stdin.write(json.dumps(msg).encode("utf-8") + b"\n")
+            payload = self._codec.dumps(msg) + b"\n"
+            if self._transcript is not None:
+                self._transcript.sent(payload)
+            self._stdin.write(payload)
             await self._stdin.drain()
         except Exception as e:
             raise JsonRpcProtocolError(f"Failed writing JSON-RPC request: {e}") from e
@@ -67,40 +164,94 @@ class JsonRpcClient:
         expected_id: int,
         collect_noise: bool,
     ) -> tuple[dict | None, list[str]]:
-        await self._write_json(msg)
+        if self._reader_error is not None:
+            raise type(self._reader_error)(f"{self._reader_error} (request id={expected_id})")
+        if expected_id in self._pending:
+            raise JsonRpcProtocolError(f"Request id={expected_id} is already in flight")
+
+        self._ensure_reader()
 
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[expected_id] = future
         noise: list[str] = []
+        if collect_noise:
+            self._noise_collectors.append(noise)
 
         try:
+            started = time.perf_counter()
+            await self._write_json(msg)
             async with asyncio.timeout(self._timeout):
-                while True:
-                    # 1. Await the bytes FIRST. 
-                    # This ensures the coroutine is finished before we touch the data.
-                    line_bytes = await self._stdout.readline()
-                    
-                    if not line_bytes:
-                        raise JsonRpcTimeoutError(f"EOF reached before response id={expected_id}")
-
-                    # 2. Decode bytes to string separately
-                    line_str = line_bytes.decode("utf-8", errors="replace")
-                    
-                    # 3. Strip whitespace from the string
-                    s = line_str.strip()
-                    
-                    if not s:
-                        continue
-
-                    try:
-                        data = json.loads(s)
-                    except json.JSONDecodeError:
-                        if collect_noise:
-                            noise.append(s)
-                        continue
-                        
-                    # Accept only the response that matches our request ID
-                    if data.get("jsonrpc") == "2.0" and data.get("id") == expected_id:
-                        if "result" in data or "error" in data:
-                            return data, noise
+                data = await future
+            record_rpc(msg["method"], (time.perf_counter() - started) * 1000)
+            return data, noise
 
         except asyncio.TimeoutError:
-            raise JsonRpcTimeoutError(f"Timeout waiting for JSON-RPC response id={expected_id}")
\ No newline at end of file
+            raise JsonRpcTimeoutError(f"Timeout waiting for JSON-RPC response id={expected_id}")
+        finally:
+            if self._pending.get(expected_id) is future:
+                del self._pending[expected_id]
+            if collect_noise:
+                self._noise_collectors.remove(noise)
+
+    def _ensure_reader(self) -> None:
+        if self._reader_task is None:
+            self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        """Sole consumer of stdout: decodes frames and dispatches them until EOF."""
+        try:
+            while True:
+                frame = await self._framer.next_frame()
+                if frame is None:
+                    break
+
+                try:
+                    data = self._codec.loads(frame)
+                except ValueError:
+                    data = None
+                if self._transcript is not None:
+                    self._transcript.received(frame, is_json=data is not None)
+
+                if not isinstance(data, dict):
+                    if self._noise_collectors:
+                        text = frame.tobytes().decode("utf-8", errors="replace")
+                        for collector in self._noise_collectors:
+                            collector.append(text)
+                    continue
+
+                self._dispatch(data)
+
+            self._reader_error = JsonRpcTimeoutError("EOF reached before response")
+            self._fail_pending(lambda rid: JsonRpcTimeoutError(f"EOF reached before response id={rid}"))
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # e is unbound when the except block ends; the callback keeps only its text
+            msg = str(e)
+            self._reader_error = JsonRpcProtocolError(f"Failed reading JSON-RPC stream: {msg}")
+            self._fail_pending(lambda rid: JsonRpcProtocolError(f"Failed reading response id={rid}: {msg}"))
+
+    def _dispatch(self, data: dict) -> None:
+        if "method" in data:
+            for handler in list(self._subscribers):
+                try:
+                    handler(data)
+                except Exception:
+                    log.exception("Notification handler failed for method=%s", data.get("method"))
+            return
+
+        # Accept only well-formed responses; route them to the request that is waiting
+        if data.get("jsonrpc") != "2.0" or ("result" not in data and "error" not in data):
+            return
+
+        future = self._pending.get(data.get("id"))
+        if future is None or future.done():
+            log.debug("Dropping JSON-RPC response with no pending request (id=%s)", data.get("id"))
+            return
+        future.set_result(data)
+
+    def _fail_pending(self, make_error: Callable[[int], Exception]) -> None:
+        for rid, future in list(self._pending.items()):
+            if not future.done():
+                future.set_exception(make_error(rid))
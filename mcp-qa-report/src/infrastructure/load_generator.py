@@ -0,0 +1,94 @@
+"""
+Open-loop (constant-rate) load generator for JSON-RPC methods.
+
+Requests go out on a fixed schedule (start + i / rate) whether or not earlier ones
+have been answered, so a slow server builds up a queue instead of silently slowing
+the generator down. Latency is measured from each request's *intended* send time,
+which corrects for coordinated omission: if the generator itself falls behind, that
+delay is charged to the request rather than hidden. Timed-out requests are recorded
+at their elapsed time too, so the tail stays honest.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from infrastructure.errors import JsonRpcTimeoutError
+from infrastructure.jsonrpc_client import JsonRpcClient
+from infrastructure.stats import LatencyHistogram
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class OpenLoopResult:
+    target_rps: float
+    duration_sec: float
+    sent: int
+    completed: int
+    errors: int
+    timeouts: int
+    max_send_lag_ms: float        # worst gap between intended and actual send time
+    histogram: LatencyHistogram
+
+    @property
+    def achieved_rps(self) -> float:
+        return self.completed / self.duration_sec if self.duration_sec > 0 else 0.0
+
+
+async def run_open_loop(
+    client: JsonRpcClient,
+    method: str,
+    params: dict | None,
+    rate_rps: float,
+    duration_sec: float,
+) -> OpenLoopResult:
+    if rate_rps <= 0 or duration_sec <= 0:
+        raise ValueError("rate_rps and duration_sec must be > 0")
+
+    loop = asyncio.get_running_loop()
+    histogram = LatencyHistogram()
+    total = max(1, int(rate_rps * duration_sec))
+    counts = {"completed": 0, "errors": 0, "timeouts": 0}
+    max_lag = 0.0
+
+    async def send(intended: float) -> None:
+        try:
+            resp = await client.request(method, params)
+        except JsonRpcTimeoutError:
+            counts["timeouts"] += 1
+        else:
+            if resp and "result" in resp and not resp["result"].get("isError"):
+                counts["completed"] += 1
+            else:
+                counts["errors"] += 1
+        histogram.record((loop.time() - intended) * 1000)
+
+    start = loop.time()
+    tasks = []
+    try:
+        for i in range(total):
+            intended = start + i / rate_rps
+            delay = intended - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            max_lag = max(max_lag, (loop.time() - intended) * 1000)
+            tasks.append(asyncio.create_task(send(intended)))
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return OpenLoopResult(
+        target_rps=rate_rps,
+        duration_sec=loop.time() - start,
+        sent=total,
+        completed=counts["completed"],
+        errors=counts["errors"],
+        timeouts=counts["timeouts"],
+        max_send_lag_ms=max_lag,
+        histogram=histogram,
+    )
@@ -0,0 +1,174 @@
+"""
+Resource sampling of a process tree from /proc (Linux).
+
+A target server may be a launcher (`uv run`, `npm`) with the real server as a child,
+so samples sum RSS, open file descriptors and threads over the whole tree.
+UsageTracker accumulates CPU time, peak RSS, context switches and I/O of a tree over
+a server's lifetime; the exit totals wait4 reports (any POSIX host) complete it.
+Everything else returns None where /proc is unavailable or the process is gone.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass, replace
+
+from domain.models import ResourceUsage
+
+PROC = "/proc"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+# ru_maxrss is in bytes on macOS, KiB elsewhere
+MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True)
+class ProcSample:
+    rss_bytes: int
+    fds: int
+    threads: int
+    processes: int
+
+
+def proc_available() -> bool:
+    return os.path.isdir(os.path.join(PROC, "self", "fd"))
+
+
+def process_tree(pid: int) -> list[int]:
+    """pid followed by all of its descendants."""
+    tree, stack = [], [pid]
+    parents: dict[int, list[int]] | None = None
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        children = _children(current)
+        if children is None:
+            # Kernel without /proc/<pid>/task/<tid>/children: build the map from stat once
+            parents = _parent_map() if parents is None else parents
+            children = parents.get(current, [])
+        stack.extend(children)
+    return tree
+
+
+def sample_tree(pid: int) -> ProcSample | None:
+    rss = fds = threads = processes = 0
+    for p in process_tree(pid):
+        try:
+            with open(os.path.join(PROC, str(p), "statm")) as f:
+                rss += int(f.read().split()[1]) * _PAGE_SIZE
+            fds += len(os.listdir(os.path.join(PROC, str(p), "fd")))
+            threads += len(os.listdir(os.path.join(PROC, str(p), "task")))
+            processes += 1
+        except (OSError, ValueError, IndexError):
+            continue
+    return ProcSample(rss, fds, threads, processes) if processes else None
+
+
+def read_usage(pid: int) -> ResourceUsage | None:
+    """Cumulative usage of a single process (no descendants); None once it is gone."""
+    base = os.path.join(PROC, str(pid))
+    try:
+        with open(os.path.join(base, "stat")) as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(os.path.join(base, "status")) as f:
+            status = dict(line.split(":", 1) for line in f if ":" in line)
+    except (OSError, IndexError, ValueError):
+        return None
+    try:
+        with open(os.path.join(base, "io")) as f:
+            io = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        io = {}
+
+    def number(table: dict[str, str], key: str) -> int:
+        try:
+            return int(table.get(key, "0").split()[0])
+        except (ValueError, IndexError):
+            return 0
+
+    # stat fields 14/15 (utime/stime, clock ticks) sit at 11/12 after the comm field
+    return ResourceUsage(
+        cpu_user_sec=int(fields[11]) / _CLK_TCK,
+        cpu_system_sec=int(fields[12]) / _CLK_TCK,
+        peak_rss_bytes=number(status, "VmHWM") * 1024,
+        voluntary_switches=number(status, "voluntary_ctxt_switches"),
+        involuntary_switches=number(status, "nonvoluntary_ctxt_switches"),
+        read_bytes=number(io, "rchar"),
+        write_bytes=number(io, "wchar"),
+    )
+
+
+def rusage_usage(rusage, maxrss_unit: int = MAXRSS_UNIT) -> ResourceUsage:
+    """ResourceUsage from a wait4()/getrusage() result."""
+    return ResourceUsage(
+        cpu_user_sec=rusage.ru_utime,
+        cpu_system_sec=rusage.ru_stime,
+        peak_rss_bytes=rusage.ru_maxrss * maxrss_unit,
+        voluntary_switches=rusage.ru_nvcsw,
+        involuntary_switches=rusage.ru_nivcsw,
+    )
+
+
+class UsageTracker:
+    """
+    Lifetime usage of one server's process tree. Every sample keeps the latest counters
+    of each process seen, so members that exit between samples still count; the peak
+    RSS is the sum of the members' high-water marks (an upper bound for the tree).
+    """
+    def __init__(self, pid: int):
+        self.pid = pid
+        self._seen: dict[int, ResourceUsage] = {}
+
+    def sample(self) -> None:
+        for p in process_tree(self.pid):
+            usage = read_usage(p)
+            if usage is not None:
+                self._seen[p] = usage
+
+    def record_exit(self, pid: int, final: ResourceUsage) -> None:
+        """Final counters from wait4(); keeps the I/O totals /proc last reported."""
+        last = self._seen.get(pid)
+        if last is not None:
+            final = replace(final, read_bytes=last.read_bytes, write_bytes=last.write_bytes)
+        self._seen[pid] = final
+
+    def total(self) -> ResourceUsage | None:
+        if not self._seen:
+            return None
+        total = ResourceUsage()
+        for usage in self._seen.values():
+            total = replace(total.plus(usage), peak_rss_bytes=total.peak_rss_bytes + usage.peak_rss_bytes)
+        return total
+
+
+def _children(pid: int) -> list[int] | None:
+    task_dir = os.path.join(PROC, str(pid), "task")
+    try:
+        tids = os.listdir(task_dir)
+    except OSError:
+        return []
+    children: list[int] = []
+    for tid in tids:
+        try:
+            with open(os.path.join(task_dir, tid, "children")) as f:
+                children.extend(int(c) for c in f.read().split())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            continue
+    return children
+
+
+def _parent_map() -> dict[int, list[int]]:
+    parents: dict[int, list[int]] = {}
+    for entry in os.listdir(PROC):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(PROC, entry, "stat")) as f:
+                # comm (field 2) may contain spaces; ppid follows the closing paren
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        parents.setdefault(ppid, []).append(int(entry))
+    return parents
@@ -3,47 +3,236 @@ Subprocess runner for stdio-based MCP servers.
 
 Starts a target MCP server as a subprocess, wires stdin/stdout for JSON-RPC,
 drains stderr in an async task (avoids blocking), and exposes a stderr tail for debugging.
+On POSIX the server is reaped with wait4, which gives its exact lifetime totals (shutdown
+included); where /proc is available its process tree is also sampled while it runs (and
+once more just before teardown), so `usage` covers what the whole tree cost to host.
+Optional ResourceLimits are applied in the child before it execs; `usage.limits_hit`
+names any limit the server's exit shows it ran into, `usage.limit_notes` any its stderr
+merely hints at.
+With a TranscriptRecorder, the server's stderr lines and its start/exit go to the
+session transcript (the JSON-RPC client records stdin/stdout into the same one).
+On POSIX the server leads its own session, so teardown reaches everything it started
+(`uv run` / `npm run start` wrappers leave the real server as a grandchild).
 """
 import os
 import logging
+import signal
+import subprocess
+import time
 from pathlib import Path
 import asyncio
 from collections import deque
-from typing import Optional
+from dataclasses import replace
+from typing import Awaitable, Callable, Optional
+
+from domain.models import ResourceUsage
+from infrastructure.proc_stats import UsageTracker, proc_available, rusage_usage
+from infrastructure.rlimits import ResourceLimits, diagnose
+from infrastructure.transcript import SessionTranscript, TranscriptRecorder
 
 log = logging.getLogger(__name__)
 
+DEFAULT_TERM_GRACE_SEC = 1.0
+DEFAULT_KILL_GRACE_SEC = 1.0
+_GROUP_POLL_SEC = 0.01
+USAGE_SAMPLE_INTERVAL_SEC = 0.5
+# After the server exits its stderr reaches EOF at once; only lingering grandchildren hold it open
+STDERR_DRAIN_SEC = 0.2
+OWN_PROCESS_GROUP = os.name == "posix"
+# Reaping ourselves (instead of asyncio's child watcher) is what keeps the rusage
+REAP_WITH_WAIT4 = hasattr(os, "wait4")
+_REAP_INTERVAL_SEC = 0.005
+
+
+def build_process_env(project_path: str, extra: dict[str, str] | None = None) -> dict[str, str]:
+    """Environment for a target server: ours, plus <project>/src on PYTHONPATH and any overrides."""
+    env = os.environ.copy()
+    src_dir = Path(project_path) / "src"
+    if src_dir.exists():
+        existing = env.get("PYTHONPATH", "")
+        env["PYTHONPATH"] = str(src_dir) + (os.pathsep + existing if existing else "")
+    if extra:
+        env.update(extra)
+    return env
+
+
+def _signal_group(pgid: int, sig: int) -> bool:
+    """Sends sig to a process group; False when no member is left."""
+    try:
+        os.killpg(pgid, sig)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Members that changed credentials; nothing more we can do for them
+        return False
+
+
+async def stop_process_group(
+    pgid: int,
+    wait_leader: Callable[[float], Awaitable[bool]],
+    term_grace_sec: float = DEFAULT_TERM_GRACE_SEC,
+    kill_grace_sec: float = DEFAULT_KILL_GRACE_SEC,
+) -> None:
+    """
+    SIGTERMs the whole group, gives it term_grace_sec to exit, then SIGKILLs whatever is
+    left. wait_leader(timeout) reaps the group leader (our child) and reports whether it
+    exited; grandchildren are polled through the group itself.
+    """
+    deadline = time.monotonic() + term_grace_sec
+    if _signal_group(pgid, signal.SIGTERM):
+        await wait_leader(term_grace_sec)
+        while _signal_group(pgid, 0) and time.monotonic() < deadline:
+            await asyncio.sleep(_GROUP_POLL_SEC)
+    if _signal_group(pgid, signal.SIGKILL):
+        log.debug("Killing process group %s (terminate grace expired)", pgid)
+    await wait_leader(kill_grace_sec)
+
+
+class ReapedProcess:
+    """
+    asyncio.subprocess.Process look-alike for a Popen child on our own pipes, reaped with
+    wait4 so its resource usage survives the exit. returncode polls (WNOHANG).
+    """
+    def __init__(self, popen: subprocess.Popen, stdin, stdout, stderr, transports):
+        self._popen = popen
+        self.pid = popen.pid
+        self.stdin: asyncio.StreamWriter = stdin
+        self.stdout: asyncio.StreamReader = stdout
+        self.stderr: asyncio.StreamReader = stderr
+        self.rusage = None
+        self._returncode: int | None = None
+        self._transports = transports
+
+    @property
+    def returncode(self) -> int | None:
+        if self._returncode is None:
+            try:
+                pid, status, rusage = os.wait4(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                self._returncode = -1
+            else:
+                if pid:
+                    self._returncode = os.waitstatus_to_exitcode(status)
+                    self.rusage = rusage
+            if self._returncode is not None:
+                # Popen must not try (and warn about) reaping it again
+                self._popen.returncode = self._returncode
+        return self._returncode
+
+    async def wait(self) -> int:
+        while self.returncode is None:
+            await asyncio.sleep(_REAP_INTERVAL_SEC)
+        return self._returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+    def close_pipes(self) -> None:
+        for transport in self._transports:
+            transport.close()
+        self._transports = []
+
+
+async def spawn_process(*command: str, cwd: str, env: dict[str, str], **popen_kwargs) -> asyncio.subprocess.Process | ReapedProcess:
+    """Starts command with piped stdio: a ReapedProcess where wait4 exists, else an asyncio Process."""
+    if not REAP_WITH_WAIT4:
+        return await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **popen_kwargs,
+        )
+
+    in_r, in_w = os.pipe()
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        popen = subprocess.Popen(command, cwd=cwd, env=env, stdin=in_r, stdout=out_w, stderr=err_w, **popen_kwargs)
+    except BaseException:
+        for fd in (in_w, out_r, err_r):
+            os.close(fd)
+        raise
+    finally:
+        for fd in (in_r, out_w, err_w):
+            os.close(fd)
+
+    loop = asyncio.get_running_loop()
+    transports = []
+
+    async def reader(fd: int) -> asyncio.StreamReader:
+        stream = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(stream), os.fdopen(fd, "rb", buffering=0))
+        transports.append(transport)
+        return stream
+
+    stdout = await reader(out_r)
+    stderr = await reader(err_r)
+    transport, protocol = await loop.connect_write_pipe(
+        lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+        os.fdopen(in_w, "wb", buffering=0),
+    )
+    transports.append(transport)
+    stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+    return ReapedProcess(popen, stdin, stdout, stderr, transports)
+
+
 class MCPProcessRunner:
     """Manages lifecycle of a subprocess MCP server (stdio), including async stderr draining."""
-    def __init__(self, command: list[str], project_path: str):
+    def __init__(
+        self,
+        command: list[str],
+        project_path: str,
+        env: dict[str, str] | None = None,
+        term_grace_sec: float = DEFAULT_TERM_GRACE_SEC,
+        kill_grace_sec: float = DEFAULT_KILL_GRACE_SEC,
+        limits: ResourceLimits | None = None,
+        transcripts: TranscriptRecorder | None = None,
+    ):
         self._command = command
         self._project_path = project_path
-        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._env = env
+        self._term_grace = term_grace_sec
+        self._kill_grace = kill_grace_sec
+        self._limits = limits or None
+        self._transcripts = transcripts
+        self._transcript: SessionTranscript | None = None
+        self._final_returncode: int | None = None
+        self._killed_by_us = False
+        self._proc: Optional[asyncio.subprocess.Process | ReapedProcess] = None
 
         self._stderr_lines = deque(maxlen=200)
         self._stderr_task: Optional[asyncio.Task] = None
+        self._usage: UsageTracker | None = None
+        self._usage_task: Optional[asyncio.Task] = None
 
     async def start(self) -> None:
         if self._proc is not None:
             if self._proc.returncode is None:
                 return
 
-        cwd = Path(self._project_path)
-
-        env = os.environ.copy()
-        src_dir = cwd / "src"
-        if src_dir.exists():
-            existing = env.get("PYTHONPATH", "")
-            env["PYTHONPATH"] = str(src_dir) + (os.pathsep + existing if existing else "")
+        env = build_process_env(self._project_path, self._env)
 
         try:
-            self._proc = await asyncio.create_subprocess_exec(
+            self._proc = await spawn_process(
                 *self._command,
                 cwd=self._project_path,
                 env=env,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                start_new_session=OWN_PROCESS_GROUP,
+                preexec_fn=self._limits.apply if self._limits else None,
             )
         except Exception:
             log.exception(
@@ -53,6 +242,8 @@ class MCPProcessRunner:
             )
             raise
 
+        self._killed_by_us = False
+
         log.debug(
             "MCPProcessRunner started pid=%s cwd=%s command=%s",
             self._proc.pid,
@@ -63,6 +254,40 @@ class MCPProcessRunner:
         if self._proc.stderr is not None:
             # Non-blocking drain of stderr to capture server logs without stalling the event loop
             self._stderr_task = asyncio.create_task(self._drain_stderr(self._proc.stderr))
+        self._open_transcript(self._proc.pid)
+        self._start_accounting(self._proc.pid)
+
+    def _open_transcript(self, pid: int) -> None:
+        if self._transcripts is not None:
+            self._transcript = self._transcripts.open_session(self._project_path, self._command, pid)
+
+    def _close_transcript(self, returncode: int | None) -> None:
+        if self._transcript is not None:
+            self._transcript.close(returncode)
+
+    def _start_accounting(self, pid: int) -> None:
+        # The exit totals come from wait4; /proc (when there is one) adds the tree while it runs
+        self._usage = UsageTracker(pid)
+        if proc_available():
+            self._usage.sample()
+            self._usage_task = asyncio.create_task(self._sample_usage_loop())
+
+    async def _sample_usage_loop(self) -> None:
+        while True:
+            await asyncio.sleep(USAGE_SAMPLE_INTERVAL_SEC)
+            self.sample_usage()
+
+    def sample_usage(self) -> ResourceUsage | None:
+        """Refreshes and returns the server's usage so far (None without /proc)."""
+        if self._usage_task is not None and self.is_running:
+            self._usage.sample()
+        return self.usage
+
+    async def _stop_accounting(self) -> None:
+        if self._usage_task is not None:
+            self._usage_task.cancel()
+            await asyncio.gather(self._usage_task, return_exceptions=True)
+            self._usage_task = None
 
     async def _drain_stderr(self, stderr: asyncio.StreamReader) -> None:
         try:
@@ -70,10 +295,56 @@ class MCPProcessRunner:
                 line = await stderr.readline()
                 if not line:
                     break
-                self._stderr_lines.append(line.decode("utf-8", errors="replace").rstrip("\n"))
+                text = line.decode("utf-8", errors="replace").rstrip("\n")
+                self._stderr_lines.append(text)
+                if self._transcript is not None:
+                    self._transcript.stderr(text)
         except Exception:
             pass
 
+    @property
+    def pid(self) -> int | None:
+        return self._proc.pid if self._proc is not None else None
+
+    @property
+    def is_running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    def _returncode_now(self) -> int | None:
+        return self._proc.returncode if self._proc is not None else self._final_returncode
+
+    @property
+    def limits_hit(self) -> tuple[str, ...]:
+        return self._diagnose_limits()[0]
+
+    def _diagnose_limits(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        if not self._limits:
+            return (), ()
+        tracked = self._usage.total() if self._usage is not None else None
+        return diagnose(
+            self._limits,
+            self._returncode_now(),
+            "\n".join(self._stderr_lines),
+            cpu_sec=tracked.cpu_sec if tracked is not None else None,
+            killed_by_us=self._killed_by_us,
+        )
+
+    @property
+    def usage(self) -> ResourceUsage | None:
+        """Lifetime usage of the server's process tree; still readable after terminate()."""
+        if self._proc is not None and self._proc.returncode is not None:
+            self._record_exit(self._proc)
+        total = self._usage.total() if self._usage is not None else None
+        hits, notes = self._diagnose_limits()
+        if hits or notes:
+            total = replace(total or ResourceUsage(), limits_hit=hits, limit_notes=notes)
+        return total
+
+    @property
+    def transcript(self) -> SessionTranscript | None:
+        """Transcript of the current (or last) server session, when recording is enabled."""
+        return self._transcript
+
     @property
     def stderr_tail(self) -> str:
         return "\n".join(list(self._stderr_lines)[-20:])
@@ -95,6 +366,9 @@ class MCPProcessRunner:
 
         log.debug("MCPProcessRunner terminating pid=%s", proc.pid)
 
+        # Last look while the tree is still alive: it exits as soon as stdin closes
+        self.sample_usage()
+        self._killed_by_us = proc.returncode is None
         try:
             if proc.stdin is not None:
                 try:
@@ -103,20 +377,22 @@ class MCPProcessRunner:
                 except Exception:
                     pass
 
-            if proc.returncode is None:
+            if OWN_PROCESS_GROUP:
+                await stop_process_group(proc.pid, self._wait_proc, self._term_grace, self._kill_grace)
+            elif proc.returncode is None:
                 proc.terminate()
-                try:
-                    await asyncio.wait_for(proc.wait(), timeout=1.0)
-                except asyncio.TimeoutError:
+                if not await self._wait_proc(self._term_grace):
                     log.debug("MCPProcessRunner kill pid=%s (terminate timeout)", proc.pid)
                     proc.kill()
-                    try:
-                        await asyncio.wait_for(proc.wait(), timeout=1.0)
-                    except Exception:
-                        pass
+                    await self._wait_proc(self._kill_grace)
 
         finally:
+            self._final_returncode = proc.returncode
+            self._record_exit(proc)
+            await self._stop_accounting()
             if self._stderr_task is not None:
+                # Keep the last words (e.g. why it died) before giving up on the pipe
+                await asyncio.wait({self._stderr_task}, timeout=STDERR_DRAIN_SEC)
                 try:
                     self._stderr_task.cancel()
                     await self._stderr_task
@@ -126,8 +402,40 @@ class MCPProcessRunner:
                     pass
                 self._stderr_task = None
 
+            self._close_transcript(self._final_returncode)
+            if isinstance(proc, ReapedProcess):
+                proc.close_pipes()
             self._proc = None
 
+    def _record_exit(self, proc) -> None:
+        rusage = getattr(proc, "rusage", None)
+        if rusage is not None and self._usage is not None:
+            self._usage.record_exit(proc.pid, rusage_usage(rusage))
+
+    async def settle(self, timeout: float = 0.5) -> None:
+        """If the server closed stdout (it is dying), waits briefly for its exit and last stderr lines."""
+        if not self.is_running and self._stderr_task is None:
+            return
+        try:
+            at_eof = self.stdout.at_eof()
+        except AssertionError:
+            return
+        if not at_eof:
+            return
+        await self._wait_proc(timeout)
+        if self._stderr_task is not None:
+            await asyncio.wait({self._stderr_task}, timeout=timeout)
+
+    async def _wait_proc(self, timeout: float) -> bool:
+        proc = self._proc
+        if proc is None:
+            return True
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def __aenter__(self) -> "MCPProcessRunner":
         await self.start()
         return self
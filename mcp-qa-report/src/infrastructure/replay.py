@@ -0,0 +1,268 @@
+"""
+Replay of recorded session transcripts as a stand-in MCP server.
+
+ReplayScript indexes a transcript (see transcript.py): every recorded request is keyed
+by method and params and maps to the response it got, the frames (notifications, noise)
+that arrived while it was outstanding, and its recorded latency. Output seen before the
+first request and the server's stderr lines are kept too.
+
+ReplayServerRunner stands in for MCPProcessRunner without starting a process: requests
+written to its stdin are answered on its stdout with the recorded response under the
+request's own id, at once or after the recorded latency. A request recorded several
+times is answered in recorded order (the last answer then repeats); params never seen
+fall back to the last recording of the method; an unknown method gets a JSON-RPC
+"Method not found" error. ReplayRunnerFactory plugs it into
+ExecutionContext.runner_factory, so checks run against a transcript offline.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable
+
+from infrastructure.framing import DEFAULT_MAX_MESSAGE_BYTES
+from infrastructure.json_codec import JsonCodec, get_codec
+from infrastructure.process_runner import MCPProcessRunner
+from infrastructure.runner_factory import RunnerFactory
+from infrastructure.transcript import read_transcript
+
+log = logging.getLogger(__name__)
+
+METHOD_NOT_FOUND = -32601
+
+
+def request_key(method: str, params: dict | None) -> str:
+    # The client sends {} for "no params"; key order never matters
+    return method + "\0" + json.dumps(params or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass(frozen=True)
+class ReplayExchange:
+    response: dict
+    preamble: tuple[bytes, ...]   # encoded frames the server sent before the response
+    latency_sec: float
+
+
+class ReplayScript:
+    """Recorded exchanges of one server session, indexed for lookup by request."""
+    def __init__(
+        self,
+        exchanges: dict[str, list[ReplayExchange]],
+        by_method: dict[str, ReplayExchange],
+        banner: tuple[bytes, ...] = (),
+        stderr: tuple[str, ...] = (),
+    ):
+        self._exchanges = exchanges
+        self._by_method = by_method
+        self.banner = banner
+        self.stderr = stderr
+
+    @classmethod
+    def from_transcript(cls, path: str | os.PathLike, codec: JsonCodec | None = None) -> ReplayScript:
+        return cls.from_records(read_transcript(path, codec), codec)
+
+    @classmethod
+    def from_records(cls, records: list[dict], codec: JsonCodec | None = None) -> ReplayScript:
+        codec = codec or get_codec()
+        exchanges: dict[str, list[ReplayExchange]] = {}
+        by_method: dict[str, ReplayExchange] = {}
+        banner: list[bytes] = []
+        stderr: list[str] = []
+        outstanding: dict[object, tuple[str, str, float]] = {}
+        frames: list[bytes] = []
+        requested = False
+
+        for record in records:
+            direction = record.get("dir")
+            msg = record.get("msg")
+            if direction == "stderr":
+                stderr.append(record.get("text", ""))
+            elif direction == "send":
+                if isinstance(msg, dict) and "method" in msg and "id" in msg:
+                    outstanding[msg["id"]] = (request_key(msg["method"], msg.get("params")), msg["method"], record["t"])
+                    requested = True
+            elif direction == "recv":
+                if isinstance(msg, dict) and "method" not in msg and msg.get("id") in outstanding:
+                    key, method, sent_at = outstanding.pop(msg["id"])
+                    exchange = ReplayExchange(msg, tuple(frames), max(0.0, record["t"] - sent_at))
+                    exchanges.setdefault(key, []).append(exchange)
+                    by_method[method] = exchange
+                    frames = []
+                else:
+                    frame = codec.dumps(msg) if "msg" in record else record.get("text", "").encode("utf-8")
+                    (frames if requested else banner).append(frame)
+
+        return cls(exchanges, by_method, tuple(banner), tuple(stderr))
+
+    def lookup(self, method: str, params: dict | None, seen: Counter) -> ReplayExchange | None:
+        """The answer to this request; seen counts earlier lookups of the same session."""
+        key = request_key(method, params)
+        recorded = self._exchanges.get(key)
+        if not recorded:
+            return self._by_method.get(method)
+        index = min(seen[key], len(recorded) - 1)
+        seen[key] += 1
+        return recorded[index]
+
+
+class _ReplayStdin:
+    """Write end handed to the client: complete lines go to the replay server."""
+    def __init__(self, on_line: Callable[[bytes], None], on_close: Callable[[], None]):
+        self._buf = bytearray()
+        self._on_line = on_line
+        self._on_close = on_close
+        self._closed = False
+
+    def write(self, data: bytes) -> None:
+        if self._closed:
+            raise ConnectionResetError("Replay server stdin is closed")
+        self._buf += data
+        while (nl := self._buf.find(b"\n")) >= 0:
+            line = bytes(self._buf[:nl])
+            del self._buf[:nl + 1]
+            self._on_line(line)
+
+    async def drain(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+class ReplayServerRunner(MCPProcessRunner):
+    """MCPProcessRunner look-alike answering from a ReplayScript; no process is started."""
+    def __init__(
+        self,
+        script: ReplayScript,
+        command: list[str],
+        project_path: str,
+        env: dict[str, str] | None = None,
+        recorded_timing: bool = False,
+        codec: JsonCodec | None = None,
+    ):
+        super().__init__(command=command, project_path=project_path, env=env)
+        self._script = script
+        self._recorded_timing = recorded_timing
+        self._codec = codec or get_codec()
+        self._running = False
+        self._replay_stdin: _ReplayStdin | None = None
+        self._replay_stdout: asyncio.StreamReader | None = None
+        self._seen: Counter = Counter()
+        self._timers: set[asyncio.TimerHandle] = set()
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._final_returncode = None
+        self._seen = Counter()
+        self._replay_stdout = asyncio.StreamReader()
+        self._replay_stdin = _ReplayStdin(self._handle_line, self._finish)
+        self._stderr_lines.extend(self._script.stderr)
+        self._emit(self._script.banner)
+        log.debug("ReplayServerRunner started command=%s", self._command)
+
+    def _handle_line(self, line: bytes) -> None:
+        try:
+            msg = self._codec.loads(line)
+        except ValueError:
+            return
+        # Only requests get an answer; client notifications and responses are dropped
+        if not isinstance(msg, dict) or "method" not in msg or "id" not in msg:
+            return
+
+        exchange = self._script.lookup(msg["method"], msg.get("params"), self._seen)
+        if exchange is None:
+            error = {"code": METHOD_NOT_FOUND, "message": f"No recorded response for {msg['method']}"}
+            self._emit((self._codec.dumps({"jsonrpc": "2.0", "id": msg["id"], "error": error}),))
+            return
+
+        frames = (*exchange.preamble, self._codec.dumps({**exchange.response, "id": msg["id"]}))
+        if self._recorded_timing and exchange.latency_sec > 0:
+            self._emit_later(exchange.latency_sec, frames)
+        else:
+            self._emit(frames)
+
+    def _emit_later(self, delay: float, frames: tuple[bytes, ...]) -> None:
+        def fire() -> None:
+            self._timers.discard(handle)
+            self._emit(frames)
+
+        handle = asyncio.get_running_loop().call_later(delay, fire)
+        self._timers.add(handle)
+
+    def _emit(self, frames: tuple[bytes, ...]) -> None:
+        if self._running and self._replay_stdout is not None:
+            for frame in frames:
+                self._replay_stdout.feed_data(frame + b"\n")
+
+    def _finish(self) -> None:
+        # Like a server whose stdin closed: answers still pending are never sent
+        if not self._running:
+            return
+        self._running = False
+        self._final_returncode = 0
+        for handle in self._timers:
+            handle.cancel()
+        self._timers.clear()
+        if self._replay_stdout is not None:
+            self._replay_stdout.feed_eof()
+
+    @property
+    def pid(self) -> int | None:
+        return None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def _returncode_now(self) -> int | None:
+        return self._final_returncode
+
+    @property
+    def stdin(self) -> _ReplayStdin:
+        assert self._replay_stdin is not None
+        return self._replay_stdin
+
+    @property
+    def stdout(self) -> asyncio.StreamReader:
+        assert self._replay_stdout is not None
+        return self._replay_stdout
+
+    async def terminate(self) -> None:
+        self._finish()
+
+
+class ReplayRunnerFactory(RunnerFactory):
+    """
+    RunnerFactory whose sessions replay one recorded transcript instead of starting the
+    command. recorded_timing=True delays each answer by its recorded latency.
+    """
+    def __init__(
+        self,
+        script: ReplayScript,
+        recorded_timing: bool = False,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+    ):
+        super().__init__(max_message_bytes=max_message_bytes)
+        self._script = script
+        self._recorded_timing = recorded_timing
+
+    @classmethod
+    def from_transcript(cls, path: str | os.PathLike, **kwargs) -> ReplayRunnerFactory:
+        return cls(ReplayScript.from_transcript(path), **kwargs)
+
+    def _make_runner(self, command: list[str], project_path: str, env: dict[str, str] | None) -> MCPProcessRunner:
+        return ReplayServerRunner(self._script, command, project_path, env, recorded_timing=self._recorded_timing)
@@ -1,7 +1,8 @@
 """
 Writes QA report artifacts to disk asynchronously.
 
-Supports writing either to a specific file path or to a directory.
+Supports writing either to a specific file path or to a directory,
+and appending records to a file (used to stream batch results).
 Ensures output paths are resolved safely under the project root.
 Uses asyncio.to_thread for non-blocking file I/O.
 """
@@ -19,7 +20,7 @@ class WriteResult:
 def _timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%SZ")
 
-def _safe_resolve_under_project(project_path: str, output_path: str) -> Path:
+def safe_resolve_under_project(project_path: str, output_path: str) -> Path:
     root = Path(project_path).resolve()
     candidate = (root / output_path).resolve()
     if root != candidate and root not in candidate.parents:
@@ -29,6 +30,10 @@ def _safe_resolve_under_project(project_path: str, output_path: str) -> Path:
 def _write_text_sync(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
+def _append_text_sync(path: Path, content: str) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        f.write(content)
+
 def _mkdir_sync(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -43,7 +48,7 @@ async def write_report_files(
     text_content: str,
     json_content: str,
 ) -> WriteResult:
-    dir_path = _safe_resolve_under_project(project_path, output_dir)
+    dir_path = safe_resolve_under_project(project_path, output_dir)
     await asyncio.to_thread(_mkdir_sync, dir_path)
 
     suffix = f"_{_timestamp()}" if include_timestamp else ""
@@ -70,7 +75,18 @@ async def write_text_file(*, project_path: str, output_file: str, text_content:
     Blocks escaping outside project_path.
     Returns the written file path as string.
     """
-    p = _safe_resolve_under_project(project_path, output_file)
+    p = safe_resolve_under_project(project_path, output_file)
     await asyncio.to_thread(_mkdir_sync, p.parent)
     await asyncio.to_thread(_write_text_sync, p, text_content)
     return str(p)
+
+async def append_text_file(*, project_path: str, output_file: str, text_content: str) -> str:
+    """
+    Appends text_content to a file under project_path asynchronously (created if missing).
+    Blocks escaping outside project_path.
+    Returns the file path as string.
+    """
+    p = safe_resolve_under_project(project_path, output_file)
+    await asyncio.to_thread(_mkdir_sync, p.parent)
+    await asyncio.to_thread(_append_text_sync, p, text_content)
+    return str(p)
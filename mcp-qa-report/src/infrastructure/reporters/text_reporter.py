@@ -1,17 +1,25 @@
 """
 Renders QA results as a human-readable checklist.
 
-Each check is rendered on a single line with a status icon (PASS/WARN/FAIL),
-followed by a short summary footer.
+Each check is rendered on a single line with a status icon (PASS/WARN/FAIL/SKIP),
+its message and, when measured, its timing breakdown and the resources its servers
+used, followed by a short summary footer naming the slowest phases and heaviest
+servers. Batch runs render one line per project plus an aggregate footer.
 """
-import json
-from domain.models import CheckResult, CheckStatus
+from infrastructure.json_codec import get_codec
+from dataclasses import asdict
+
+from domain.models import CheckResult, CheckStatus, CheckTiming, ResourceUsage
 
 STATUS_ICON = {
     CheckStatus.PASS: "✅",
     CheckStatus.WARN: "⚠️",
     CheckStatus.FAIL: "❌",
+    CheckStatus.SKIP: "⏭️",
 }
+SLOWEST_PHASES = 3
+HEAVIEST_SERVERS = 3
+
 class TextReporter:
     """
     Renders a list of CheckResult objects as a plain-text checklist report.
@@ -23,32 +31,123 @@ class TextReporter:
             icon = STATUS_ICON[r.status]
             lines.append(f"{icon} {r.name}")
             lines.append(f"   ↳ {r.message}")
+            if r.timing is not None:
+                lines.append(f"   ⏱ {self._timing_line(r.timing)}")
+            if r.resources is not None:
+                lines.append(f"   ⚙ {self._resources_line(r.resources)}")
 
-        summary = self._summary(results)
-        return "\n".join(lines + ["", summary])
+        footer = [self._summary(results)]
+        slowest = self._slowest_phases(results)
+        if slowest:
+            footer.append("Slowest phases: " + "; ".join(
+                f"{p['check']}: {p['phase']} {p['ms']:.0f} ms" for p in slowest
+            ))
+        heaviest = self._heaviest_servers(results)
+        if heaviest:
+            footer.append("Heaviest servers: " + "; ".join(
+                f"{h['check']}: cpu {h['cpu_sec']:.2f} s, peak RSS {_size(h['peak_rss_bytes'])}" for h in heaviest
+            ))
+        return "\n".join(lines + [""] + footer)
 
     def to_json_obj(self, results: list[CheckResult]) -> dict:
+        results_obj = []
+        for r in results:
+            item = {
+                "name": r.name,
+                "status": r.status.name,
+                "message": r.message,
+            }
+            if r.timing is not None:
+                item["timing"] = self._timing_obj(r.timing)
+            if r.resources is not None:
+                item["resources"] = asdict(r.resources)
+            results_obj.append(item)
+
+        summary = self._summary_obj(results)
+        summary["slowest_phases"] = self._slowest_phases(results)
+        summary["heaviest_servers"] = self._heaviest_servers(results)
+        return {"summary": summary, "results": results_obj}
+
+    def render_json(self, results: list[CheckResult]) -> str:
+        return get_codec().dumps_pretty(self.to_json_obj(results))
+
+    def render_project_line(self, project_path: str, results: list[CheckResult], error: str | None = None) -> str:
+        if error is not None:
+            return f"{STATUS_ICON[CheckStatus.FAIL]} {project_path} — error: {error}"
+        s = self._summary_obj(results)
+        if s["failed"]:
+            status = CheckStatus.FAIL
+        elif s["warnings"]:
+            status = CheckStatus.WARN
+        else:
+            status = CheckStatus.PASS
+        return (
+            f"{STATUS_ICON[status]} {project_path} — "
+            f"{s['passed']} passed, {s['warnings']} warnings, {s['failed']} failed"
+        )
+
+    def render_batch_summary(self, projects: int, passed: int, warned: int, failed: int) -> str:
+        return f"Batch summary: {projects} projects — {passed} passed, {warned} with warnings, {failed} failed"
+
+    def _timing_line(self, t: CheckTiming) -> str:
+        phases = ", ".join(f"{name} {ms:.0f} ms" for name, ms in t.phases())
+        return f"{t.wall_ms:.0f} ms" + (f" — {phases}" if phases else "")
+
+    def _resources_line(self, u: ResourceUsage) -> str:
+        return (
+            f"cpu {u.cpu_sec:.2f} s (user {u.cpu_user_sec:.2f}, sys {u.cpu_system_sec:.2f}), "
+            f"peak RSS {_size(u.peak_rss_bytes)}, "
+            f"{u.voluntary_switches + u.involuntary_switches} ctx switches ({u.involuntary_switches} involuntary), "
+            f"I/O {_size(u.read_bytes)} read / {_size(u.write_bytes)} written"
+            + (" (shared server)" if u.shared else "")
+        )
+
+    def _timing_obj(self, t: CheckTiming) -> dict:
         return {
-            "summary": self._summary_obj(results),
-            "results": [
-                {
-                    "name": r.name,
-                    "status": r.status.name,
-                    "message": r.message,
-                }
-                for r in results
-            ],
+            "wall_ms": round(t.wall_ms, 3),
+            "spawn_ms": None if t.spawn_ms is None else round(t.spawn_ms, 3),
+            "initialize_ms": None if t.initialize_ms is None else round(t.initialize_ms, 3),
+            "rpc_ms": {
+                method: {"count": len(s), "total": round(sum(s), 3), "max": round(max(s), 3)}
+                for method, s in t.rpc_ms.items()
+            },
         }
 
-    def render_json(self, results: list[CheckResult]) -> str:
-        return json.dumps(self.to_json_obj(results), ensure_ascii=False, indent=2)
+    def _slowest_phases(self, results: list[CheckResult]) -> list[dict]:
+        phases = [
+            {"check": r.name, "phase": name, "ms": round(ms, 3)}
+            for r in results if r.timing is not None
+            for name, ms in r.timing.phases()
+        ]
+        phases.sort(key=lambda p: p["ms"], reverse=True)
+        return phases[:SLOWEST_PHASES]
+
+    def _heaviest_servers(self, results: list[CheckResult]) -> list[dict]:
+        heaviest = [
+            {"check": r.name, "cpu_sec": round(r.resources.cpu_sec, 3), "peak_rss_bytes": r.resources.peak_rss_bytes}
+            for r in results if r.resources is not None and r.resources.cpu_sec > 0
+        ]
+        heaviest.sort(key=lambda h: h["cpu_sec"], reverse=True)
+        return heaviest[:HEAVIEST_SERVERS]
 
     def _summary_obj(self, results: list[CheckResult]) -> dict:
         passed = sum(1 for r in results if r.status == CheckStatus.PASS)
         failed = sum(1 for r in results if r.status == CheckStatus.FAIL)
         warned = sum(1 for r in results if r.status == CheckStatus.WARN)
-        return {"passed": passed, "warnings": warned, "failed": failed}
+        skipped = sum(1 for r in results if r.status == CheckStatus.SKIP)
+        return {"passed": passed, "warnings": warned, "failed": failed, "skipped": skipped}
 
     def _summary(self, results: list[CheckResult]) -> str:
         s = self._summary_obj(results)
-        return f"Summary: {s['passed']} passed, {s['warnings']} warnings, {s['failed']} failed"
+        text = f"Summary: {s['passed']} passed, {s['warnings']} warnings, {s['failed']} failed"
+        if s["skipped"]:
+            text += f", {s['skipped']} skipped"
+        return text
+
+
+def _size(n: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
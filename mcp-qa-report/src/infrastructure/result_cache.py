@@ -0,0 +1,179 @@
+"""
+On-disk cache of QA results for unchanged projects.
+
+Entries live under <project>/.qa-report/cache as one JSON file per key. A key hashes
+a fast fingerprint of the project tree (relative path, mtime, size of every file, plus
+the content of lockfiles and MCP/package configs), the start command, the check list
+(name, version and configuration: thresholds, load tool, ...), the stop policy and the
+env-driven run settings that can change a verdict (timeout, rlimits, ...). Runs
+containing a FAIL are not stored, so transient failures never stick. Eviction drops
+entries older than max_age_sec and keeps at most max_entries, least recently used first.
+All file I/O runs in worker threads.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterable
+
+from domain.models import CheckResult, CheckStatus
+from infrastructure.reporters.report_writer import safe_resolve_under_project
+
+log = logging.getLogger(__name__)
+
+CACHE_SCHEMA = 1
+CACHE_DIR = os.path.join(".qa-report", "cache")
+
+# Directories that never influence how a server behaves (or that we write ourselves)
+IGNORED_DIRS = frozenset({
+    ".git", ".hg", ".svn", ".venv", "venv", "node_modules", "__pycache__",
+    ".qa-report", ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox", ".nox",
+})
+# Hashed by content as well: they decide dependencies and how the server is started
+CONTENT_HASHED = frozenset({
+    "uv.lock", "poetry.lock", "requirements.txt", "pyproject.toml", ".python-version",
+    "package.json", "package-lock.json", "pnpm-lock.yaml", "yarn.lock", "mcp.json",
+})
+
+
+def snapshot_tree(root: str) -> dict[str, tuple[int, int]]:
+    """Maps every relevant file under root (relative path) to (mtime_ns, size)."""
+    snapshot: dict[str, tuple[int, int]] = {}
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    st = entry.stat()
+                    snapshot[os.path.relpath(entry.path, root)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+    return snapshot
+
+
+def tree_digest(root: str, snapshot: dict[str, tuple[int, int]] | None = None) -> str:
+    snapshot = snapshot_tree(root) if snapshot is None else snapshot
+    h = hashlib.sha256()
+    for rel in sorted(snapshot):
+        mtime_ns, size = snapshot[rel]
+        h.update(f"{rel}\0{mtime_ns}\0{size}\n".encode("utf-8", errors="replace"))
+        if os.path.basename(rel) in CONTENT_HASHED:
+            try:
+                with open(os.path.join(root, rel), "rb") as f:
+                    h.update(hashlib.sha256(f.read()).digest())
+            except OSError:
+                pass
+    return h.hexdigest()
+
+
+def result_to_dict(result: CheckResult) -> dict:
+    return {"name": result.name, "status": result.status.value, "message": result.message}
+
+
+def result_from_dict(data: dict) -> CheckResult:
+    return CheckResult(name=data["name"], status=CheckStatus(data["status"]), message=data["message"])
+
+
+def check_config(check) -> str:
+    """A check's configuration (its instance attributes, i.e. constructor parameters) as stable JSON."""
+    return json.dumps(vars(check), sort_keys=True, default=repr)
+
+
+class ResultCache:
+    """Per-project cache of CheckResult lists keyed by project content and run configuration."""
+    def __init__(self, project_path: str, max_entries: int = 64, max_age_sec: float = 7 * 24 * 3600):
+        self._project_path = project_path
+        self._dir = safe_resolve_under_project(project_path, CACHE_DIR)
+        self._max_entries = max_entries
+        self._max_age = max_age_sec
+
+    async def key(
+        self,
+        command: list[str] | None,
+        checks: Iterable,
+        fail_fast: bool,
+        settings: dict | None = None,
+    ) -> str:
+        digest = await asyncio.to_thread(tree_digest, str(Path(self._project_path).resolve()))
+        material = {
+            "schema": CACHE_SCHEMA,
+            "tree": digest,
+            "command": command,
+            "checks": [[type(c).__name__, c.name, getattr(c, "version", 1), check_config(c)] for c in checks],
+            "fail_fast": fail_fast,
+            "settings": settings or {},
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> list[CheckResult] | None:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def put(self, key: str, results: list[CheckResult]) -> bool:
+        """Stores results unless any check failed. Returns True when stored."""
+        if any(r.status == CheckStatus.FAIL for r in results):
+            return False
+        await asyncio.to_thread(self._put_sync, key, results)
+        return True
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}.json"
+
+    def _get_sync(self, key: str) -> list[CheckResult] | None:
+        p = self._path(key)
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+            if data.get("schema") != CACHE_SCHEMA or time.time() - data.get("created", 0) > self._max_age:
+                return None
+            results = [result_from_dict(r) for r in data["results"]]
+            os.utime(p)  # LRU: a hit refreshes the entry
+            return results
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            log.debug("Ignoring unreadable cache entry %s", p, exc_info=True)
+            return None
+
+    def _put_sync(self, key: str, results: list[CheckResult]) -> None:
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "schema": CACHE_SCHEMA,
+                "created": time.time(),
+                "results": [result_to_dict(r) for r in results],
+            }
+            tmp = self._path(key).with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._path(key))
+            self._evict_sync()
+        except OSError:
+            log.debug("Failed writing cache entry under %s", self._dir, exc_info=True)
+
+    def _evict_sync(self) -> None:
+        now = time.time()
+        entries = []
+        for p in self._dir.glob("*.json"):
+            try:
+                mtime = p.stat().st_mtime
+            except OSError:
+                continue
+            if now - mtime > self._max_age:
+                p.unlink(missing_ok=True)
+            else:
+                entries.append((mtime, p))
+
+        entries.sort(reverse=True)
+        for _, p in entries[self._max_entries:]:
+            p.unlink(missing_ok=True)
@@ -0,0 +1,128 @@
+"""
+Per-session resource limits (rlimits) for target servers.
+
+ResourceLimits caps a server's address space, CPU seconds, open files and processes
+with setrlimit in the child before it runs the target (preexec_fn for subprocesses;
+forked servers apply them directly). Limits only ever lower the inherited ones.
+`diagnose` names a limit as hit only when the server's end confirms it: SIGXCPU or a
+SIGKILL after using up its CPU seconds, or dying on its own with an allocation, open or
+fork failure on stderr. The same stderr text from a server that kept running (or was
+stopped by us) is only a note, since runtimes print it for unrelated reasons.
+POSIX only.
+
+RLIMIT_NPROC counts every process and thread of the user, not only the server's
+tree, so `processes` has to leave room for what the host already runs as that user.
+"""
+from __future__ import annotations
+
+import logging
+import signal
+from dataclasses import dataclass
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+log = logging.getLogger(__name__)
+
+# stderr fragments runtimes print when an allocation / open / fork is refused
+_MEMORY_MARKERS = (
+    "MemoryError", "Cannot allocate memory", "out of memory", "std::bad_alloc", "failed to allocate", "memory allocation of",
+)
+_FILES_MARKERS = ("Too many open files", "EMFILE")
+_PROCESS_MARKERS = ("can't start new thread", "Resource temporarily unavailable", "EAGAIN")
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    address_space_bytes: int | None = None
+    cpu_sec: int | None = None
+    open_files: int | None = None
+    processes: int | None = None
+
+    def __bool__(self) -> bool:
+        return any(v is not None for v in (self.address_space_bytes, self.cpu_sec, self.open_files, self.processes))
+
+    def apply(self) -> None:
+        """Lowers this process's limits (runs in the child, before the target starts)."""
+        if resource is None:
+            return
+        if self.cpu_sec is not None:
+            # Soft limit sends SIGXCPU (which names the cause); the hard one SIGKILLs a second later
+            _lower(resource.RLIMIT_CPU, self.cpu_sec, self.cpu_sec + 1)
+        if self.address_space_bytes is not None:
+            _lower(resource.RLIMIT_AS, self.address_space_bytes)
+        if self.open_files is not None:
+            _lower(resource.RLIMIT_NOFILE, self.open_files)
+        if self.processes is not None:
+            _lower(resource.RLIMIT_NPROC, self.processes)
+
+    def describe(self) -> str:
+        parts = []
+        if self.address_space_bytes is not None:
+            parts.append(f"address space {self.address_space_bytes // 2**20} MB")
+        if self.cpu_sec is not None:
+            parts.append(f"CPU {self.cpu_sec} s")
+        if self.open_files is not None:
+            parts.append(f"{self.open_files} open files")
+        if self.processes is not None:
+            parts.append(f"{self.processes} processes")
+        return ", ".join(parts) or "none"
+
+
+def limits_supported() -> bool:
+    return resource is not None
+
+
+def _lower(which: int, soft: int, hard: int | None = None) -> None:
+    cur_soft, cur_hard = resource.getrlimit(which)
+    hard = soft if hard is None else hard
+    if cur_hard != resource.RLIM_INFINITY:
+        hard = min(hard, cur_hard)
+    if cur_soft != resource.RLIM_INFINITY:
+        soft = min(soft, cur_soft)
+    resource.setrlimit(which, (min(soft, hard), hard))
+
+
+def diagnose(
+    limits: ResourceLimits,
+    returncode: int | None,
+    stderr_tail: str,
+    cpu_sec: float | None = None,
+    killed_by_us: bool = False,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    (hits, notes): configured limits the server's exit confirms it ran into, and those
+    only its stderr hints at.
+    """
+    hits, notes = [], []
+    if limits.cpu_sec is not None:
+        xcpu = getattr(signal, "SIGXCPU", None)
+        hard_kill = (
+            returncode == -signal.SIGKILL
+            and not killed_by_us
+            and cpu_sec is not None
+            and cpu_sec >= limits.cpu_sec
+        )
+        if (xcpu is not None and returncode == -xcpu) or hard_kill:
+            hits.append(f"CPU time limit of {limits.cpu_sec} s exceeded")
+
+    # A refused allocation / open / fork only counts once the server died of it
+    died = returncode is not None and returncode != 0 and not killed_by_us
+    stderr_evidence = []
+    if limits.address_space_bytes is not None:
+        mb = limits.address_space_bytes // 2**20
+        stderr_evidence.append((_MEMORY_MARKERS, f"address space limit of {mb} MB reached (allocation failed)"))
+    if limits.open_files is not None:
+        stderr_evidence.append((_FILES_MARKERS, f"open files limit of {limits.open_files} reached"))
+    if limits.processes is not None:
+        stderr_evidence.append((_PROCESS_MARKERS, f"process limit of {limits.processes} reached (fork / thread creation failed)"))
+    for markers, text in stderr_evidence:
+        if not any(m in stderr_tail for m in markers):
+            continue
+        if died:
+            hits.append(text)
+        else:
+            notes.append(f"stderr suggests the {text}")
+    return tuple(hits), tuple(notes)
@@ -3,28 +3,47 @@ Factory for MCP client sessions.
 
 Creates MCPProcessRunner + JsonRpcClient as an async context-managed session,
 ensuring processes and resources are cleaned up reliably on exit.
+SharedSessionFactory reuses one started server for every check in a QA run.
+Closing a session reports the server's resource usage to the running check; a check on
+the shared server is charged with what that server used while the check held it.
+With a TranscriptRecorder every session's wire traffic is recorded (see transcript.py).
+An optional InterpreterResolver turns `uv run python ...` into a direct venv launch.
+BoundedRunnerFactory caps how many target servers are alive at once (batch runs).
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, replace
 from typing import Optional, AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
-from infrastructure.process_runner import MCPProcessRunner
+from infrastructure.process_runner import DEFAULT_KILL_GRACE_SEC, DEFAULT_TERM_GRACE_SEC, MCPProcessRunner
 from infrastructure.jsonrpc_client import JsonRpcClient
+from domain.models import ResourceUsage
+from infrastructure.framing import DEFAULT_MAX_MESSAGE_BYTES
+from infrastructure.interpreter_resolver import InterpreterResolver
+from infrastructure.rlimits import ResourceLimits
+from infrastructure.transcript import TranscriptRecorder
+from infrastructure.timing import record_spawn, record_usage, usage_bound
 
 @dataclass
 class MCPClientSession:
     runner: MCPProcessRunner
     timeout_sec: int
+    max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES
     _client: Optional[JsonRpcClient] = None
 
     async def __aenter__(self) -> "MCPClientSession":
+        started = time.perf_counter()
         await self.runner.start()
+        record_spawn((time.perf_counter() - started) * 1000)
         self._client = JsonRpcClient(
             stdin=self.runner.stdin,
             stdout=self.runner.stdout,
             timeout_sec=self.timeout_sec,
+            max_message_bytes=self.max_message_bytes,
+            transcript=self.runner.transcript,
         )
         return self
 
@@ -41,12 +60,140 @@ class MCPClientSession:
             if self._client is not None:
                 await self._client.close()
                 self._client = None
+            usage = self.runner.usage
+            if usage is not None:
+                record_usage(usage)
 
 
 class RunnerFactory:
+    """Starts a fresh server process for every session (isolated is always satisfied)."""
+    def __init__(
+        self,
+        resolver: InterpreterResolver | None = None,
+        max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES,
+        term_grace_sec: float = DEFAULT_TERM_GRACE_SEC,
+        kill_grace_sec: float = DEFAULT_KILL_GRACE_SEC,
+        limits: ResourceLimits | None = None,
+        transcripts: TranscriptRecorder | None = None,
+    ):
+        self._resolver = resolver
+        self._max_message_bytes = max_message_bytes
+        self._runner_options = {
+            "term_grace_sec": term_grace_sec,
+            "kill_grace_sec": kill_grace_sec,
+            "limits": limits,
+            "transcripts": transcripts,
+        }
+
     @asynccontextmanager
-    async def create(self, command: list[str], project_path: str, timeout_sec: int) -> AsyncGenerator[MCPClientSession, None]:
-        runner = MCPProcessRunner(command=command, project_path=project_path)
-        session = MCPClientSession(runner=runner, timeout_sec=timeout_sec)
+    async def create(
+        self,
+        command: list[str],
+        project_path: str,
+        timeout_sec: int,
+        isolated: bool = False,
+    ) -> AsyncGenerator[MCPClientSession, None]:
+        env = None
+        if self._resolver is not None:
+            command, env = await self._resolver.rewrite(command, project_path)
+
+        runner = self._make_runner(command, project_path, env)
+        session = MCPClientSession(runner=runner, timeout_sec=timeout_sec, max_message_bytes=self._max_message_bytes)
         async with session:
             yield session
+
+    def _make_runner(self, command: list[str], project_path: str, env: dict[str, str] | None) -> MCPProcessRunner:
+        return MCPProcessRunner(command=command, project_path=project_path, env=env, **self._runner_options)
+
+
+class SharedSessionFactory(RunnerFactory):
+    """
+    Hands every check the same server session for the duration of a QA run.
+
+    The first create() for a (command, project_path, timeout_sec) starts the server
+    through the base factory; later calls reuse it, and the client memoizes initialize.
+    isolated=True bypasses sharing and yields a fresh process from the base factory.
+    Shared sessions are torn down concurrently by aclose() (or by leaving `async with factory`).
+    """
+    def __init__(self, base: RunnerFactory | None = None):
+        self._base = base or RunnerFactory()
+        self._stacks: list[AsyncExitStack] = []
+        self._sessions: dict[tuple, MCPClientSession] = {}
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def create(
+        self,
+        command: list[str],
+        project_path: str,
+        timeout_sec: int,
+        isolated: bool = False,
+    ) -> AsyncGenerator[MCPClientSession, None]:
+        if isolated:
+            async with self._base.create(command, project_path, timeout_sec, isolated=True) as session:
+                yield session
+            return
+
+        session = await self._shared(command, project_path, timeout_sec)
+        charged = usage_bound()
+        before = session.runner.sample_usage() if charged else None
+        try:
+            yield session
+        finally:
+            if charged:
+                # A server that died under this check must be charged (and diagnosed) here
+                await session.runner.settle()
+                after = session.runner.sample_usage()
+                if after is not None:
+                    # Checks overlapping on the shared server are each charged the whole window
+                    record_usage(replace(after.since(before or ResourceUsage()), shared=True))
+
+    async def _shared(self, command: list[str], project_path: str, timeout_sec: int) -> MCPClientSession:
+        key = (tuple(command), project_path, timeout_sec)
+        async with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                stack = AsyncExitStack()
+                session = await stack.enter_async_context(self._base.create(command, project_path, timeout_sec))
+                self._stacks.append(stack)
+                self._sessions[key] = session
+            return session
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            self._sessions.clear()
+            stacks, self._stacks = self._stacks, []
+            results = await asyncio.gather(*(s.aclose() for s in stacks), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def __aenter__(self) -> "SharedSessionFactory":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+
+class BoundedRunnerFactory(RunnerFactory):
+    """
+    Wraps a base factory with a global cap on live sessions (one permit per server process,
+    held until the session is closed). Share one instance across projects to bound a batch.
+    """
+    def __init__(self, base: RunnerFactory, max_live: int):
+        if max_live < 1:
+            raise ValueError("max_live must be >= 1")
+        self._base = base
+        self._sem = asyncio.Semaphore(max_live)
+
+    @asynccontextmanager
+    async def create(
+        self,
+        command: list[str],
+        project_path: str,
+        timeout_sec: int,
+        isolated: bool = False,
+    ) -> AsyncGenerator[MCPClientSession, None]:
+        async with self._sem:
+            async with self._base.create(command, project_path, timeout_sec, isolated=isolated) as session:
+                yield session
@@ -0,0 +1,123 @@
+"""
+Small latency statistics helpers shared by benchmark-style checks.
+
+Percentiles use linear interpolation between closest ranks (numpy's default),
+so p50 of an even-sized sample is the mean of the two middle values.
+LatencyHistogram keeps bounded-error percentiles for samples too large to keep.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable
+
+
+def percentile(sorted_samples: list[float], q: float) -> float:
+    """q in [0, 100] over an already sorted, non-empty sample."""
+    if not sorted_samples:
+        raise ValueError("percentile of an empty sample")
+    rank = (len(sorted_samples) - 1) * q / 100.0
+    lo, hi = math.floor(rank), math.ceil(rank)
+    return sorted_samples[lo] + (sorted_samples[hi] - sorted_samples[lo]) * (rank - lo)
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    count: int
+    min: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def of(cls, samples: Iterable[float]) -> "LatencySummary":
+        s = sorted(samples)
+        return cls(
+            count=len(s),
+            min=s[0],
+            p50=percentile(s, 50),
+            p95=percentile(s, 95),
+            p99=percentile(s, 99),
+            max=s[-1],
+        )
+
+    def describe(self, unit: str = "ms") -> str:
+        return (
+            f"min {self.min:.0f} / p50 {self.p50:.0f} / p95 {self.p95:.0f} / "
+            f"p99 {self.p99:.0f} / max {self.max:.0f} {unit}"
+        )
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies.
+
+    Values are recorded as integer microseconds into buckets whose width grows with
+    magnitude, keeping relative error below 10^-significant_figures at any scale with
+    a small, sparse bucket map. Percentiles report the highest value of the bucket
+    (never under-reports).
+    """
+    def __init__(self, significant_figures: int = 2):
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._mask = (1 << self._sub_bits) - 1
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+
+    def record(self, ms: float, count: int = 1) -> None:
+        us = max(0, int(round(ms * 1000)))
+        index = self._index(us)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.count += count
+        self.min_us = us if self.min_us is None else min(self.min_us, us)
+        self.max_us = max(self.max_us, us)
+
+    def value_at_percentile(self, q: float) -> float:
+        """Latency (ms) at or below which q percent of the recorded values fall."""
+        if not self.count:
+            raise ValueError("percentile of an empty histogram")
+        target = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._highest_value(index), self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    def percentiles(self, qs: Iterable[float] = (50, 90, 99, 99.9, 99.99)) -> dict[float, float]:
+        return {q: self.value_at_percentile(q) for q in qs}
+
+    def describe(self) -> str:
+        parts = [f"p{q:g} {ms:.1f}" for q, ms in self.percentiles().items()]
+        return " / ".join(parts + [f"max {self.max_us / 1000.0:.1f} ms"])
+
+    def _index(self, us: int) -> int:
+        if us <= self._mask:
+            return us
+        shift = us.bit_length() - self._sub_bits
+        return (shift << self._sub_bits) + (us >> shift)
+
+    def _highest_value(self, index: int) -> int:
+        shift = index >> self._sub_bits
+        if shift == 0:
+            return index
+        mantissa = index & self._mask
+        return ((mantissa + 1) << shift) - 1
+
+
+def linear_trend(xs: list[float], ys: list[float]) -> tuple[float, float]:
+    """Least-squares (slope, r²) of ys over xs; (0.0, 0.0) when undefined."""
+    n = len(xs)
+    if n < 2:
+        return 0.0, 0.0
+    mx, my = sum(xs) / n, sum(ys) / n
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    if sxx == 0:
+        return 0.0, 0.0
+    slope = sxy / sxx
+    r2 = (sxy * sxy) / (sxx * syy) if syy else 0.0
+    return slope, r2
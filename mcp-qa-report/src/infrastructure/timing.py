@@ -0,0 +1,71 @@
+"""
+Timing and resource hooks for the check currently running.
+
+QARunner binds a CheckTiming to a context variable for the duration of each check;
+the session factory and JSON-RPC client record spawn and per-method RPC latency into
+whatever timing is bound. Sessions likewise record the server resources they used
+into the bound usage list. Outside a check (e.g. warm pool refills) nothing is recorded.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from domain.models import CheckTiming, ResourceUsage
+
+_current: ContextVar[CheckTiming | None] = ContextVar("qa_check_timing", default=None)
+_usage: ContextVar[list[ResourceUsage] | None] = ContextVar("qa_check_usage", default=None)
+
+
+@contextmanager
+def bind_timing(timing: CheckTiming) -> Iterator[CheckTiming]:
+    """Binds timing for the current task and measures wall time around the block."""
+    token = _current.set(timing)
+    started = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing.wall_ms = (time.perf_counter() - started) * 1000
+        _current.reset(token)
+
+
+def record_spawn(ms: float) -> None:
+    timing = _current.get()
+    if timing is not None:
+        timing.spawn_ms = (timing.spawn_ms or 0.0) + ms
+
+
+def record_rpc(method: str, ms: float) -> None:
+    timing = _current.get()
+    if timing is not None:
+        timing.record_rpc(method, ms)
+
+
+@contextmanager
+def bind_usage() -> Iterator[list[ResourceUsage]]:
+    """Collects the usage every session closed in this task reports (one entry per server)."""
+    usages: list[ResourceUsage] = []
+    token = _usage.set(usages)
+    try:
+        yield usages
+    finally:
+        _usage.reset(token)
+
+
+def usage_bound() -> bool:
+    return _usage.get() is not None
+
+
+def record_usage(usage: ResourceUsage) -> None:
+    usages = _usage.get()
+    if usages is not None:
+        usages.append(usage)
+
+
+def total_usage(usages: list[ResourceUsage]) -> ResourceUsage | None:
+    total = None
+    for usage in usages:
+        total = usage if total is None else total.plus(usage)
+    return total
@@ -0,0 +1,171 @@
+"""
+Wire transcripts of target server sessions.
+
+With a TranscriptRecorder configured, every session records what crossed its pipes:
+each JSON-RPC message written to stdin ("send"), each stdout frame ("recv") and each
+stderr line ("stderr"), plus start/exit events, stamped with time.monotonic() when
+the client wrote or read them. Each session gets one NDJSON file under
+<project>/.qa-report/transcripts. Recording only enqueues: a single writer thread
+formats and writes the records, so the event loop never waits on the disk. Messages
+are copied into their record byte for byte (not re-encoded).
+"""
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from infrastructure.json_codec import JsonCodec, get_codec
+
+log = logging.getLogger(__name__)
+
+TRANSCRIPT_DIR = os.path.join(".qa-report", "transcripts")
+
+# (path, header fields, raw JSON message or None, last record of the session)
+_Record = tuple[Path, dict, bytes | None, bool]
+
+
+class SessionTranscript:
+    """Records of one server session; every method only enqueues."""
+    def __init__(self, recorder: TranscriptRecorder, path: Path):
+        self._recorder = recorder
+        self.path = path
+        self._closed = False
+
+    def sent(self, payload: bytes) -> None:
+        """A JSON message written to the server's stdin (as encoded, newline optional)."""
+        self._put({"dir": "send"}, payload.rstrip(b"\n"))
+
+    def received(self, frame: bytes | memoryview, is_json: bool) -> None:
+        """A stdout frame; non-JSON frames (noise) are kept as text."""
+        if is_json:
+            self._put({"dir": "recv"}, bytes(frame))
+        else:
+            self._put({"dir": "recv", "text": bytes(frame).decode("utf-8", errors="replace")})
+
+    def stderr(self, line: str) -> None:
+        self._put({"dir": "stderr", "text": line})
+
+    def event(self, name: str, **fields) -> None:
+        self._put({"event": name, **fields})
+
+    def close(self, returncode: int | None) -> None:
+        if not self._closed:
+            self._put({"event": "exit", "returncode": returncode}, last=True)
+            self._closed = True
+
+    def _put(self, fields: dict, raw: bytes | None = None, last: bool = False) -> None:
+        if not self._closed:
+            self._recorder.enqueue((self.path, {"t": time.monotonic(), **fields}, raw, last))
+
+
+class TranscriptRecorder:
+    """Process-wide transcript writer shared by every session (one daemon thread)."""
+    def __init__(self, codec: JsonCodec | None = None):
+        self._codec = codec or get_codec()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._seq = itertools.count(1)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stopped = False
+
+    def open_session(self, project_path: str, command: list[str], pid: int | None) -> SessionTranscript:
+        started = datetime.now(timezone.utc)
+        name = f"{started:%Y%m%d-%H%M%S}-{os.getpid()}-{next(self._seq)}.ndjson"
+        transcript = SessionTranscript(self, Path(project_path) / TRANSCRIPT_DIR / name)
+        transcript.event("start", time=started.isoformat(), pid=pid, command=list(command), cwd=project_path)
+        return transcript
+
+    def enqueue(self, record: _Record) -> None:
+        if self._stopped:
+            return
+        if self._thread is None:
+            self._start_writer()
+        self._queue.put(record)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Blocks until everything enqueued so far is on disk (call it from a worker thread)."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Writes what is queued, closes every file and stops the writer thread."""
+        self._stopped = True
+        thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _start_writer(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="qa-transcripts", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _write_loop(self) -> None:
+        files: dict[Path, object] = {}
+        failed: set[Path] = set()
+        running = True
+        while running:
+            # Take everything queued in one go and flush once per batch
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            waiters = []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    self._write(item, files, failed)
+            for f in files.values():
+                f.flush()
+            for waiter in waiters:
+                waiter.set()
+
+        for f in files.values():
+            f.close()
+
+    def _write(self, record: _Record, files: dict, failed: set[Path]) -> None:
+        path, fields, raw, last = record
+        if path in failed:
+            return
+        try:
+            f = files.get(path)
+            if f is None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                f = files[path] = open(path, "ab")
+            line = self._codec.dumps(fields)
+            if raw is not None:
+                line = line[:-1] + b',"msg":' + raw + b"}"
+            f.write(line + b"\n")
+            if last:
+                files.pop(path).close()
+        except OSError as e:
+            log.warning("Cannot write transcript %s: %s", path, e)
+            failed.add(path)
+            stale = files.pop(path, None)
+            if stale is not None:
+                stale.close()
+
+
+def read_transcript(path: str | os.PathLike, codec: JsonCodec | None = None) -> list[dict]:
+    """Parses a transcript file back into its records."""
+    codec = codec or get_codec()
+    with open(path, "rb") as f:
+        return [codec.loads(line) for line in f if line.strip()]
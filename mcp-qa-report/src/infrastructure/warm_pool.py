@@ -0,0 +1,268 @@
+"""
+Warm pool of pre-started MCP server sessions.
+
+Keeps up to `size` already-started and already-initialized sessions per
+(command, cwd, env, project fingerprint) key, hands them out on demand, refills them
+in the background, and reaps idle ones after a TTL. The fingerprint is the result
+cache's tree digest, so a server started before the project was edited is never
+handed out: it is closed as soon as a request for the edited tree comes in. Sessions
+are single-use: a handed-out server is terminated when its check finishes, because
+checks may leave server state behind.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncGenerator
+
+from infrastructure.process_runner import build_process_env
+from infrastructure.result_cache import tree_digest
+from infrastructure.runner_factory import MCPClientSession, RunnerFactory
+
+log = logging.getLogger(__name__)
+
+# (command, cwd, env fingerprint, timeout, project tree digest)
+PoolKey = tuple[tuple[str, ...], str, str, int, str]
+
+
+@dataclass
+class _WarmSession:
+    session: MCPClientSession
+    stack: AsyncExitStack
+    idle_since: float = field(default_factory=time.monotonic)
+
+    async def close(self) -> None:
+        try:
+            await self.stack.aclose()
+        except Exception:
+            log.debug("Warm session teardown failed", exc_info=True)
+
+
+def _env_fingerprint(env: dict[str, str]) -> str:
+    h = hashlib.sha1()
+    for k, v in sorted(env.items()):
+        h.update(f"{k}={v}\0".encode("utf-8", errors="replace"))
+    return h.hexdigest()
+
+
+class WarmPoolRunnerFactory(RunnerFactory):
+    """
+    RunnerFactory that serves sessions from a bounded pool of warm servers.
+
+    isolated=True always spawns a fresh, un-initialized process through the base factory
+    (pooled servers have already consumed their pre-initialize output).
+    """
+    def __init__(
+        self,
+        size: int = 1,
+        idle_ttl_sec: float = 300.0,
+        max_keys: int = 8,
+        base: RunnerFactory | None = None,
+    ):
+        self._size = size
+        self._idle_ttl = idle_ttl_sec
+        self._max_keys = max_keys
+        self._base = base or RunnerFactory()
+
+        self._idle: OrderedDict[PoolKey, list[_WarmSession]] = OrderedDict()
+        self._spawning: dict[PoolKey, int] = {}
+        self._refills: set[asyncio.Task] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+
+    @asynccontextmanager
+    async def create(
+        self,
+        command: list[str],
+        project_path: str,
+        timeout_sec: int,
+        isolated: bool = False,
+    ) -> AsyncGenerator[MCPClientSession, None]:
+        if isolated or self._closed:
+            async with self._base.create(command, project_path, timeout_sec, isolated=True) as session:
+                yield session
+            return
+
+        key = await self._key(command, project_path, timeout_sec)
+        self._ensure_reaper()
+        await self._discard_stale(key)
+
+        warm = self._take(key)
+        if warm is None:
+            # Cold miss: start one now; the check performs initialize itself
+            warm = await self._start(command, project_path, timeout_sec, initialize=False)
+        self._schedule_refill(key, command, project_path, timeout_sec)
+
+        try:
+            yield warm.session
+        finally:
+            await warm.close()
+
+    def prewarm(self, command: list[str], project_path: str, timeout_sec: int) -> None:
+        """Starts warm servers for a key in the background, ahead of the first create()."""
+        if self._closed:
+            return
+        self._ensure_reaper()
+        self._spawn_task(self._prewarm(command, project_path, timeout_sec))
+
+    async def _prewarm(self, command: list[str], project_path: str, timeout_sec: int) -> None:
+        key = await self._key(command, project_path, timeout_sec)
+        await self._discard_stale(key)
+        self._schedule_refill(key, command, project_path, timeout_sec)
+
+    async def drain(self) -> int:
+        """
+        Discards every idle or still-starting warm server (e.g. after the target's files
+        changed, so they run stale code). The pool stays usable. Returns how many were closed.
+        """
+        refills = list(self._refills)
+        for t in refills:
+            t.cancel()
+        await asyncio.gather(*refills, return_exceptions=True)
+
+        entries = [w for ws in self._idle.values() for w in ws]
+        self._idle.clear()
+        await asyncio.gather(*(w.close() for w in entries))
+        return len(entries)
+
+    @property
+    def idle_count(self) -> int:
+        return sum(len(v) for v in self._idle.values())
+
+    async def _key(self, command: list[str], project_path: str, timeout_sec: int) -> PoolKey:
+        cwd = str(Path(project_path).resolve())
+        digest = await asyncio.to_thread(tree_digest, cwd)
+        return (tuple(command), cwd, _env_fingerprint(build_process_env(project_path)), timeout_sec, digest)
+
+    async def _discard_stale(self, key: PoolKey) -> None:
+        # Same server setup, older project tree: those servers run code that no longer exists
+        stale = [k for k in self._idle if k[:-1] == key[:-1] and k[-1] != key[-1]]
+        entries = [w for k in stale for w in self._idle.pop(k)]
+        await asyncio.gather(*(w.close() for w in entries))
+
+    def _take(self, key: PoolKey) -> _WarmSession | None:
+        entries = self._idle.get(key)
+        if not entries:
+            return None
+        self._idle.move_to_end(key)
+        while entries:
+            warm = entries.pop(0)
+            if warm.session.runner.is_running:
+                return warm
+            self._spawn_task(warm.close())
+        return None
+
+    async def _start(self, command: list[str], project_path: str, timeout_sec: int, initialize: bool) -> _WarmSession:
+        stack = AsyncExitStack()
+        try:
+            session = await stack.enter_async_context(self._base.create(command, project_path, timeout_sec))
+            if initialize:
+                # Collect noise so a later STDIO-style caller still sees what the server printed
+                data, _ = await session.client.initialize_collect_noise()
+                if not data or "result" not in data:
+                    raise RuntimeError("warm server did not answer initialize")
+        except BaseException:
+            await stack.aclose()
+            raise
+        return _WarmSession(session=session, stack=stack)
+
+    def _schedule_refill(self, key: PoolKey, command: list[str], project_path: str, timeout_sec: int) -> None:
+        missing = self._size - len(self._idle.get(key, ())) - self._spawning.get(key, 0)
+        for _ in range(max(0, missing)):
+            self._spawning[key] = self._spawning.get(key, 0) + 1
+            task = self._spawn_task(self._refill_one(key, command, project_path, timeout_sec))
+            self._refills.add(task)
+            task.add_done_callback(self._refills.discard)
+
+    async def _refill_one(self, key: PoolKey, command: list[str], project_path: str, timeout_sec: int) -> None:
+        try:
+            warm = await self._start(command, project_path, timeout_sec, initialize=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.debug("Warm pool refill failed (cwd=%s, command=%s)", project_path, command, exc_info=True)
+            return
+        finally:
+            self._spawning[key] -= 1
+            if not self._spawning[key]:
+                del self._spawning[key]
+
+        if self._closed:
+            await warm.close()
+            return
+
+        # The TTL counts from when the server became available, not from when it was spawned
+        warm.idle_since = time.monotonic()
+        self._idle.setdefault(key, []).append(warm)
+        self._idle.move_to_end(key)
+        await self._evict_keys()
+
+    async def _evict_keys(self) -> None:
+        while len(self._idle) > self._max_keys:
+            _, entries = self._idle.popitem(last=False)
+            await asyncio.gather(*(w.close() for w in entries))
+
+    async def reap(self, now: float | None = None) -> int:
+        """Closes sessions idle longer than the TTL. Returns how many were reaped."""
+        now = time.monotonic() if now is None else now
+        expired: list[_WarmSession] = []
+        for key in list(self._idle):
+            keep = []
+            for warm in self._idle[key]:
+                stale = now - warm.idle_since >= self._idle_ttl
+                (expired if stale or not warm.session.runner.is_running else keep).append(warm)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+
+        await asyncio.gather(*(w.close() for w in expired))
+        return len(expired)
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        interval = max(0.5, min(self._idle_ttl / 2, 30.0))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reap()
+            except Exception:
+                log.exception("Warm pool reaper failed")
+
+    def _spawn_task(self, coro) -> asyncio.Task:
+        # Fresh context: background refills are not attributed to the check that triggered them
+        task = asyncio.create_task(coro, context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def aclose(self) -> None:
+        self._closed = True
+        pending = list(self._tasks)
+        if self._reaper is not None:
+            pending.append(self._reaper)
+            self._reaper = None
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        entries = [w for ws in self._idle.values() for w in ws]
+        self._idle.clear()
+        await asyncio.gather(*(w.close() for w in entries))
+
+    async def __aenter__(self) -> "WarmPoolRunnerFactory":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
@@ -2,16 +2,58 @@
 MCP tool registrations.
 
 Exposes `qa_report` (runs QA checks and returns a checklist report),
+`qa_report_batch` (the same checks over many projects with bounded concurrency),
 and a minimal `ping` tool for health-check / safe e2e invocation tests.
 """
 import asyncio
-from infrastructure.reporters.report_writer import write_report_files, write_text_file
-from mcp.server.fastmcp import FastMCP
+import logging
+from infrastructure.reporters.report_writer import append_text_file, write_report_files, write_text_file
+from infrastructure.detect_mcp import detect_mcp_command_async
+from infrastructure.json_codec import get_codec
+from mcp.server.fastmcp import Context, FastMCP
 from application.execution_context import ExecutionContext
-from application.container import build_runner, build_reporter
+from application.container import (
+    build_batch_runner,
+    build_cache_settings,
+    build_checks,
+    build_reporter,
+    build_result_cache,
+    build_runner,
+    build_runner_factory,
+)
+from application.batch_runner import BatchSummary, iter_projects
+from domain.models import CheckResult, CheckStatus
 from domain.ports import Reporter
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
+_LOG_LEVEL = {
+    CheckStatus.PASS: "info",
+    CheckStatus.SKIP: "info",
+    CheckStatus.WARN: "warning",
+    CheckStatus.FAIL: "error",
+}
+
+
+def _stream_results(ctx: Context | None, total: int):
+    """
+    on_result callback that reports each finished check to the calling client: a log
+    notification always, and a progress notification when the request carried a progressToken.
+    """
+    if ctx is None:
+        return None
+    done = 0
+
+    async def on_result(result: CheckResult) -> None:
+        nonlocal done
+        done += 1
+        line = f"[{result.status.value}] {result.name}: {result.message.splitlines()[0] if result.message else ''}"
+        await ctx.log(_LOG_LEVEL[result.status], line, logger_name="qa_report")
+        await ctx.report_progress(progress=done, total=total, message=line)
+
+    return on_result
+
 def register(mcp: FastMCP) -> None:
     @mcp.tool(
         name="qa_report",
@@ -30,6 +72,7 @@ def register(mcp: FastMCP) -> None:
         "  If omitted, the tool attempts best-effort auto-detection using common MCP config files.\n"
         "  Providing an explicit command is recommended when available.\n"
         "- fail_fast: Stop on first failure (default: true).\n"
+        "- force: Re-run all checks even if the project is unchanged since a cached run (default: false).\n"
         "- output_path: Optional file or directory path to write the report.\n"
         "  If a directory (or no file extension), writes 'qa_report.txt' inside it.\n"
         "  If a file path, writes exactly to that file.\n\n"
@@ -39,8 +82,12 @@ def register(mcp: FastMCP) -> None:
         "- If output_path is provided, writes the report to disk and returns a short confirmation message.\n\n"
 
         "Notes:\n"
+        "- Each check's result is also streamed as it finishes: a log notification, plus a progress\n"
+        "  notification when the request carries a progressToken.\n"
         "- In environments where auto-detection is not possible (e.g. Codex sandboxes), an explicit command may be required.\n"
-        "- Invalid output paths do not abort execution; the report is still returned inline."
+        "- Invalid output paths do not abort execution; the report is still returned inline.\n"
+        "- Results of passing runs are cached under <project_path>/.qa-report/cache and reused while\n"
+        "  the project's files, start command and checks are unchanged."
         )
     )
     async def qa_report(
@@ -48,14 +95,44 @@ def register(mcp: FastMCP) -> None:
         command: list[str] | None = None,
         fail_fast: bool = True,
         output_path: str | None = None,
+        force: bool = False,
+        ctx: Context | None = None,
     ) -> str:
-        ctx = ExecutionContext(project_path=project_path, command=command)
+        # Detect once per run (off the event loop) so checks don't each re-read config files
+        if not command:
+            command = await detect_mcp_command_async(project_path)
+
+        cache = build_result_cache(project_path)
+        cache_key = None
+        results = None
+        if cache is not None:
+            try:
+                cache_key = await cache.key(
+                    command=command, checks=build_checks(), fail_fast=fail_fast, settings=build_cache_settings()
+                )
+                if not force:
+                    results = await cache.get(cache_key)
+            except Exception:
+                log.debug("Result cache unavailable for %s", project_path, exc_info=True)
+                cache_key = None
+        from_cache = results is not None
 
-        runner = build_runner(fail_fast=fail_fast)
-        results = await runner.run(ctx)
+        if results is None:
+            runner = build_runner(fail_fast=fail_fast)
+            on_result = _stream_results(ctx, total=runner.check_count)
+
+            # One server process is shared by all checks; it is torn down when the run ends
+            async with build_runner_factory() as factory:
+                exec_ctx = ExecutionContext(project_path=project_path, command=command, runner_factory=factory)
+                results = await runner.run(exec_ctx, on_result=on_result)
+
+            if cache_key is not None:
+                await cache.put(cache_key, results)
 
         reporter: Reporter = build_reporter()
         text = reporter.render(results)
+        if from_cache:
+            text += "\n(cached: project unchanged since the last run; pass force=true to re-run)"
 
         if output_path is not None:
             output_path = output_path.strip()
@@ -87,6 +164,76 @@ def register(mcp: FastMCP) -> None:
                     return f"Failed writing report to file: {e}\n\nReport:\n{text}"
         return text
 
+    @mcp.tool(
+        name="qa_report_batch",
+        description=(
+        "Run the qa_report checks over many local MCP projects concurrently.\n\n"
+
+        "Inputs:\n"
+        "- project_paths: Optional list of project directories.\n"
+        "- root / pattern: Optional directory and glob (default '*'); every matching subdirectory is checked.\n"
+        "- command: Optional explicit start command used for every project (otherwise auto-detected per project).\n"
+        "- fail_fast: Stop each project's run on its first failure (default: true).\n"
+        "- max_processes: Global cap on live target server processes (default: 8, minimum 2).\n"
+        "- output_path: Optional NDJSON file (under root, or the working directory) that receives\n"
+        "  one JSON record per project as soon as it finishes.\n\n"
+
+        "Output:\n"
+        "- One line per project (inline mode) followed by an aggregate summary.\n"
+        "- With output_path, per-project records are streamed to the file and only the summary is returned."
+        )
+    )
+    async def qa_report_batch(
+        project_paths: list[str] | None = None,
+        root: str | None = None,
+        pattern: str = "*",
+        command: list[str] | None = None,
+        fail_fast: bool = True,
+        max_processes: int = 8,
+        output_path: str | None = None,
+    ) -> str:
+        if not project_paths and root is None:
+            return "Nothing to check: provide project_paths and/or root."
+
+        try:
+            batch = build_batch_runner(fail_fast=fail_fast, max_processes=max_processes, command=command)
+        except ValueError as e:
+            return f"Invalid batch options: {e}"
+
+        reporter = build_reporter()
+        out_base = root or "."
+        out_file = output_path.strip() if output_path else None
+        notes: list[str] = []
+
+        if out_file:
+            try:
+                out_file = await write_text_file(project_path=out_base, output_file=out_file, text_content="")
+            except Exception as e:
+                notes.append(f"Failed writing results to file: {e}")
+                out_file = None
+
+        summary = BatchSummary()
+        lines: list[str] = []
+        exclude = [str(Path(out_file).parent)] if out_file else []
+        async for report in batch.run(iter_projects(project_paths, root, pattern, exclude=exclude)):
+            summary.add(report)
+            if out_file:
+                record = {"project": report.project_path, "error": report.error, **reporter.to_json_obj(report.results)}
+                await append_text_file(
+                    project_path=out_base,
+                    output_file=out_file,
+                    text_content=get_codec().dumps(record).decode("utf-8") + "\n",
+                )
+            else:
+                lines.append(reporter.render_project_line(report.project_path, report.results, report.error))
+
+        footer = reporter.render_batch_summary(summary.projects, summary.passed, summary.warned, summary.failed)
+        if out_file:
+            notes.append(f"Wrote per-project results to: {out_file}")
+            if summary.failed_projects:
+                notes.append("Failed: " + ", ".join(summary.failed_projects))
+        return "\n".join(lines + ([""] if lines else []) + [footer] + notes)
+
     @mcp.tool(name="ping", description="Health check tool. Returns ok.")
     async def ping() -> str:
         return "ok"
@@ -0,0 +1,56 @@
+"""
+`qa-report-watch` entrypoint: re-runs QA checks on a project as its files change.
+
+Prints a checklist after the initial run and after every re-run, listing which
+checks were re-executed. Stop with Ctrl+C.
+"""
+import argparse
+import asyncio
+import shlex
+import time
+
+from infrastructure.logging_config import configure_logging
+from application.container import build_reporter, build_watch_pool, build_watcher
+from application.watch import WatchRun
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="qa-report-watch", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("project_path", nargs="?", default=".")
+    parser.add_argument("--command", help="Explicit start command for the target MCP server (shell-quoted)")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop each run on the first failure")
+    parser.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds")
+    return parser.parse_args(argv)
+
+
+async def _watch(args: argparse.Namespace) -> None:
+    reporter = build_reporter()
+    command = shlex.split(args.command) if args.command else None
+
+    def on_run(run: WatchRun) -> None:
+        stamp = time.strftime("%H:%M:%S")
+        what = ", ".join(run.rerun) if run.rerun else "nothing (no check depends on the changed files)"
+        print(f"\n[{stamp}] re-ran {what} in {run.duration_sec:.2f}s", flush=True)
+        print(reporter.render(run.results), flush=True)
+
+    async with build_watch_pool() as pool:
+        watcher = build_watcher(
+            args.project_path,
+            pool,
+            command=command,
+            fail_fast=args.fail_fast,
+            poll_interval_sec=args.interval,
+        )
+        await watcher.watch(on_run)
+
+
+def main(argv=None) -> None:
+    configure_logging()
+    try:
+        asyncio.run(_watch(_parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
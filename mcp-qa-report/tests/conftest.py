@@ -27,7 +27,7 @@ def fake_session():
 
     # Provide default return values for common client methods
     session.client.initialize.return_value = {"result": {"ok": True}}
-    session.client.call.return_value = {"result": {"content": [{"type": "text", "text": "ok"}]}}
+    session.client.request.return_value = {"result": {"content": [{"type": "text", "text": "ok"}]}}
 
     return session
 
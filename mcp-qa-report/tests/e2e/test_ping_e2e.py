@@ -39,11 +39,7 @@ async def test_e2e_ping_tool_returns_ok():
         assert init and "result" in init, f"Bad init response: {init}\n\n--- server stderr tail ---\n{s.runner.stderr_tail}"
 
         try:
-            resp = await s.client.call(
-                "tools/call",
-                request_id=50,
-                params={"name": "ping", "arguments": {}},
-            )
+            resp = await s.client.request("tools/call", {"name": "ping", "arguments": {}})
         except JsonRpcTimeoutError as e:
             pytest.fail(f"{e}\n\n--- server stderr tail ---\n{s.runner.stderr_tail}")
 
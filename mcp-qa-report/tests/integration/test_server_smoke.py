@@ -23,5 +23,5 @@ async def test_server_starts_and_lists_tools():
 
         assert init and "result" in init, f"Bad init response: {init}\n\n--- stderr tail ---\n{s.runner.stderr_tail}"
 
-        tools = await s.client.call("tools/list", request_id=2)
+        tools = await s.client.request("tools/list")
         assert tools and "result" in tools, f"Bad tools/list response: {tools}\n\n--- stderr tail ---\n{s.runner.stderr_tail}"
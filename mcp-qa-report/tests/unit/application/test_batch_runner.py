@@ -0,0 +1,44 @@
+import pytest
+from pathlib import Path
+
+from application.batch_runner import BatchRunner, BatchSummary, iter_projects
+from domain.models import CheckResult, CheckStatus
+
+
+class _Runner:
+    async def run(self, ctx):
+        if "bad" in ctx.project_path:
+            return [CheckResult("startup", CheckStatus.FAIL, "no")]
+        return [CheckResult("startup", CheckStatus.PASS, "ok")]
+
+
+def test_iter_projects_combines_explicit_and_glob(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "file.txt").write_text("x", encoding="utf-8")
+
+    found = list(iter_projects(["explicit"], root=str(tmp_path)))
+    assert found[0] == "explicit"
+    assert sorted(Path(p).name for p in found[1:]) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_streams_every_project_and_summarizes():
+    batch = BatchRunner(build_runner=_Runner, base_factory=object(), max_processes=4, command=["python"])
+
+    summary = BatchSummary()
+    seen = []
+    async for report in batch.run(f"proj-{i}" for i in range(5)):
+        seen.append(report.project_path)
+        summary.add(report)
+    async for report in batch.run(["bad-one"]):
+        summary.add(report)
+
+    assert sorted(seen) == [f"proj-{i}" for i in range(5)]
+    assert (summary.projects, summary.passed, summary.failed) == (6, 5, 1)
+    assert summary.failed_projects == ["bad-one"]
+
+
+def test_batch_runner_rejects_too_small_process_cap():
+    with pytest.raises(ValueError):
+        BatchRunner(build_runner=_Runner, base_factory=object(), max_processes=1)
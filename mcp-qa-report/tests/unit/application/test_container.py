@@ -0,0 +1,25 @@
+import logging
+
+from application.container import build_checks, get_interpreter_resolver
+from infrastructure.checks.load_checks import OpenLoopLoadCheck
+
+
+def test_malformed_load_tool_args_fall_back_to_no_arguments(monkeypatch, caplog):
+    monkeypatch.setenv("QA_LOAD_RATE_RPS", "5")
+    monkeypatch.setenv("QA_LOAD_TOOL", "echo")
+    monkeypatch.setenv("QA_LOAD_TOOL_ARGS", "{bad")
+
+    with caplog.at_level(logging.WARNING, logger="application.container"):
+        checks = build_checks()
+
+    [load] = [c for c in checks if isinstance(c, OpenLoopLoadCheck)]
+    assert (load.tool, load.arguments) == ("echo", {})
+    assert "QA_LOAD_TOOL_ARGS" in caplog.text
+
+
+def test_interpreter_resolver_is_opt_in(monkeypatch):
+    monkeypatch.delenv("QA_RESOLVE_INTERPRETER", raising=False)
+    assert get_interpreter_resolver() is None
+
+    monkeypatch.setenv("QA_RESOLVE_INTERPRETER", "1")
+    assert get_interpreter_resolver() is not None
@@ -1,7 +1,8 @@
 import pytest
-from application.qa_runner import QARunner
-from domain.models import CheckResult, CheckStatus
+from application.qa_runner import QARunner, SubprocessBudget
+from domain.models import Artifact, CheckCost, CheckResult, CheckStatus
 from application.policies import FailFastPolicy, RunAllPolicy
+from infrastructure.timing import record_rpc
 import asyncio
 
 
@@ -30,3 +31,200 @@ async def test_qa_runner_fail_fast_stops_on_fail():
 
     res = await runner.run(ctx=object())
     assert [r.name for r in res] == ["c1", "c2"]
+
+
+class _CostedCheck(_Check):
+    def __init__(self, name, status, cost, started):
+        super().__init__(name, status)
+        self.cost = cost
+        self._started = started
+
+    async def run(self, ctx):
+        self._started.append(self.name)
+        await asyncio.sleep(0.01)
+        return await super().run(ctx)
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_gating_failure_prevents_expensive_checks():
+    started = []
+    checks = [
+        _CostedCheck("expensive", CheckStatus.PASS, CheckCost(subprocesses=3, latency_ms=5000), started),
+        _CostedCheck("startup", CheckStatus.FAIL, CheckCost(gating=True), started),
+    ]
+    res = await QARunner(checks, FailFastPolicy()).run(ctx=object())
+
+    assert [r.name for r in res] == ["startup"]
+    assert started == ["startup"]
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_budget_limits_concurrent_subprocess_checks():
+    budget = SubprocessBudget(2)
+    peak = 0
+
+    class _Probe(_Check):
+        cost = CheckCost(subprocesses=1)
+
+        async def run(self, ctx):
+            nonlocal peak
+            peak = max(peak, budget.in_use)
+            await asyncio.sleep(0.01)
+            return await super().run(ctx)
+
+    checks = [_Probe(f"c{i}", CheckStatus.PASS) for i in range(5)]
+    res = await QARunner(checks, RunAllPolicy(), budget=budget).run(ctx=object())
+
+    assert len(res) == 5
+    assert peak == 2
+    assert budget.in_use == 0
+
+
+class _Producer(_Check):
+    produces = (Artifact.TOOL_CATALOG,)
+
+
+class _Consumer(_Check):
+    requires = (Artifact.TOOL_CATALOG,)
+
+    def __init__(self, name, status, started):
+        super().__init__(name, status)
+        self._started = started
+
+    async def run(self, ctx):
+        self._started.append(self.name)
+        return await super().run(ctx)
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_skips_dependents_of_failed_producer():
+    started = []
+    checks = [
+        _Consumer("quality", CheckStatus.PASS, started),
+        _Producer("catalog", CheckStatus.FAIL),
+        _Check("independent", CheckStatus.PASS),
+    ]
+    res = await QARunner(checks, RunAllPolicy()).run(ctx=object())
+
+    by_name = {r.name: r for r in res}
+    assert by_name["quality"].status == CheckStatus.SKIP
+    assert "catalog" in by_name["quality"].message
+    assert by_name["independent"].status == CheckStatus.PASS
+    assert started == []
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_runs_dependents_after_producer():
+    started = []
+    checks = [_Consumer("quality", CheckStatus.PASS, started), _Producer("catalog", CheckStatus.PASS)]
+    res = await QARunner(checks, RunAllPolicy()).run(ctx=object())
+
+    assert [r.name for r in res] == ["catalog", "quality"]
+
+
+class _RpcCheck(_Check):
+    def __init__(self, name, method):
+        super().__init__(name, CheckStatus.PASS)
+        self._method = method
+
+    async def run(self, ctx):
+        await asyncio.sleep(0.01)
+        record_rpc(self._method, 5.0)
+        return await super().run(ctx)
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_attaches_per_check_timing():
+    runner = QARunner([_RpcCheck("a", "tools/list"), _RpcCheck("b", "tools/call")], RunAllPolicy())
+
+    res = {r.name: r for r in await runner.run(ctx=object())}
+
+    assert res["a"].timing.rpc_ms == {"tools/list": [5.0]}
+    assert res["b"].timing.rpc_ms == {"tools/call": [5.0]}
+    assert res["a"].timing.wall_ms >= 5
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_streams_each_result_and_survives_broken_listener():
+    seen = []
+
+    async def on_result(result):
+        seen.append(result.name)
+        if result.name == "c1":
+            raise RuntimeError("client went away")
+
+    checks = [_Check("c1", CheckStatus.PASS), _Check("c2", CheckStatus.FAIL), _Check("c3", CheckStatus.PASS)]
+    res = await QARunner(checks, RunAllPolicy()).run(ctx=object(), on_result=on_result)
+
+    assert seen == [r.name for r in res] == ["c1", "c2", "c3"]
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_fail_fast_waits_for_cancelled_checks_to_tear_down():
+    torn_down = []
+
+    class _SlowCheck(_Check):
+        async def run(self, ctx):
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await asyncio.sleep(0.05)  # e.g. terminating its server
+                torn_down.append(self.name)
+
+    checks = [_SlowCheck("slow1", CheckStatus.PASS), _SlowCheck("slow2", CheckStatus.PASS), _Check("bad", CheckStatus.FAIL)]
+    started = asyncio.get_running_loop().time()
+    res = await QARunner(checks, FailFastPolicy()).run(ctx=object())
+
+    assert [r.name for r in res] == ["bad"]
+    assert sorted(torn_down) == ["slow1", "slow2"]
+    assert asyncio.get_running_loop().time() - started < 0.09
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_attaches_server_usage_recorded_during_the_check():
+    from domain.models import ResourceUsage
+    from infrastructure.timing import record_usage
+
+    class _ServerCheck(_Check):
+        async def run(self, ctx):
+            record_usage(ResourceUsage(cpu_user_sec=0.5, peak_rss_bytes=100))
+            record_usage(ResourceUsage(cpu_user_sec=0.25, peak_rss_bytes=300))
+            return await super().run(ctx)
+
+    res = await QARunner([_ServerCheck("srv", CheckStatus.PASS), _Check("plain", CheckStatus.PASS)], RunAllPolicy()).run(ctx=object())
+
+    by_name = {r.name: r for r in res}
+    assert by_name["srv"].resources == ResourceUsage(cpu_user_sec=0.75, peak_rss_bytes=300)
+    assert by_name["plain"].resources is None
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_fails_checks_whose_server_hit_a_resource_limit():
+    from domain.models import ResourceUsage
+    from infrastructure.timing import record_usage
+
+    class _LimitedCheck(_Check):
+        async def run(self, ctx):
+            record_usage(ResourceUsage(limits_hit=("CPU time limit of 5 s exceeded",)))
+            return await super().run(ctx)
+
+    res = await QARunner([_LimitedCheck("srv", CheckStatus.PASS)], RunAllPolicy()).run(ctx=object())
+
+    assert res[0].status == CheckStatus.FAIL
+    assert res[0].message == "Resource limit hit: CPU time limit of 5 s exceeded\nsrv msg"
+
+
+@pytest.mark.asyncio
+async def test_qa_runner_only_warns_when_stderr_alone_hints_at_a_limit():
+    from domain.models import ResourceUsage
+    from infrastructure.timing import record_usage
+
+    class _HintedCheck(_Check):
+        async def run(self, ctx):
+            record_usage(ResourceUsage(limit_notes=("stderr suggests the open files limit of 64 reached",)))
+            return await super().run(ctx)
+
+    res = await QARunner([_HintedCheck("srv", CheckStatus.PASS)], RunAllPolicy()).run(ctx=object())
+
+    assert res[0].status == CheckStatus.WARN
+    assert res[0].message.startswith("Possible resource limit: stderr suggests the open files limit")
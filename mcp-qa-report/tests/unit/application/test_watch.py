@@ -0,0 +1,52 @@
+import os
+import pytest
+from pathlib import Path
+
+from application.policies import RunAllPolicy
+from application.watch import ProjectWatcher, check_inputs, classify_changes
+from domain.models import CheckResult, CheckStatus, WatchInput
+from infrastructure.checks.process_checks import MCPServerStartupCheck
+
+
+class _Check:
+    def __init__(self, name, inputs):
+        self.name = name
+        self.inputs = inputs
+        self.runs = 0
+
+    async def run(self, ctx):
+        self.runs += 1
+        return CheckResult(self.name, CheckStatus.PASS, f"run {self.runs}")
+
+
+def test_classify_changes_separates_config_from_source():
+    assert classify_changes(["pyproject.toml"]) == {WatchInput.CONFIG}
+    assert classify_changes([os.path.join(".vscode", "mcp.json")]) == {WatchInput.CONFIG}
+    assert classify_changes(["src/tools.py", "uv.lock"]) == {WatchInput.CONFIG, WatchInput.SOURCE}
+
+
+def test_startup_check_reruns_after_a_source_edit():
+    assert WatchInput.SOURCE in check_inputs(MCPServerStartupCheck())
+
+
+@pytest.mark.asyncio
+async def test_watcher_reruns_only_checks_affected_by_the_change(tmp_path: Path):
+    (tmp_path / "server.py").write_text("a", encoding="utf-8")
+    startup = _Check("startup", (WatchInput.CONFIG,))
+    tools = _Check("tools", (WatchInput.SOURCE,))
+    watcher = ProjectWatcher(
+        str(tmp_path), [startup, tools], RunAllPolicy(), factory=object(),
+        command=["python"], poll_interval_sec=0.01, debounce_sec=0.02,
+    )
+
+    first = await watcher.run_once()
+
+    (tmp_path / "server.py").write_text("changed", encoding="utf-8")
+    changed = await watcher.wait_for_change()
+    second = await watcher.run_once(changed)
+
+    assert changed == {"server.py"}
+    assert first.rerun == ["startup", "tools"]
+    assert second.rerun == ["tools"]
+    assert (startup.runs, tools.runs) == (1, 2)
+    assert [r.message for r in second.results] == ["run 1", "run 2"]
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+
+from application.execution_context import ExecutionContext
+from domain.models import Artifact, CheckStatus
+from infrastructure.checks.load_checks import (
+    ConcurrencySweepCheck,
+    LevelResult,
+    OpenLoopLoadCheck,
+    concurrency_levels,
+    find_knee,
+)
+
+
+def test_concurrency_levels_double_up_to_max():
+    assert concurrency_levels(1) == [1]
+    assert concurrency_levels(8) == [1, 2, 4, 8]
+    assert concurrency_levels(6) == [1, 2, 4, 6]
+
+
+def test_find_knee_is_last_level_that_still_scaled():
+    levels = [LevelResult(c, 10, 0, rps, None) for c, rps in [(1, 100), (2, 190), (4, 200), (8, 205)]]
+    assert find_knee(levels).concurrency == 2
+    assert find_knee(levels[:2]) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_sweep_finds_knee_of_server_limited_to_two(ctx_factory, fake_session):
+    server_slots = asyncio.Semaphore(2)
+
+    async def request(method, params=None):
+        async with server_slots:
+            await asyncio.sleep(0.01)
+        return {"jsonrpc": "2.0", "id": 1, "result": {"content": []}}
+
+    fake_session.client.request.side_effect = request
+    ctx = ExecutionContext(project_path=".", command=["python"], runner_factory=ctx_factory)
+    ctx.artifacts.put(Artifact.TOOL_CATALOG, [{"name": "ping"}])
+
+    res = await ConcurrencySweepCheck(max_concurrency=4, requests_per_level=20).run(ctx)
+
+    assert res.status == CheckStatus.PASS
+    assert "stops scaling at concurrency 2" in res.message
+    assert "c=4:" in res.message
+
+
+@pytest.mark.asyncio
+async def test_concurrency_sweep_fails_on_errors(ctx_factory, fake_session):
+    fake_session.client.request.return_value = {"jsonrpc": "2.0", "id": 1, "error": {"code": -1}}
+    ctx = ExecutionContext(project_path=".", command=["python"], runner_factory=ctx_factory)
+
+    res = await ConcurrencySweepCheck(max_concurrency=2, requests_per_level=5).run(ctx)
+
+    assert res.status == CheckStatus.FAIL
+    assert "5/5 tools/call requests failed at concurrency 1" in res.message
+
+
+@pytest.mark.asyncio
+async def test_open_loop_check_grades_p99(ctx_factory, fake_session):
+    fake_session.client.request.return_value = {"jsonrpc": "2.0", "id": 1, "result": {"content": []}}
+    ctx = ExecutionContext(project_path=".", command=["python"], runner_factory=ctx_factory)
+
+    ok = await OpenLoopLoadCheck(rate_rps=200, duration_sec=0.05).run(ctx)
+    slow = await OpenLoopLoadCheck(rate_rps=200, duration_sec=0.05, p99_warn_ms=0).run(ctx)
+
+    assert ok.status == CheckStatus.PASS and "10 requests at 200 req/s target" in ok.message
+    assert slow.status == CheckStatus.WARN and "warn threshold" in slow.message
+
+
+@pytest.mark.asyncio
+async def test_load_checks_warn_without_the_load_tool(ctx_factory):
+    ctx = ExecutionContext(project_path=".", command=["python"], runner_factory=ctx_factory)
+    ctx.artifacts.put(Artifact.TOOL_CATALOG, [{"name": "other"}])
+
+    res = await ConcurrencySweepCheck(max_concurrency=2).run(ctx)
+    open_loop = await OpenLoopLoadCheck(rate_rps=10).run(ctx)
+
+    assert res.status == CheckStatus.WARN and "No 'ping' tool" in res.message
+    assert open_loop.status == CheckStatus.WARN and "No 'ping' tool" in open_loop.message
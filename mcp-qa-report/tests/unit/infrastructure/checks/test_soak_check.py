@@ -0,0 +1,42 @@
+import os
+import pytest
+
+from application.execution_context import ExecutionContext
+from domain.models import CheckStatus
+from infrastructure.checks.soak_checks import SoakCheck
+from infrastructure.proc_stats import ProcSample, proc_available
+
+pytestmark = pytest.mark.skipif(not proc_available(), reason="needs /proc")
+
+
+def _ctx(ctx_factory, fake_session):
+    fake_session.runner.pid = os.getpid()
+    fake_session.client.request.return_value = {"jsonrpc": "2.0", "id": 1, "result": {"content": []}}
+    return ExecutionContext(project_path=".", command=["python"], runner_factory=ctx_factory)
+
+
+def _soak():
+    return SoakCheck(duration_sec=0.3, rate_rps=50, sample_interval_sec=0.02)
+
+
+@pytest.mark.asyncio
+async def test_soak_passes_for_steady_process(ctx_factory, fake_session):
+    res = await _soak().run(_ctx(ctx_factory, fake_session))
+
+    assert res.status == CheckStatus.PASS, res.message
+    assert "No sustained resource growth" in res.message and "RSS" in res.message
+
+
+@pytest.mark.asyncio
+async def test_soak_fails_on_sustained_fd_growth(ctx_factory, fake_session, monkeypatch):
+    calls = iter(range(10_000))
+
+    def leaking(pid):
+        n = next(calls)
+        return ProcSample(rss_bytes=50 * 2**20, fds=10 + n, threads=2, processes=1)
+
+    monkeypatch.setattr("infrastructure.checks.soak_checks.sample_tree", leaking)
+    res = await _soak().run(_ctx(ctx_factory, fake_session))
+
+    assert res.status == CheckStatus.FAIL
+    assert "FDs growing" in res.message and "fail ≥ 10" in res.message
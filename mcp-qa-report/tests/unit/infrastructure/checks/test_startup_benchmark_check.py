@@ -0,0 +1,76 @@
+import asyncio
+import json
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from application.execution_context import ExecutionContext
+from infrastructure.checks.process_checks import StartupLatencyBenchmarkCheck
+from infrastructure.framing import DEFAULT_MAX_MESSAGE_BYTES
+from domain.models import CheckStatus
+
+
+class _RawFactory:
+    """Yields sessions whose stdout already holds the given output."""
+    def __init__(self, output: bytes):
+        self.output = output
+        self.isolated = []
+
+    @asynccontextmanager
+    async def create(self, command, project_path, timeout_sec, isolated=False):
+        self.isolated.append(isolated)
+        session = AsyncMock()
+        session.max_message_bytes = DEFAULT_MAX_MESSAGE_BYTES
+        session.runner.transcript = None
+        session.runner.stderr_tail = "boom"
+        session.runner.stdin = MagicMock()
+        session.runner.stdin.drain = AsyncMock()
+        session.runner.stdout = asyncio.StreamReader()
+        session.runner.stdout.feed_data(self.output)
+        session.runner.stdout.feed_eof()
+        yield session
+
+
+def _ctx(factory):
+    return ExecutionContext(project_path=".", command=["python", "-m", "x"], runner_factory=factory)
+
+
+@pytest.mark.asyncio
+async def test_startup_benchmark_reports_percentiles_for_both_passes():
+    response = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}).encode() + b"\n"
+    factory = _RawFactory(b"log line\n" + response)
+
+    res = await StartupLatencyBenchmarkCheck(runs=3, parallelism=2).run(_ctx(factory))
+
+    assert res.status == CheckStatus.PASS
+    assert "sequential, 3 runs" in res.message and "parallel×2, 3 runs" in res.message
+    assert "p95" in res.message and "p99" in res.message
+    assert factory.isolated == [True] * 6
+
+
+@pytest.mark.asyncio
+async def test_startup_benchmark_grades_against_thresholds():
+    response = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}).encode() + b"\n"
+
+    res = await StartupLatencyBenchmarkCheck(runs=1, warn_ms=0).run(_ctx(_RawFactory(response)))
+
+    assert res.status == CheckStatus.WARN
+    assert "warn threshold" in res.message
+
+
+@pytest.mark.asyncio
+async def test_startup_benchmark_fails_when_server_exits_early():
+    res = await StartupLatencyBenchmarkCheck(runs=2).run(_ctx(_RawFactory(b"")))
+
+    assert res.status == CheckStatus.FAIL
+    assert "closed stdout" in res.message and "boom" in res.message
+
+
+@pytest.mark.asyncio
+async def test_startup_benchmark_reads_responses_past_the_stream_line_limit():
+    instructions = "x" * (256 * 1024)
+    response = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"instructions": instructions}}).encode() + b"\n"
+
+    res = await StartupLatencyBenchmarkCheck(runs=1).run(_ctx(_RawFactory(response)))
+
+    assert res.status == CheckStatus.PASS, res.message
@@ -9,7 +9,7 @@ async def test_tool_description_quality_warns_on_missing_desc(ctx_factory):
     # Test scenario: Tool exists but description is empty or just whitespace
     async with ctx_factory.create(None, None, None) as session:
         session.client.initialize.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
-        session.client.call.return_value = {
+        session.client.request.return_value = {
             "jsonrpc": "2.0",
             "id": 10,
             "result": {"tools": [{"name": "t1", "inputSchema": {}, "description": "  "}]},
@@ -30,7 +30,7 @@ async def test_tool_description_quality_passes_when_all_have_desc(ctx_factory):
     # Test scenario: Tool has a valid, non-empty description
     async with ctx_factory.create(None, None, None) as session:
         session.client.initialize.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
-        session.client.call.return_value = {
+        session.client.request.return_value = {
             "jsonrpc": "2.0",
             "id": 10,
             "result": {"tools": [{"name": "t1", "inputSchema": {}, "description": "Nice description"}]},
@@ -42,4 +42,15 @@ async def test_tool_description_quality_passes_when_all_have_desc(ctx_factory):
         runner_factory=ctx_factory,
     )
     res = await ToolDescriptionQualityCheck().run(ctx)
-    assert res.status == CheckStatus.PASS
\ No newline at end of file
+    assert res.status == CheckStatus.PASS
+
+@pytest.mark.asyncio
+async def test_tool_description_quality_uses_catalog_artifact_without_rpc(ctx_factory, fake_session):
+    from domain.models import Artifact
+
+    ctx = ExecutionContext(project_path=".", command=["python", "-m", "x"], runner_factory=ctx_factory)
+    ctx.artifacts.put(Artifact.TOOL_CATALOG, [{"name": "t1", "inputSchema": {}, "description": "Nice description"}])
+
+    res = await ToolDescriptionQualityCheck().run(ctx)
+    assert res.status == CheckStatus.PASS
+    fake_session.client.request.assert_not_called()
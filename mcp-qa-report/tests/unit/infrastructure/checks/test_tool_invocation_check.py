@@ -7,7 +7,7 @@ from domain.models import CheckStatus
 async def test_invocation_warns_when_no_ping(ctx_factory, fake_session):
     # Setup: Server supports tools but specifically lacks the 'ping' health check tool
     fake_session.client.initialize.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
-    fake_session.client.call.side_effect = [
+    fake_session.client.request.side_effect = [
         {"jsonrpc": "2.0", "id": 20, "result": {"tools": [{"name": "qa_report", "inputSchema": {}, "description": "x"}]}},
         None # No second call expected
     ]
@@ -22,7 +22,7 @@ async def test_invocation_warns_when_no_ping(ctx_factory, fake_session):
 async def test_invocation_passes_when_ping_exists_and_call_ok(ctx_factory, fake_session):
     # Setup: Server provides 'ping' tool and it responds with 'ok' when called
     fake_session.client.initialize.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
-    fake_session.client.call.side_effect = [
+    fake_session.client.request.side_effect = [
         {"jsonrpc": "2.0", "id": 20, "result": {"tools": [{"name": "ping", "inputSchema": {}, "description": "Health check"}]}},
         {"jsonrpc": "2.0", "id": 30, "result": {"content": [{"type": "text", "text": "ok"}]}},
     ]
@@ -9,7 +9,7 @@ async def test_tools_registration_fails_on_invalid_schema(ctx_factory):
     # Setup: Mock a session that returns a tool with a missing 'inputSchema'
     async with ctx_factory.create(None, None, None) as session:
         session.client.initialize.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
-        session.client.call.return_value = {
+        session.client.request.return_value = {
             "jsonrpc": "2.0", 
             "id": 2, 
             "result": {"tools": [{"name": "x"}]} # Missing inputSchema field
@@ -29,7 +29,7 @@ async def test_tools_registration_passes_on_valid_tools(ctx_factory):
     # Setup: Mock a session that returns a valid tool definition
     async with ctx_factory.create(None, None, None) as session:
         session.client.initialize.return_value = {"jsonrpc": "2.0", "id": 1, "result": {}}
-        session.client.call.return_value = {
+        session.client.request.return_value = {
             "jsonrpc": "2.0",
             "id": 2,
             "result": {"tools": [{"name": "t1", "inputSchema": {}, "description": "good enough"}]},
@@ -1,5 +1,5 @@
 from pydoc import text
-from domain.models import CheckResult, CheckStatus
+from domain.models import CheckResult, CheckStatus, CheckTiming, ResourceUsage
 from infrastructure.reporters.text_reporter import TextReporter
 
 
@@ -30,3 +30,51 @@ def test_text_reporter_renders_emojis():
     text = rep.render(results)
     assert "✅" in text
 
+
+
+def test_text_reporter_counts_skipped():
+    results = [CheckResult("a", CheckStatus.FAIL, "no"), CheckResult("b", CheckStatus.SKIP, "Skipped")]
+    rep = TextReporter()
+    assert "1 failed, 1 skipped" in rep.render(results)
+    assert rep.to_json_obj(results)["summary"]["skipped"] == 1
+
+
+def test_text_reporter_renders_timing_and_slowest_phases():
+    slow = CheckTiming(wall_ms=900, spawn_ms=700)
+    slow.record_rpc("initialize", 150)
+    fast = CheckTiming(wall_ms=20)
+    fast.record_rpc("tools/list", 12)
+    results = [CheckResult("startup", CheckStatus.PASS, "ok", slow), CheckResult("tools", CheckStatus.PASS, "ok", fast)]
+    rep = TextReporter()
+
+    rendered = rep.render(results)
+    assert "⏱ 900 ms — spawn 700 ms, initialize 150 ms" in rendered
+    assert "Slowest phases: startup: spawn 700 ms; startup: initialize 150 ms; tools: tools/list 12 ms" in rendered
+
+    obj = rep.to_json_obj(results)
+    assert obj["results"][0]["timing"]["initialize_ms"] == 150
+    assert obj["results"][1]["timing"]["rpc_ms"]["tools/list"]["count"] == 1
+    assert obj["summary"]["slowest_phases"][0] == {"check": "startup", "phase": "spawn", "ms": 700}
+
+
+def test_text_reporter_renders_resources_and_heaviest_servers():
+    heavy = ResourceUsage(cpu_user_sec=1.5, cpu_system_sec=0.5, peak_rss_bytes=80 * 2**20,
+                          voluntary_switches=90, involuntary_switches=10, read_bytes=2048, write_bytes=512)
+    light = ResourceUsage(cpu_user_sec=0.1, peak_rss_bytes=30 * 2**20, shared=True)
+    results = [
+        CheckResult("tools", CheckStatus.PASS, "ok", resources=light),
+        CheckResult("load", CheckStatus.PASS, "ok", resources=heavy),
+        CheckResult("quality", CheckStatus.PASS, "ok"),
+    ]
+    rep = TextReporter()
+
+    rendered = rep.render(results)
+    assert ("⚙ cpu 2.00 s (user 1.50, sys 0.50), peak RSS 80.0 MB, 100 ctx switches (10 involuntary), "
+            "I/O 2.0 KB read / 512 B written") in rendered
+    assert "(shared server)" in rendered
+    assert "Heaviest servers: load: cpu 2.00 s, peak RSS 80.0 MB; tools: cpu 0.10 s, peak RSS 30.0 MB" in rendered
+
+    obj = rep.to_json_obj(results)
+    assert obj["results"][1]["resources"]["peak_rss_bytes"] == 80 * 2**20
+    assert "resources" not in obj["results"][2]
+    assert [h["check"] for h in obj["summary"]["heaviest_servers"]] == ["load", "tools"]
@@ -64,4 +64,44 @@ def test_detect_from_package_json_start(tmp_path: Path):
 
 
 def test_detect_none_when_no_configs(tmp_path: Path):
-    assert detect_mcp_command(str(tmp_path)) is None
\ No newline at end of file
+    assert detect_mcp_command(str(tmp_path)) is None
+
+def test_detect_is_cached_until_config_changes(tmp_path: Path, monkeypatch):
+    from infrastructure import detect_mcp as mod
+
+    root = tmp_path
+    cfg = {"servers": {"s1": {"type": "stdio", "command": "node", "args": ["a.js"]}}}
+    (root / "mcp.json").write_text(json.dumps(cfg), encoding="utf-8")
+
+    calls = []
+    real = mod._detect_uncached
+    monkeypatch.setattr(mod, "_detect_uncached", lambda r: calls.append(r) or real(r))
+
+    assert detect_mcp_command(str(root)) == ["node", "a.js"]
+    assert detect_mcp_command(str(root)) == ["node", "a.js"]
+    assert len(calls) == 1
+
+    cfg["servers"]["s1"]["args"] = ["server.js"]
+    (root / "mcp.json").write_text(json.dumps(cfg), encoding="utf-8")
+    assert detect_mcp_command(str(root)) == ["node", "server.js"]
+    assert len(calls) == 2
+
+
+def test_detect_cache_survives_concurrent_eviction(tmp_path: Path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from infrastructure import detect_mcp as mod
+
+    monkeypatch.setattr(mod, "_CACHE_MAX_ENTRIES", 4)
+    monkeypatch.setattr(mod, "_cache", {})
+    roots = []
+    for i in range(64):
+        root = tmp_path / f"p{i}"
+        root.mkdir()
+        (root / "package.json").write_text(json.dumps({"scripts": {"start": "node s.js"}}), encoding="utf-8")
+        roots.append(str(root))
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(detect_mcp_command, roots * 4))
+
+    assert all(r == ["npm", "run", "start"] for r in results)
+    assert len(mod._cache) <= 4
@@ -0,0 +1,59 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.forked_runner import ForkedRunnerFactory, ForkedServerRunner, fork_available, fork_target
+
+pytestmark = pytest.mark.skipif(not fork_available(), reason="needs os.fork")
+
+SERVER = '''
+import json, os, sys
+for line in sys.stdin:
+    msg = json.loads(line)
+    if msg.get("method") == "initialize":
+        print("server up", file=sys.stderr)
+        result = {"cwd": os.getcwd(), "argv": sys.argv[1:], "ours_loaded": "infrastructure" in sys.modules}
+        print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": result}), flush=True)
+'''
+
+
+def test_fork_target_accepts_only_our_interpreter_running_a_module_or_script():
+    env = {"PATH": str(Path(sys.executable).parent)}
+    assert fork_target([sys.executable, "-u", "-m", "pkg.server", "--x"], env).module == "pkg.server"
+    assert fork_target([Path(sys.executable).name, "server.py"], env).script == "server.py"
+    assert fork_target([sys.executable, "-c", "print(1)"], env) is None
+    assert fork_target(["node", "server.js"], env) is None
+
+
+@pytest.mark.asyncio
+async def test_forked_runner_serves_jsonrpc_from_a_clean_child(tmp_path: Path):
+    (tmp_path / "server.py").write_text(SERVER, encoding="utf-8")
+    factory = ForkedRunnerFactory(preload=())
+
+    async with factory.create([sys.executable, "server.py", "--flag"], str(tmp_path), timeout_sec=5) as s:
+        assert isinstance(s.runner, ForkedServerRunner)
+        init = await s.client.initialize()
+        pid = s.runner.pid
+        assert s.runner.is_running
+
+    assert init["result"] == {"cwd": str(tmp_path), "argv": ["--flag"], "ours_loaded": False}
+    assert "server up" in s.runner.stderr_tail
+    # Reaped with wait4: exact totals for the forked child
+    assert s.runner.usage.peak_rss_bytes > 0
+    with pytest.raises(ChildProcessError):
+        os.waitpid(pid, 0)
+
+
+@pytest.mark.asyncio
+async def test_later_fork_does_not_hold_an_earlier_servers_stdin(tmp_path: Path):
+    (tmp_path / "server.py").write_text("import sys\nsys.stdin.read()\n", encoding="utf-8")
+    factory = ForkedRunnerFactory(preload=())
+
+    async with factory.create([sys.executable, "server.py"], str(tmp_path), timeout_sec=5) as first:
+        async with factory.create([sys.executable, "server.py"], str(tmp_path), timeout_sec=5):
+            first.runner.stdin.close()
+            # Only EOF ends the first server: a leaked write end would keep it reading
+            assert await first.runner._wait_proc(2.0)
+            assert first.runner._returncode_now() == 0
@@ -0,0 +1,35 @@
+import asyncio
+import pytest
+
+from infrastructure.errors import JsonRpcMessageTooLargeError
+from infrastructure.framing import NdjsonFramer
+
+
+async def _frames(framer: NdjsonFramer) -> list[bytes]:
+    out = []
+    while (frame := await framer.next_frame()) is not None:
+        out.append(frame.tobytes())
+    return out
+
+
+@pytest.mark.asyncio
+async def test_framer_splits_chunks_skips_blanks_and_keeps_unterminated_tail():
+    reader = asyncio.StreamReader()
+    for chunk in (b'{"a":', b' 1}\r\n\n  \n{"b": 2}\nNOISE', b" TAIL"):
+        reader.feed_data(chunk)
+    reader.feed_eof()
+
+    framer = NdjsonFramer(reader, chunk_size=4)
+
+    assert await _frames(framer) == [b'{"a": 1}', b'{"b": 2}', b"NOISE TAIL"]
+
+
+@pytest.mark.asyncio
+async def test_framer_rejects_messages_over_the_limit():
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"short\n" + b"x" * 100)
+    framer = NdjsonFramer(reader, chunk_size=8, max_message_bytes=32)
+
+    assert (await framer.next_frame()).tobytes() == b"short"
+    with pytest.raises(JsonRpcMessageTooLargeError):
+        await framer.next_frame()
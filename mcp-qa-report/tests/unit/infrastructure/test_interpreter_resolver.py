@@ -0,0 +1,52 @@
+import pytest
+from pathlib import Path
+
+from infrastructure.interpreter_resolver import InterpreterResolver, ResolvedInterpreter
+
+
+def _resolver_with_probe(python: str):
+    resolver = InterpreterResolver()
+    calls = []
+
+    async def fake_probe(root):
+        calls.append(root)
+        return ResolvedInterpreter(python=python, env={"VIRTUAL_ENV": "/venv"})
+
+    resolver._probe = fake_probe
+    return resolver, calls
+
+
+@pytest.mark.asyncio
+async def test_rewrite_replaces_uv_run_and_caches_per_project(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n", encoding="utf-8")
+    python = str(tmp_path / "python")
+    Path(python).write_text("", encoding="utf-8")
+    resolver, calls = _resolver_with_probe(python)
+
+    cmd, env = await resolver.rewrite(["uv", "run", "python", "-m", "srv"], str(tmp_path))
+    again, _ = await resolver.rewrite(["uv", "run", "python", "-m", "srv"], str(tmp_path))
+
+    assert cmd == again == [python, "-m", "srv"]
+    assert env == {"VIRTUAL_ENV": "/venv"}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_rewrite_reprobes_when_lockfile_changes(tmp_path: Path):
+    python = str(tmp_path / "python")
+    Path(python).write_text("", encoding="utf-8")
+    resolver, calls = _resolver_with_probe(python)
+
+    await resolver.rewrite(["uv", "run", "python"], str(tmp_path))
+    (tmp_path / "uv.lock").write_text("version = 1\n", encoding="utf-8")
+    await resolver.rewrite(["uv", "run", "python"], str(tmp_path))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_rewrite_leaves_other_commands_untouched(tmp_path: Path):
+    resolver, calls = _resolver_with_probe("/nope")
+    cmd, env = await resolver.rewrite(["npm", "run", "start"], str(tmp_path))
+    assert cmd == ["npm", "run", "start"] and env is None
+    assert calls == []
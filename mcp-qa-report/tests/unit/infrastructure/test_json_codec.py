@@ -0,0 +1,31 @@
+import pytest
+
+from infrastructure import json_codec
+from infrastructure.json_codec import StdlibCodec, available_codecs, get_codec
+
+MESSAGE = {"jsonrpc": "2.0", "id": 7, "result": {"tools": [{"name": "ping", "description": "héllo ✓"}]}}
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+def test_codecs_round_trip_bytes_and_memoryviews(codec):
+    raw = codec.dumps(MESSAGE)
+    assert isinstance(raw, bytes)
+    assert codec.loads(raw) == MESSAGE
+    assert codec.loads(memoryview(bytearray(b"  " + raw))[2:]) == MESSAGE
+    assert codec.loads(StdlibCodec().dumps(MESSAGE)) == MESSAGE
+    assert "\n  " in codec.dumps_pretty(MESSAGE)
+
+    with pytest.raises(ValueError):
+        codec.loads(b"NOISE")
+    # Beyond 64-bit: native encoders defer to the stdlib
+    assert codec.loads(codec.dumps({"n": 2**70}))["n"] == 2**70
+
+
+def test_get_codec_honours_pin_and_falls_back_when_unavailable(monkeypatch):
+    monkeypatch.setattr(json_codec, "_codec", None)
+    monkeypatch.setenv("QA_JSON_CODEC", "json")
+    assert get_codec().name == "json"
+
+    monkeypatch.setattr(json_codec, "_codec", None)
+    monkeypatch.setenv("QA_JSON_CODEC", "no-such-codec")
+    assert get_codec().name == "json"
@@ -1,4 +1,5 @@
 import json
+import asyncio
 from sys import stdin
 import pytest
 from unittest.mock import AsyncMock, MagicMock
@@ -7,6 +8,30 @@ from infrastructure.jsonrpc_client import JsonRpcClient
 from infrastructure.errors import JsonRpcTimeoutError, JsonRpcProtocolError
 
 
+def _reader(*chunks: bytes, eof: bool = True) -> asyncio.StreamReader:
+    """Real StreamReader pre-fed with server output."""
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+def _writer() -> AsyncMock:
+    """Mocked server stdin; stdin.write records every encoded request."""
+    writer = AsyncMock()
+    writer.write = MagicMock()
+    writer.close = MagicMock()
+    return writer
+
+
+def _client(stdout: asyncio.StreamReader, **kw) -> JsonRpcClient:
+    kw.setdefault("stdin", _writer())
+    kw.setdefault("timeout_sec", 1)
+    return JsonRpcClient(stdout=stdout, **kw)
+
+
 class ExplodingStreamWriter:
     """Simulates a stream writer that fails during write operations."""
     def write(self, _): # Removed 'async'
@@ -25,10 +50,10 @@ class ExplodingStreamWriter:
 @pytest.mark.asyncio
 async def test_initialize_success_reads_matching_id():
     # Setup: Return a valid JSON-RPC response with matching ID 1
-    stdout = AsyncMock()
-    stdout.readline = AsyncMock(side_effect=[
-        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}).encode("utf-8") + b"\n"
-    ])
+    stdout = _reader(
+        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}).encode("utf-8") + b"\n",
+        eof=False,
+    )
     stdin = AsyncMock()
     stdin.write = MagicMock()  
     stdin.close = MagicMock() 
@@ -47,10 +72,8 @@ async def test_initialize_collects_noise_for_non_json_lines():
         b"HELLO THERE\n",
         json.dumps({"jsonrpc": "2.0", "method": "notifications/message", "params": {"x": 1}}).encode("utf-8") + b"\n",
         json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}).encode("utf-8") + b"\n",
-        b"",
     ]
-    stdout = AsyncMock()
-    stdout.readline = AsyncMock(side_effect=lines)
+    stdout = _reader(*lines)
     stdin = AsyncMock()
     stdin.write = MagicMock()  
     stdin.close = MagicMock() 
@@ -69,10 +92,8 @@ async def test_call_ignores_other_ids_and_waits_for_expected():
     lines = [
         json.dumps({"jsonrpc": "2.0", "id": 999, "result": {"no": "this"}}).encode("utf-8") + b"\n",
         json.dumps({"jsonrpc": "2.0", "id": 20, "result": {"tools": []}}).encode("utf-8") + b"\n",
-        b"",
     ]
-    stdout = AsyncMock()
-    stdout.readline = AsyncMock(side_effect=lines)
+    stdout = _reader(*lines)
     stdin = AsyncMock()
     stdin.write = MagicMock()  
     stdin.close = MagicMock()
@@ -87,8 +108,7 @@ async def test_call_ignores_other_ids_and_waits_for_expected():
 @pytest.mark.asyncio
 async def test_timeout_raises():
     # Setup: Simulate a timeout by reaching EOF without receiving a response
-    stdout = AsyncMock()
-    stdout.readline = AsyncMock(side_effect=[b""])  # EOF immediately
+    stdout = _reader()  # EOF immediately
     stdin = AsyncMock()
     stdin.write = MagicMock()  
     stdin.close = MagicMock()
@@ -102,8 +122,8 @@ async def test_timeout_raises():
 
 @pytest.mark.asyncio
 async def test_protocol_error_on_write_failure():
-    stdout = AsyncMock()
-    # No need to mock readline here, the crash happens on write
+    stdout = _reader(eof=False)
+    # Nothing to read here, the crash happens on write
     
     stdin = ExplodingStreamWriter()
     c = JsonRpcClient(stdin=stdin, stdout=stdout, timeout_sec=0.2)
@@ -113,4 +133,109 @@ async def test_protocol_error_on_write_failure():
         with pytest.raises(JsonRpcProtocolError):
             await c.initialize()
     finally:
-        await c.close()
\ No newline at end of file
+        await c.close()
+
+@pytest.mark.asyncio
+async def test_initialize_is_memoized_for_shared_sessions():
+    stdout = _reader(
+        b"NOISE\n",
+        json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}).encode("utf-8") + b"\n",
+        eof=False,
+    )
+    writer = _writer()
+    c = _client(stdout, stdin=writer)
+    try:
+        first = await c.initialize()
+        again, noise = await c.initialize_collect_noise()
+        assert first == again
+        assert noise == ["NOISE"]
+        assert writer.write.call_count == 1
+    finally:
+        await c.close()
+
+
+def _line(obj: dict) -> bytes:
+    return json.dumps(obj).encode("utf-8") + b"\n"
+
+
+@pytest.mark.asyncio
+async def test_pipelined_calls_are_matched_out_of_order():
+    stdout = asyncio.StreamReader()
+    writer = _writer()
+    c = _client(stdout, stdin=writer)
+    try:
+        first = asyncio.create_task(c.call("tools/list", request_id=7))
+        second = asyncio.create_task(c.call("tools/list", request_id=8))
+        await asyncio.sleep(0)
+
+        # Responses arrive in reverse order; each must land on its own request
+        stdout.feed_data(_line({"jsonrpc": "2.0", "id": 8, "result": {"n": 8}}))
+        stdout.feed_data(_line({"jsonrpc": "2.0", "id": 7, "result": {"n": 7}}))
+
+        assert (await first)["result"]["n"] == 7
+        assert (await second)["result"]["n"] == 8
+        assert writer.write.call_count == 2
+    finally:
+        await c.close()
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_sent_to_subscribers():
+    stdout = asyncio.StreamReader()
+    c = _client(stdout)
+    seen = []
+    c.subscribe(seen.append)
+    try:
+        pending = asyncio.create_task(c.call("tools/list", request_id=3))
+        await asyncio.sleep(0)
+        stdout.feed_data(_line({"jsonrpc": "2.0", "method": "notifications/message", "params": {"x": 1}}))
+        stdout.feed_data(_line({"jsonrpc": "2.0", "id": 3, "result": {}}))
+        await pending
+
+        assert [m["method"] for m in seen] == ["notifications/message"]
+    finally:
+        await c.close()
+
+
+@pytest.mark.asyncio
+async def test_request_allocates_unique_monotonic_ids():
+    stdout = asyncio.StreamReader()
+    writer = _writer()
+    writer.write.side_effect = lambda raw: stdout.feed_data(
+        _line({"jsonrpc": "2.0", "id": json.loads(raw)["id"], "result": {}})
+    )
+    c = _client(stdout, stdin=writer)
+    try:
+        init = await c.initialize()
+        responses = await asyncio.gather(*(c.request("tools/list") for _ in range(5)))
+
+        ids = [init["id"]] + [r["id"] for r in responses]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+    finally:
+        await c.close()
+
+
+@pytest.mark.asyncio
+async def test_multi_megabyte_response_split_across_chunks():
+    big = {"jsonrpc": "2.0", "id": 4, "result": {"tools": [{"name": f"t{i}", "description": "x" * 200} for i in range(20000)]}}
+    raw = _line(big)
+    assert len(raw) > 4 * 1024 * 1024
+    stdout = _reader(raw[:1000], raw[1000:], eof=False)
+    c = _client(stdout, timeout_sec=5)
+    try:
+        resp = await c.call("tools/list", request_id=4)
+        assert len(resp["result"]["tools"]) == 20000
+    finally:
+        await c.close()
+
+
+@pytest.mark.asyncio
+async def test_oversized_message_fails_pending_request():
+    stdout = _reader(b'{"jsonrpc": "2.0", "id": 1, "result": "' + b"x" * 5000 + b'"}\n', eof=False)
+    c = _client(stdout, max_message_bytes=1024)
+    try:
+        with pytest.raises(JsonRpcProtocolError, match="exceeds 1024 bytes"):
+            await c.initialize()
+    finally:
+        await c.close()
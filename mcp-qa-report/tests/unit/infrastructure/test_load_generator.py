@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+
+from infrastructure.errors import JsonRpcTimeoutError
+from infrastructure.load_generator import run_open_loop
+
+
+class _SerialServer:
+    """Answers one request at a time, taking service_sec each."""
+    def __init__(self, service_sec: float, fail_every: int = 0):
+        self._lock = asyncio.Lock()
+        self._service = service_sec
+        self._fail_every = fail_every
+        self.calls = 0
+
+    async def request(self, method, params=None):
+        self.calls += 1
+        n = self.calls
+        async with self._lock:
+            await asyncio.sleep(self._service)
+        if self._fail_every and n % self._fail_every == 0:
+            raise JsonRpcTimeoutError("timeout")
+        return {"jsonrpc": "2.0", "id": n, "result": {}}
+
+
+@pytest.mark.asyncio
+async def test_open_loop_keeps_schedule_and_charges_queueing_delay():
+    server = _SerialServer(service_sec=0.04)
+
+    result = await run_open_loop(server, "tools/call", {}, rate_rps=50, duration_sec=0.2)
+
+    assert result.sent == server.calls == 10
+    assert result.completed == 10 and result.timeouts == 0
+    # Sent on schedule even though the server only manages 25 req/s...
+    assert result.max_send_lag_ms < 30
+    # ...so the last request waited behind the queue: ~400 ms done vs ~180 ms intended
+    assert result.histogram.value_at_percentile(99) >= 150
+
+
+@pytest.mark.asyncio
+async def test_open_loop_counts_timeouts_and_rejects_bad_rate():
+    result = await run_open_loop(_SerialServer(0.0, fail_every=2), "tools/call", {}, rate_rps=100, duration_sec=0.04)
+    assert (result.sent, result.completed, result.timeouts) == (4, 2, 2)
+    assert result.histogram.count == 4
+
+    with pytest.raises(ValueError):
+        await run_open_loop(_SerialServer(0.0), "tools/call", {}, rate_rps=0, duration_sec=1)
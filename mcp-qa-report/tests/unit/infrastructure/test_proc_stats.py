@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import pytest
+
+from infrastructure.proc_stats import UsageTracker, proc_available, process_tree, read_usage, sample_tree
+
+pytestmark = pytest.mark.skipif(not proc_available(), reason="needs /proc")
+
+
+def test_process_tree_includes_children_and_sample_sums_them():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        assert child.pid in process_tree(os.getpid())
+        sample = sample_tree(os.getpid())
+        assert sample.processes >= 2
+        assert sample.rss_bytes > 0 and sample.fds > 0 and sample.threads >= 2
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_sample_tree_of_missing_process_is_none():
+    assert sample_tree(2**22 + 12345) is None
+
+
+def test_usage_tracker_keeps_counters_of_members_that_exited():
+    burn = "import time\nend = time.process_time() + 0.2\nwhile time.process_time() < end: pass"
+    child = subprocess.Popen([sys.executable, "-c", burn + "\nprint('x' * 4096, flush=True)\ntime.sleep(5)"], stdout=subprocess.PIPE)
+    try:
+        child.stdout.readline()
+        tracker = UsageTracker(os.getpid())
+        tracker.sample()
+        ours = read_usage(os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+        child.stdout.close()
+    tracker.sample()  # the child is gone now; its last counters stay in the total
+
+    total = tracker.total()
+    assert total.cpu_sec >= ours.cpu_sec + 0.15
+    assert total.peak_rss_bytes > ours.peak_rss_bytes
+    assert total.write_bytes >= ours.write_bytes + 4096
@@ -1,8 +1,11 @@
+import asyncio
+import os
+import sys
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from infrastructure.process_runner import MCPProcessRunner
+from infrastructure.process_runner import MCPProcessRunner, OWN_PROCESS_GROUP
 
 
 class DummyAsyncProcess:
@@ -45,7 +48,8 @@ async def test_start_sets_pythonpath_when_src_exists(tmp_path: Path):
         proc.stderr.readline = AsyncMock(side_effect=[b"e1\n", b"e2\n", b"e3\n", b""])
         return proc
 
-    with patch("asyncio.create_subprocess_exec", side_effect=fake_create_subprocess_exec):
+    with patch("infrastructure.process_runner.spawn_process", side_effect=fake_create_subprocess_exec), \
+            patch("os.killpg", side_effect=ProcessLookupError):
         runner = MCPProcessRunner(command=["python", "-m", "x"], project_path=str(tmp_path))
         await runner.start()
 
@@ -64,10 +68,62 @@ async def test_stderr_tail_keeps_last_lines(tmp_path: Path):
         proc.stderr.readline = AsyncMock(side_effect=[b"e1\n", b"e2\n", b"e3\n", b""])
         return proc
 
-    with patch("asyncio.create_subprocess_exec", side_effect=fake_create_subprocess_exec):
+    with patch("infrastructure.process_runner.spawn_process", side_effect=fake_create_subprocess_exec), \
+            patch("os.killpg", side_effect=ProcessLookupError):
         runner = MCPProcessRunner(command=["python", "-m", "x"], project_path=str(tmp_path))
         await runner.start()
         await runner.terminate()
 
         tail = runner.stderr_tail
         assert "e1" in tail and "e3" in tail
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not OWN_PROCESS_GROUP or not os.path.isdir("/proc"), reason="needs POSIX process groups and /proc")
+async def test_terminate_kills_grandchildren_that_ignore_sigterm(tmp_path: Path):
+    # A wrapper (like `uv run`) whose real server ignores SIGTERM and outlives it
+    wrapper = (
+        "import subprocess, sys, time;"
+        "p = subprocess.Popen([sys.executable, '-c', "
+        "'import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print(1, flush=True); time.sleep(60)'],"
+        " stdout=subprocess.PIPE);"
+        "p.stdout.readline(); print(p.pid, flush=True); time.sleep(60)"
+    )
+    runner = MCPProcessRunner([sys.executable, "-c", wrapper], str(tmp_path), term_grace_sec=0.2, kill_grace_sec=1.0)
+    await runner.start()
+    grandchild = int(await asyncio.wait_for(runner.stdout.readline(), timeout=10))
+    assert _alive(grandchild)
+
+    started = asyncio.get_running_loop().time()
+    await runner.terminate()
+
+    assert asyncio.get_running_loop().time() - started < 1.5
+    for _ in range(100):
+        if not _alive(grandchild):
+            break
+        await asyncio.sleep(0.01)
+    assert not _alive(grandchild)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs wait4")
+async def test_usage_includes_shutdown_work_reaped_with_wait4(tmp_path: Path, monkeypatch):
+    # No /proc samples at all: the totals can only come from reaping the server
+    monkeypatch.setattr("infrastructure.process_runner.proc_available", lambda: False)
+    burn_on_eof = "import sys, time\nsys.stdin.read()\nend = time.process_time() + 0.3\nwhile time.process_time() < end: pass"
+    runner = MCPProcessRunner([sys.executable, "-c", burn_on_eof], str(tmp_path), term_grace_sec=5)
+    await runner.start()
+    runner.stdin.close()
+    assert await runner._wait_proc(10)
+    await runner.terminate()
+
+    assert runner.usage.cpu_sec >= 0.3
+    assert runner.usage.peak_rss_bytes > 0
@@ -0,0 +1,87 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from application.execution_context import ExecutionContext
+from domain.models import CheckStatus
+from infrastructure.checks.tool_checks import ToolsRegistrationCheck
+from infrastructure.replay import METHOD_NOT_FOUND, ReplayRunnerFactory, ReplayScript
+from infrastructure.runner_factory import RunnerFactory
+from infrastructure.transcript import TRANSCRIPT_DIR, TranscriptRecorder
+
+SERVER = """
+import json, sys
+print("starting up")
+for line in sys.stdin:
+    msg = json.loads(line)
+    tools = [{"name": "ping", "inputSchema": {"type": "object"}}]
+    result = {"tools": tools} if msg["method"] == "tools/list" else {"protocolVersion": "2024-11-05"}
+    print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": result}), flush=True)
+"""
+
+
+def _records(*exchanges):
+    """Transcript records for (method, params, result, latency_sec) exchanges sent in order."""
+    records, t = [{"t": 0.0, "event": "start"}], 0.0
+    for rid, (method, params, result, latency) in enumerate(exchanges, start=1):
+        records.append({"t": t, "dir": "send", "msg": {"jsonrpc": "2.0", "id": rid, "method": method, "params": params}})
+        t += latency
+        records.append({"t": t, "dir": "recv", "msg": {"jsonrpc": "2.0", "id": rid, "result": result}})
+    return records
+
+
+@pytest.mark.asyncio
+async def test_check_passes_against_a_replayed_recording(tmp_path: Path):
+    recorder = TranscriptRecorder()
+    try:
+        async with RunnerFactory(transcripts=recorder).create([sys.executable, "-c", SERVER], str(tmp_path), 5) as s:
+            await s.client.initialize()
+            await s.client.request("tools/list")
+        await asyncio.to_thread(recorder.flush)
+    finally:
+        recorder.close()
+    [path] = (tmp_path / TRANSCRIPT_DIR).iterdir()
+
+    factory = ReplayRunnerFactory.from_transcript(path)
+    ctx = ExecutionContext(project_path=str(tmp_path), command=["not-started"], runner_factory=factory)
+    result = await ToolsRegistrationCheck().run(ctx)
+
+    assert result.status == CheckStatus.PASS, result.message
+    async with factory.create(["not-started"], str(tmp_path), 5) as s:
+        _, noise = await s.client.initialize_collect_noise()
+    assert noise == ["starting up"]
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_by_method_and_params_in_recorded_order():
+    script = ReplayScript.from_records(_records(
+        ("tools/call", {"name": "a"}, {"n": 1}, 0.0),
+        ("tools/call", {"name": "a"}, {"n": 2}, 0.0),
+        ("tools/call", {"name": "b"}, {"n": 3}, 0.0),
+    ))
+    async with ReplayRunnerFactory(script).create(["x"], ".", 1) as s:
+        answers = [await s.client.request("tools/call", {"name": n}) for n in ("a", "b", "a", "a", "zzz")]
+        unknown = await s.client.request("resources/list")
+
+    assert [a["result"]["n"] for a in answers] == [1, 3, 2, 2, 3]
+    assert [a["id"] for a in answers] == [1, 2, 3, 4, 5]
+    assert unknown["error"]["code"] == METHOD_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_recorded_timing_delays_each_answer():
+    script = ReplayScript.from_records(_records(("tools/list", {}, {"tools": []}, 0.05)))
+
+    async with ReplayRunnerFactory(script).create(["x"], ".", 1) as s:
+        started = time.perf_counter()
+        await s.client.request("tools/list")
+        instant = time.perf_counter() - started
+    async with ReplayRunnerFactory(script, recorded_timing=True).create(["x"], ".", 1) as s:
+        started = time.perf_counter()
+        await s.client.request("tools/list")
+        delayed = time.perf_counter() - started
+
+    assert instant < 0.04 <= delayed
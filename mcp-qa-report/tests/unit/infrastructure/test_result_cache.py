@@ -0,0 +1,59 @@
+import os
+import pytest
+from pathlib import Path
+
+from domain.models import CheckResult, CheckStatus
+from infrastructure.result_cache import ResultCache
+
+
+class _Check:
+    name = "c"
+
+
+@pytest.mark.asyncio
+async def test_cache_roundtrip_and_invalidation_on_edit(tmp_path: Path):
+    (tmp_path / "server.py").write_text("print('x')", encoding="utf-8")
+    cache = ResultCache(str(tmp_path))
+    results = [CheckResult("c", CheckStatus.PASS, "ok")]
+
+    key = await cache.key(command=["python", "server.py"], checks=[_Check()], fail_fast=True)
+    assert await cache.get(key) is None
+    assert await cache.put(key, results)
+    assert await cache.get(key) == results
+
+    # Cache files under .qa-report do not count as project changes
+    assert await cache.key(command=["python", "server.py"], checks=[_Check()], fail_fast=True) == key
+
+    (tmp_path / "server.py").write_text("print('changed')", encoding="utf-8")
+    assert await cache.key(command=["python", "server.py"], checks=[_Check()], fail_fast=True) != key
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_failed_runs_and_evicts_least_recently_used(tmp_path: Path):
+    cache = ResultCache(str(tmp_path), max_entries=2, max_age_sec=float("inf"))
+    assert not await cache.put("failed", [CheckResult("c", CheckStatus.FAIL, "no")])
+    assert await cache.get("failed") is None
+
+    ok = [CheckResult("c", CheckStatus.PASS, "ok")]
+    for i, key in enumerate(("k1", "k2", "k3")):
+        await cache.put(key, ok)
+        os.utime(tmp_path / ".qa-report" / "cache" / f"{key}.json", (1_000_000 + i, 1_000_000 + i))
+
+    await cache.put("k4", ok)
+    remaining = sorted(p.stem for p in (tmp_path / ".qa-report" / "cache").glob("*.json"))
+    assert remaining == ["k3", "k4"]
+
+
+@pytest.mark.asyncio
+async def test_cache_key_covers_check_configuration_and_run_settings(tmp_path: Path):
+    from infrastructure.checks.load_checks import OpenLoopLoadCheck
+
+    cache = ResultCache(str(tmp_path))
+
+    async def key(check, settings=None):
+        return await cache.key(command=["python"], checks=[check], fail_fast=True, settings=settings)
+
+    base = await key(OpenLoopLoadCheck(rate_rps=50, p99_warn_ms=100))
+    assert await key(OpenLoopLoadCheck(rate_rps=50, p99_warn_ms=100)) == base
+    assert await key(OpenLoopLoadCheck(rate_rps=50, p99_warn_ms=500)) != base
+    assert await key(OpenLoopLoadCheck(rate_rps=50, p99_warn_ms=100), {"limits": "CPU 5 s"}) != base
@@ -0,0 +1,90 @@
+import asyncio
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.errors import JsonRpcTimeoutError
+from infrastructure.process_runner import MCPProcessRunner
+from infrastructure.rlimits import ResourceLimits, diagnose, limits_supported
+
+pytestmark = pytest.mark.skipif(not limits_supported(), reason="needs the resource module (POSIX)")
+
+
+def test_diagnose_names_only_limits_that_were_configured():
+    limits = ResourceLimits(cpu_sec=5, open_files=64)
+
+    assert diagnose(limits, -signal.SIGXCPU, "") == (("CPU time limit of 5 s exceeded",), ())
+    assert diagnose(limits, -signal.SIGKILL, "", cpu_sec=5.2, killed_by_us=True) == ((), ())
+    assert diagnose(limits, 1, "OSError: [Errno 24] Too many open files") == (("open files limit of 64 reached",), ())
+    # No address space cap configured: a MemoryError is the server's own problem
+    assert diagnose(limits, 1, "MemoryError") == ((), ())
+
+
+def test_diagnose_treats_stderr_alone_as_a_note():
+    limits = ResourceLimits(open_files=64, processes=32)
+    stderr = "EMFILE, retrying\nResource temporarily unavailable"
+
+    for returncode, killed_by_us in ((None, False), (0, False), (-signal.SIGTERM, True)):
+        hits, notes = diagnose(limits, returncode, stderr, killed_by_us=killed_by_us)
+        assert hits == ()
+        assert notes == (
+            "stderr suggests the open files limit of 64 reached",
+            "stderr suggests the process limit of 32 reached (fork / thread creation failed)",
+        )
+
+
+def test_limits_never_raise_the_inherited_soft_limit(monkeypatch):
+    import resource
+
+    applied = {}
+    monkeypatch.setattr(resource, "getrlimit", lambda which: (50, 4096))
+    monkeypatch.setattr(resource, "setrlimit", lambda which, pair: applied.__setitem__(which, pair))
+
+    ResourceLimits(open_files=500, processes=20).apply()
+
+    assert applied[resource.RLIMIT_NOFILE] == (50, 500)
+    assert applied[resource.RLIMIT_NPROC] == (20, 20)
+
+async def _run_until_exit(runner: MCPProcessRunner) -> None:
+    await runner.start()
+    for _ in range(500):
+        if not runner.is_running:
+            break
+        await asyncio.sleep(0.01)
+    await runner.terminate()
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_open_files_limit_hit(tmp_path: Path):
+    code = "files = [open('x', 'w') for _ in range(200)]"
+    runner = MCPProcessRunner([sys.executable, "-c", code], str(tmp_path), limits=ResourceLimits(open_files=32))
+    await _run_until_exit(runner)
+
+    assert runner.usage.limits_hit == ("open files limit of 32 reached",)
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_cpu_limit_hit(tmp_path: Path):
+    runner = MCPProcessRunner([sys.executable, "-c", "while True: pass"], str(tmp_path), limits=ResourceLimits(cpu_sec=1))
+    await _run_until_exit(runner)
+
+    assert runner.usage.limits_hit == ("CPU time limit of 1 s exceeded",)
+
+
+@pytest.mark.asyncio
+async def test_shared_session_charges_the_limit_to_the_check_that_saw_the_server_die(tmp_path: Path):
+    from infrastructure.runner_factory import RunnerFactory, SharedSessionFactory
+    from infrastructure.timing import bind_usage
+
+    dies = "import sys; sys.stdin.readline(); print('MemoryError', file=sys.stderr); sys.exit(1)"
+    base = RunnerFactory(limits=ResourceLimits(address_space_bytes=2**40))
+    async with SharedSessionFactory(base) as factory:
+        with bind_usage() as usages:
+            async with factory.create([sys.executable, "-c", dies], str(tmp_path), timeout_sec=5) as s:
+                with pytest.raises(JsonRpcTimeoutError):
+                    await s.client.initialize()
+
+    assert usages[0].shared
+    assert usages[0].limits_hit == ("address space limit of 1048576 MB reached (allocation failed)",)
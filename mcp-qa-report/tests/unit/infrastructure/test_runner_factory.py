@@ -0,0 +1,99 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+from infrastructure.runner_factory import SharedSessionFactory
+
+
+class CountingFactory:
+    """Base factory stub that records how many sessions were started and closed."""
+    def __init__(self):
+        self.started = 0
+        self.closed = 0
+
+    @asynccontextmanager
+    async def create(self, command, project_path, timeout_sec, isolated=False):
+        self.started += 1
+        try:
+            yield MagicMock(name=f"session{self.started}")
+        finally:
+            self.closed += 1
+
+
+@pytest.mark.asyncio
+async def test_shared_factory_starts_server_once_per_run():
+    base = CountingFactory()
+    async with SharedSessionFactory(base) as factory:
+        async with factory.create(["python"], ".", 5) as s1:
+            pass
+        async with factory.create(["python"], ".", 5) as s2:
+            pass
+        assert s1 is s2
+        assert base.started == 1
+        assert base.closed == 0
+
+    assert base.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_factory_isolated_gets_fresh_process():
+    base = CountingFactory()
+    async with SharedSessionFactory(base) as factory:
+        async with factory.create(["python"], ".", 5) as shared:
+            pass
+        async with factory.create(["python"], ".", 5, isolated=True) as fresh:
+            assert fresh is not shared
+        assert base.started == 2
+        assert base.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_factory_caps_live_sessions():
+    import asyncio
+    from infrastructure.runner_factory import BoundedRunnerFactory
+
+    live = 0
+    peak = 0
+
+    class SlowFactory:
+        @asynccontextmanager
+        async def create(self, command, project_path, timeout_sec, isolated=False):
+            nonlocal live, peak
+            live += 1
+            peak = max(peak, live)
+            try:
+                yield MagicMock()
+            finally:
+                live -= 1
+
+    factory = BoundedRunnerFactory(SlowFactory(), max_live=2)
+
+    async def use():
+        async with factory.create(["python"], ".", 5):
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(use() for _ in range(6)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_factory_closes_sessions_concurrently():
+    import asyncio
+    import time
+
+    class SlowCloseFactory:
+        @asynccontextmanager
+        async def create(self, command, project_path, timeout_sec, isolated=False):
+            try:
+                yield MagicMock()
+            finally:
+                await asyncio.sleep(0.2)
+
+    factory = SharedSessionFactory(SlowCloseFactory())
+    for project in ("a", "b", "c"):
+        async with factory.create(["python"], project, 5):
+            pass
+
+    started = time.perf_counter()
+    await factory.aclose()
+    assert time.perf_counter() - started < 0.4
@@ -0,0 +1,36 @@
+import pytest
+
+from infrastructure.stats import LatencyHistogram, LatencySummary, linear_trend, percentile
+
+
+def test_percentile_interpolates_between_ranks():
+    s = [10.0, 20.0, 30.0, 40.0]
+    assert percentile(s, 0) == 10.0
+    assert percentile(s, 50) == 25.0
+    assert percentile(s, 100) == 40.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_latency_summary_of_unsorted_samples():
+    summary = LatencySummary.of([5, 1, 3, 2, 4])
+    assert (summary.count, summary.min, summary.p50, summary.max) == (5, 1, 3, 5)
+    assert 4 < summary.p95 <= summary.p99 <= 5
+
+
+def test_latency_histogram_percentiles_within_relative_error():
+    h = LatencyHistogram(significant_figures=2)
+    for ms in range(1, 10001):
+        h.record(ms / 10)  # 0.1 .. 1000 ms
+
+    assert h.count == 10000
+    assert h.value_at_percentile(50) == pytest.approx(500, rel=0.01)
+    assert h.value_at_percentile(99) == pytest.approx(990, rel=0.01)
+    assert h.value_at_percentile(100) == 1000
+    assert "p99.9" in h.describe()
+
+
+def test_linear_trend_slope_and_fit():
+    slope, r2 = linear_trend([0, 1, 2, 3], [1, 3, 5, 7])
+    assert slope == pytest.approx(2) and r2 == pytest.approx(1)
+    assert linear_trend([0, 1, 2, 3], [5, 5, 5, 5]) == (0.0, 0.0)
@@ -0,0 +1,75 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.jsonrpc_client import JsonRpcClient
+from infrastructure.runner_factory import RunnerFactory
+from infrastructure.transcript import TRANSCRIPT_DIR, TranscriptRecorder, read_transcript
+
+SERVER = """
+import json, sys
+print("booting", file=sys.stderr, flush=True)
+for line in sys.stdin:
+    msg = json.loads(line)
+    print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": {"echo": msg["method"]}}), flush=True)
+"""
+
+
+@pytest.mark.asyncio
+async def test_session_transcript_records_both_directions_stderr_and_exit(tmp_path: Path):
+    recorder = TranscriptRecorder()
+    try:
+        factory = RunnerFactory(transcripts=recorder)
+        async with factory.create([sys.executable, "-c", SERVER], str(tmp_path), timeout_sec=5) as s:
+            await s.client.initialize()
+            await s.client.request("tools/list")
+        await asyncio.to_thread(recorder.flush)
+    finally:
+        recorder.close()
+
+    [path] = (tmp_path / TRANSCRIPT_DIR).iterdir()
+    records = read_transcript(path)
+    assert records[0]["event"] == "start" and records[0]["command"][0] == sys.executable
+    assert records[-1]["event"] == "exit"
+    traffic = [(r["dir"], r["msg"].get("method") or r["msg"]["result"]["echo"]) for r in records if "msg" in r]
+    assert traffic == [("send", "initialize"), ("recv", "initialize"), ("send", "tools/list"), ("recv", "tools/list")]
+    assert {"dir": "stderr", "text": "booting"}.items() <= next(r for r in records if r.get("dir") == "stderr").items()
+    times = [r["t"] for r in records]
+    assert times == sorted(times)
+
+
+@pytest.mark.asyncio
+async def test_client_records_noise_as_text_and_messages_verbatim(tmp_path: Path):
+    recorder = TranscriptRecorder()
+    transcript = recorder.open_session(str(tmp_path), ["server"], pid=None)
+    stdout = asyncio.StreamReader()
+    stdout.feed_data(b'HELLO\n{"jsonrpc":"2.0","id":1,"result":{"big":123456789012345678901234567890}}\n')
+
+    class Sink:
+        def write(self, _):
+            pass
+
+        async def drain(self):
+            pass
+
+        def close(self):
+            pass
+
+        async def wait_closed(self):
+            pass
+
+    client = JsonRpcClient(stdin=Sink(), stdout=stdout, timeout_sec=1, transcript=transcript)
+    try:
+        await client.initialize()
+    finally:
+        await client.close()
+        transcript.close(None)
+        await asyncio.to_thread(recorder.flush)
+        recorder.close()
+
+    lines = transcript.path.read_bytes().splitlines()
+    assert b'"text":"HELLO"' in lines[2]
+    # Copied byte for byte: a 30-digit integer survives even with a 64-bit codec
+    assert lines[3].endswith(b'"msg":{"jsonrpc":"2.0","id":1,"result":{"big":123456789012345678901234567890}}}')
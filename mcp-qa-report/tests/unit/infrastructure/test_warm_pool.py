@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+from infrastructure.warm_pool import WarmPoolRunnerFactory
+
+
+class CountingFactory:
+    """Base factory stub producing fake sessions and tracking their lifecycle."""
+    def __init__(self):
+        self.sessions = []
+        self.closed = 0
+
+    @asynccontextmanager
+    async def create(self, command, project_path, timeout_sec, isolated=False):
+        session = AsyncMock()
+        session.runner.is_running = True
+        session.client.initialize_collect_noise.return_value = ({"result": {}}, [])
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            self.closed += 1
+
+
+async def _settle():
+    # Pool keys hash the project tree in a worker thread
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_pool_hands_out_prewarmed_sessions(tmp_path):
+    base = CountingFactory()
+    async with WarmPoolRunnerFactory(size=1, base=base) as pool:
+        async with pool.create(["python"], str(tmp_path), 5) as cold:
+            pass
+        await _settle()
+        assert pool.idle_count == 1
+        warm_session = base.sessions[1]
+        warm_session.client.initialize_collect_noise.assert_awaited()
+
+        async with pool.create(["python"], str(tmp_path), 5) as s:
+            assert s is warm_session
+        assert cold is not warm_session
+
+
+@pytest.mark.asyncio
+async def test_pool_isolated_bypasses_pool_and_reap_closes_idle(tmp_path):
+    base = CountingFactory()
+    pool = WarmPoolRunnerFactory(size=1, idle_ttl_sec=10, base=base)
+    async with pool.create(["python"], str(tmp_path), 5):
+        pass
+    await _settle()
+
+    async with pool.create(["python"], str(tmp_path), 5, isolated=True) as fresh:
+        assert fresh is base.sessions[-1]
+    assert pool.idle_count == 1
+
+    reaped = await pool.reap(now=float("inf"))
+    assert reaped == 1 and pool.idle_count == 0
+    await pool.aclose()
+    assert base.closed == len(base.sessions)
+
+
+@pytest.mark.asyncio
+async def test_pool_drain_discards_warm_servers_and_prewarm_replaces_them(tmp_path):
+    base = CountingFactory()
+    async with WarmPoolRunnerFactory(size=1, base=base) as pool:
+        pool.prewarm(["python"], str(tmp_path), 5)
+        await _settle()
+        stale = base.sessions[0]
+        assert pool.idle_count == 1
+
+        assert await pool.drain() == 1
+        assert pool.idle_count == 0 and base.closed == 1
+
+        pool.prewarm(["python"], str(tmp_path), 5)
+        await _settle()
+        async with pool.create(["python"], str(tmp_path), 5) as s:
+            assert s is not stale and s is base.sessions[1]
+
+
+@pytest.mark.asyncio
+async def test_pool_never_hands_out_a_server_started_before_the_project_changed(tmp_path):
+    source = tmp_path / "server.py"
+    source.write_text("v1", encoding="utf-8")
+    base = CountingFactory()
+    async with WarmPoolRunnerFactory(size=1, base=base) as pool:
+        pool.prewarm(["python"], str(tmp_path), 5)
+        await _settle()
+        stale = base.sessions[0]
+
+        source.write_text("v2 edited", encoding="utf-8")
+        async with pool.create(["python"], str(tmp_path), 5) as s:
+            assert s is base.sessions[1]
+            assert base.closed == 1 and pool.idle_count == 0
+
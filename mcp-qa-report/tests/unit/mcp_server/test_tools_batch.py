@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from application.batch_runner import ProjectReport
+from domain.models import CheckResult, CheckStatus
+
+
+class FakeMCP:
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, name: str, description: str | None = None):
+        def deco(fn):
+            self.tools[name] = fn
+            return fn
+        return deco
+
+
+class DummyBatch:
+    async def run(self, projects):
+        for p in projects:
+            status = CheckStatus.FAIL if p.endswith("b") else CheckStatus.PASS
+            yield ProjectReport(project_path=p, results=[CheckResult("x", status, "m")])
+
+
+@pytest.mark.asyncio
+async def test_qa_report_batch_streams_records_to_ndjson(tmp_path: Path, monkeypatch):
+    from mcp_server import tools as tools_mod
+
+    fake = FakeMCP()
+    tools_mod.register(fake)
+    monkeypatch.setattr(tools_mod, "build_batch_runner", lambda **kwargs: DummyBatch())
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    res = await fake.tools["qa_report_batch"](root=str(tmp_path), output_path="out/batch.ndjson")
+
+    assert "2 projects — 1 passed, 0 with warnings, 1 failed" in res
+    records = [json.loads(l) for l in (tmp_path / "out" / "batch.ndjson").read_text(encoding="utf-8").splitlines()]
+    assert sorted(Path(r["project"]).name for r in records) == ["a", "b"]
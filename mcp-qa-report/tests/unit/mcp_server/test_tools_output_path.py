@@ -17,8 +17,13 @@ class FakeMCP:
 
 
 class DummyRunner:
-    async def run(self, ctx):
-        return [CheckResult("x", CheckStatus.PASS, "ok")]
+    check_count = 1
+
+    async def run(self, ctx, on_result=None):
+        result = CheckResult("x", CheckStatus.PASS, "ok")
+        if on_result is not None:
+            await on_result(result)
+        return [result]
 
 
 class DummyReporter:
@@ -62,3 +67,44 @@ async def test_qa_report_writes_to_explicit_file(tmp_path: Path, monkeypatch):
     p = tmp_path / "out" / "custom.md"
     assert p.exists()
     assert p.read_text(encoding="utf-8") == "REPORT"
+
+
+@pytest.mark.asyncio
+async def test_qa_report_serves_unchanged_project_from_cache(tmp_path: Path, monkeypatch):
+    from mcp_server import tools as tools_mod
+
+    runs = []
+
+    class CountingRunner(DummyRunner):
+        async def run(self, ctx, on_result=None):
+            runs.append(ctx.project_path)
+            return await super().run(ctx, on_result)
+
+    fake = FakeMCP()
+    tools_mod.register(fake)
+    monkeypatch.setattr(tools_mod, "build_runner", lambda fail_fast: CountingRunner())
+
+    first = await fake.tools["qa_report"](project_path=str(tmp_path), command=["python", "x.py"])
+    second = await fake.tools["qa_report"](project_path=str(tmp_path), command=["python", "x.py"])
+    forced = await fake.tools["qa_report"](project_path=str(tmp_path), command=["python", "x.py"], force=True)
+
+    assert len(runs) == 2
+    assert "cached" not in first and "cached" in second and "cached" not in forced
+
+
+@pytest.mark.asyncio
+async def test_qa_report_streams_results_through_context(tmp_path: Path, monkeypatch):
+    from unittest.mock import AsyncMock
+    from mcp_server import tools as tools_mod
+
+    fake = FakeMCP()
+    tools_mod.register(fake)
+    monkeypatch.setattr(tools_mod, "build_runner", lambda fail_fast: DummyRunner())
+    monkeypatch.setattr(tools_mod, "build_result_cache", lambda project_path: None)
+    ctx = AsyncMock()
+
+    res = await fake.tools["qa_report"](project_path=str(tmp_path), command=["python", "x.py"], ctx=ctx)
+
+    ctx.log.assert_awaited_once_with("info", "[PASS] x: ok", logger_name="qa_report")
+    ctx.report_progress.assert_awaited_once_with(progress=1, total=1, message="[PASS] x: ok")
+    assert "Summary: 1 passed" in res